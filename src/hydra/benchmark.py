@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from .nodes.pipeline_benchmark import (
+    compare_with_benchmark_baseline,
+    get_scaling_exponents,
+    load_benchmark_baseline,
+    run_pipeline_benchmark,
+    save_benchmark_baseline,
+)
+from .nodes.spacy_model_registry import load_spacy_model
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="hydra-benchmark",
+        description="Benchmark graph construction over synthetic corpora",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 200, 400, 800, 1600],
+        help="Number of words in each synthetic paragraph",
+    )
+    parser.add_argument(
+        "--duplication-ratios",
+        type=float,
+        nargs="+",
+        default=[0.0, 0.5, 0.9],
+        help="Share of words drawn from a small set of repeated words",
+    )
+    parser.add_argument("--n-repeat", type=int, default=3)
+    parser.add_argument("-m", "--model", default="en_core_web_sm")
+    parser.add_argument("--baseline", help="Path to a baseline json to compare with")
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the measurements as the new baseline instead of comparing",
+    )
+    parser.add_argument("--time-tolerance", type=float, default=2.0)
+    parser.add_argument("--memory-tolerance", type=float, default=1.5)
+    parser.add_argument("--max-scaling-exponent", type=float, default=1.5)
+    parser.add_argument("--log-level", default="INFO")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+
+    logging.basicConfig(
+        level=args.log_level.upper(),
+        format="%(asctime)s %(name)s - %(levelname)s:%(message)s",
+        stream=sys.stderr,
+    )
+    logger = logging.getLogger(__name__)
+
+    nlp = load_spacy_model(name=args.model)
+
+    list_benchmark_result = run_pipeline_benchmark(
+        nlp=nlp,
+        logger=logger,
+        list_size=args.sizes,
+        list_duplication_ratio=args.duplication_ratios,
+        n_repeat=args.n_repeat,
+    )
+
+    for (function, duplication_ratio), exponent in get_scaling_exponents(
+        list_benchmark_result=list_benchmark_result
+    ).items():
+        logger.info(
+            f"{function} with duplication ratio {duplication_ratio} "
+            f"scales with size to the power of {exponent:.2f}"
+        )
+
+    if args.baseline is None:
+        return 0
+
+    path_baseline = Path(args.baseline)
+    if args.update_baseline:
+        save_benchmark_baseline(
+            list_benchmark_result=list_benchmark_result,
+            path_baseline=path_baseline,
+            nlp=nlp,
+        )
+        logger.info(f"Wrote benchmark baseline to {path_baseline}")
+        return 0
+
+    list_regression = compare_with_benchmark_baseline(
+        list_benchmark_result=list_benchmark_result,
+        list_baseline_result=load_benchmark_baseline(path_baseline=path_baseline),
+        time_tolerance=args.time_tolerance,
+        memory_tolerance=args.memory_tolerance,
+        max_scaling_exponent=args.max_scaling_exponent,
+    )
+    for regression in list_regression:
+        logger.error(f"Benchmark regression: {regression}")
+
+    return 1 if list_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
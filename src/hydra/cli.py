@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+from typing import List, Optional, TextIO
+
+from .nodes.corpus_streaming import CorpusFormatError, stream_corpus_to_para_graphs
+from .nodes.linguistic_graph_config import CorpusFormat, NetworkXGraphType
+from .nodes.linguistic_graph_edges import EdgeType
+from .nodes.linguistic_graph_nodes import NodeType
+from .nodes.linguistic_graph_schema import (
+    DICT_ETYPE_ENDPOINT_NTYPE,
+    LIST_SCHEMA_ETYPE,
+    LIST_SCHEMA_NTYPE,
+    GraphSchema,
+)
+from .nodes.pipeline_metrics import PipelineMetrics
+from .nodes.sent_graph_memo import SentGraphMemo
+from .nodes.spacy_length_batching import SpacyLengthBatcher
+from .nodes.spacy_model_registry import load_spacy_model
+from .nodes.spacy_parse_cache import SpacyParseCache
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="hydra", description="Stream a text corpus into paragraph graphs"
+    )
+    parser.add_argument("input", help="Path to the corpus, or - for stdin")
+    parser.add_argument(
+        "-o", "--output", default="-", help="Path to write graphs, or - for stdout"
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=[corpus_format.name for corpus_format in CorpusFormat],
+        default=CorpusFormat.lines.name,
+        help="Layout of paragraphs in the corpus",
+    )
+    parser.add_argument(
+        "--text-field", default="text", help="Field holding text in jsonl corpora"
+    )
+    parser.add_argument("-m", "--model", default="en_core_web_sm")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--n-process", type=int, default=1)
+    parser.add_argument(
+        "--flush-every",
+        type=int,
+        default=1024,
+        help="Number of graphs written between flushes of the output",
+    )
+    parser.add_argument(
+        "--max-batch-tokens",
+        type=int,
+        help="Batch texts of similar length up to this many padded tokens, "
+        "instead of batch size texts in arrival order",
+    )
+    parser.add_argument(
+        "--length-window",
+        type=int,
+        default=256,
+        help="Number of texts sorted by length at a time when batching by tokens",
+    )
+    parser.add_argument(
+        "--sent-memo-entries",
+        type=int,
+        help="Reuse the elements of up to this many recently seen sentences",
+    )
+    parser.add_argument("--vectorized", action="store_true")
+    parser.add_argument(
+        "--graph-type",
+        choices=[graph_type.name for graph_type in NetworkXGraphType],
+        default=NetworkXGraphType.digraph.name,
+    )
+    parser.add_argument(
+        "--node-types",
+        nargs="+",
+        choices=[ntype.name for ntype in LIST_SCHEMA_NTYPE],
+        default=[ntype.name for ntype in LIST_SCHEMA_NTYPE],
+        help="Node types to build, skipping spacy components only others need",
+    )
+    parser.add_argument(
+        "--edge-types",
+        nargs="*",
+        choices=[etype.name for etype in LIST_SCHEMA_ETYPE],
+        help="Edge types to build, defaulting to all between the built node types",
+    )
+    parser.add_argument(
+        "--parse-cache-dir", help="Directory caching spacy parses across runs"
+    )
+    parser.add_argument(
+        "--parse-cache-max-bytes",
+        type=int,
+        default=1 << 30,
+        help="Size budget of the parse cache before evicting old parses",
+    )
+    parser.add_argument(
+        "--metrics-output",
+        help="Path to write per-stage timings and counters as Prometheus text",
+    )
+    parser.add_argument(
+        "--track-allocations",
+        action="store_true",
+        help="Also record memory allocated by each stage, at a runtime cost",
+    )
+    parser.add_argument("--log-level", default="INFO")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=args.log_level.upper(),
+        format="%(asctime)s %(name)s - %(levelname)s:%(message)s",
+        stream=sys.stderr,
+    )
+    logger = logging.getLogger(__name__)
+
+    list_ntype = [NodeType[name] for name in args.node_types]
+    try:
+        schema = GraphSchema(
+            list_ntype=list_ntype,
+            list_etype=(
+                [
+                    etype
+                    for etype in LIST_SCHEMA_ETYPE
+                    if DICT_ETYPE_ENDPOINT_NTYPE[etype] <= set(list_ntype)
+                ]
+                if args.edge_types is None
+                else [EdgeType[name] for name in args.edge_types]
+            ),
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    nlp = load_spacy_model(name=args.model)
+
+    parse_cache = (
+        None
+        if args.parse_cache_dir is None
+        else SpacyParseCache(
+            path_cache_dir=Path(args.parse_cache_dir),
+            logger=logger,
+            max_bytes=args.parse_cache_max_bytes,
+        )
+    )
+
+    length_batcher = (
+        None
+        if args.max_batch_tokens is None
+        else SpacyLengthBatcher(
+            logger=logger,
+            max_batch_tokens=args.max_batch_tokens,
+            window_size=args.length_window,
+        )
+    )
+
+    sent_graph_memo = (
+        None
+        if args.sent_memo_entries is None
+        else SentGraphMemo(logger=logger, max_entries=args.sent_memo_entries)
+    )
+
+    metrics = (
+        None
+        if args.metrics_output is None
+        else PipelineMetrics(track_allocations=args.track_allocations)
+    )
+
+    with ExitStack() as stack:
+        f_corpus: TextIO = (
+            sys.stdin
+            if args.input == "-"
+            else stack.enter_context(open(args.input, encoding="utf-8"))
+        )
+        f_output: TextIO = (
+            sys.stdout
+            if args.output == "-"
+            else stack.enter_context(open(args.output, "w", encoding="utf-8"))
+        )
+        if metrics is not None:
+            stack.enter_context(metrics)
+
+        try:
+            stream_corpus_to_para_graphs(
+                f_corpus=f_corpus,
+                f_output=f_output,
+                nlp=nlp,
+                logger=logger,
+                corpus_format=CorpusFormat[args.format],
+                text_field=args.text_field,
+                batch_size=args.batch_size,
+                n_process=args.n_process,
+                flush_every=args.flush_every,
+                vectorized=args.vectorized,
+                graph_type=NetworkXGraphType[args.graph_type],
+                parse_cache=parse_cache,
+                metrics=metrics,
+                schema=schema,
+                length_batcher=length_batcher,
+                sent_graph_memo=sent_graph_memo,
+            )
+        except CorpusFormatError as e:
+            logger.error(str(e))
+            return 1
+
+    if metrics is not None:
+        Path(args.metrics_output).write_text(
+            metrics.to_prometheus_text(), encoding="utf-8"
+        )
+        logger.info(f"Pipeline metrics summary: {metrics.summary()}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,17 @@
 import logging
 import logging.config
+from functools import lru_cache
 from logging import Logger
 
 
+@lru_cache(maxsize=None)
+def _configure_logging(path_config: str) -> None:
+    # Parse the config file once per process rather than on every call
+    logging.config.fileConfig(path_config, disable_existing_loggers=False)
+
+
 def get_base_logger() -> Logger:
-    logging.config.fileConfig("logging.ini", disable_existing_loggers=False)
+    _configure_logging(path_config="logging.ini")
     logger = logging.getLogger(__name__)
 
     return logger
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from logging import Logger
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
+
+from networkx import DiGraph
+
+from .linguistic_graph_arrays import DICT_NTYPE_CODE
+from .linguistic_graph_builder import ParaGraphBuilder, ReferenceRecord
+from .linguistic_graph_construction import (
+    add_spacy_doc_to_graph_builder,
+    pipe_spacy_docs,
+)
+from .linguistic_graph_edges import BaseEdgeFeats, EdgeTuple, EdgeType
+from .linguistic_graph_index import GraphIndex
+from .linguistic_graph_nodes import BaseNodeFeats, NodeTuple, NodeType
+from .linguistic_graph_schema import (
+    FULL_GRAPH_SCHEMA,
+    GraphSchema,
+    get_spacy_pipes_to_disable,
+)
+from .linguistic_graph_vocab import GraphVocab
+from .pipeline_metrics import NULL_PIPELINE_METRICS, PipelineMetrics
+from .spacy_length_batching import SpacyLengthBatcher
+from .spacy_parse_cache import SpacyParseCache
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens import Doc
+
+
+class CorpusGraph:
+    # One graph over many paragraphs, where each appended paragraph adds a
+    # paragraph node linked from its sentence nodes and shares the token, ner
+    # and universal pos nodes already in the graph. When references are tracked,
+    # a paragraph's contribution can be removed again
+    def __init__(  # type: ignore[no-any-unimported]
+        self,
+        logger: Logger,
+        vectorized: bool = False,
+        metrics: Optional[PipelineMetrics] = None,
+        schema: Optional[GraphSchema] = None,
+        vocab: Optional[GraphVocab] = None,
+        nx_g: Optional[DiGraph] = None,
+        track_references: bool = False,
+        build_index: bool = False,
+    ) -> None:
+        self.logger = logger
+        self.vectorized = vectorized
+        self.metrics: PipelineMetrics = (
+            NULL_PIPELINE_METRICS if metrics is None else metrics
+        )
+        self.schema: GraphSchema = FULL_GRAPH_SCHEMA if schema is None else schema
+        self.vocab = vocab
+
+        # Resume from a previously built corpus graph when one is given
+        self.para_graph_builder = (
+            ParaGraphBuilder(
+                logger=logger,
+                metrics=self.metrics,
+                vocab=vocab,
+                track_references=track_references,
+                build_index=build_index,
+            )
+            if nx_g is None
+            else ParaGraphBuilder.from_graph(
+                nx_g=nx_g,
+                logger=logger,
+                metrics=self.metrics,
+                vocab=vocab,
+                track_references=track_references,
+                build_index=build_index,
+            )
+        )
+
+        para_ntype_value: Any = (
+            NodeType.paragraph.value
+            if vocab is None
+            else DICT_NTYPE_CODE[NodeType.paragraph]
+        )
+        # Paragraph node ids in order of addition, with the references taken
+        # while adding each paragraph when they are tracked
+        self.mapping_para_nid_to_record: Dict[int, Optional[ReferenceRecord]] = {
+            nid: None
+            for nid, ntype_value in self.graph.nodes.data("ntype")
+            if ntype_value == para_ntype_value
+        }
+
+    def __len__(self) -> int:
+        return len(self.mapping_para_nid_to_record)
+
+    @property
+    def list_para_nid(self) -> List[int]:
+        return list(self.mapping_para_nid_to_record)
+
+    @property
+    def index(self) -> Optional[GraphIndex]:
+        return self.para_graph_builder.index
+
+    @property
+    def graph(self) -> DiGraph:  # type: ignore[no-any-unimported]
+        return self.para_graph_builder.graph
+
+    def add_doc(self, doc: Doc) -> int:
+        para_graph_builder = self.para_graph_builder
+
+        # Add the paragraph node first, as it is never contracted
+        para_node_tuple = NodeTuple(
+            node_id=0,
+            node_feats=BaseNodeFeats(ntype=NodeType.paragraph, text=doc.text),
+        )
+        para_nid = para_graph_builder.add_elements(
+            list_node_tuple=[para_node_tuple.to_tuple()], list_edge_tuple=[]
+        )[0]
+
+        # Only the new doc's elements are visited, as nodes to contract are
+        # looked up in the builder's interning table
+        list_sent_nid = add_spacy_doc_to_graph_builder(
+            para_graph_builder=para_graph_builder,
+            doc=doc,
+            logger=self.logger,
+            vectorized=self.vectorized,
+            schema=self.schema,
+        )
+
+        sent_to_para_feats = BaseEdgeFeats(etype=EdgeType.sent_to_para, text="")
+        para_graph_builder.add_edges(
+            list_edge_tuple=[
+                EdgeTuple(
+                    src_id=sent_nid, dst_id=para_nid, edge_feats=sent_to_para_feats
+                ).to_tuple()
+                for sent_nid in list_sent_nid
+            ]
+        )
+
+        self.mapping_para_nid_to_record[para_nid] = (
+            para_graph_builder.take_references()
+            if para_graph_builder.track_references
+            else None
+        )
+        self.metrics.count("para_graphs")
+
+        self.logger.debug(
+            f"Appended paragraph node {para_nid} with {len(list_sent_nid)} sentences "
+            f"to a corpus graph of {len(self.graph)} nodes"
+        )
+
+        return para_nid
+
+    def remove_document(self, para_nid: int) -> None:
+        if para_nid not in self.mapping_para_nid_to_record:
+            raise KeyError(f"{para_nid} is not a paragraph node of the corpus graph")
+        reference_record = self.mapping_para_nid_to_record[para_nid]
+        if reference_record is None:
+            raise ValueError(
+                f"References of paragraph node {para_nid} were not tracked "
+                "when it was added, so it cannot be removed"
+            )
+
+        # Visit only the paragraph's own references, dropping nodes and edges
+        # no other paragraph references
+        n_node_removed, n_edge_removed = self.para_graph_builder.remove_references(
+            reference_record=reference_record
+        )
+        del self.mapping_para_nid_to_record[para_nid]
+
+        self.logger.info(
+            f"Removed paragraph node {para_nid} with {n_node_removed} nodes "
+            f"and {n_edge_removed} edges no longer referenced by other paragraphs"
+        )
+
+    def append(
+        self,
+        texts: Iterable[str],
+        nlp: Language,
+        batch_size: int = 64,
+        n_process: int = 1,
+        parse_cache: Optional[SpacyParseCache] = None,
+        length_batcher: Optional[SpacyLengthBatcher] = None,
+    ) -> List[int]:
+        # Skip spacy components whose annotations the schema does not read
+        list_disable_pipe = get_spacy_pipes_to_disable(nlp=nlp, schema=self.schema)
+
+        docs = pipe_spacy_docs(
+            texts=texts,
+            nlp=nlp,
+            batch_size=batch_size,
+            n_process=n_process,
+            disable=list_disable_pipe,
+            parse_cache=parse_cache,
+            length_batcher=length_batcher,
+        )
+
+        # Time the parse of each doc as it is pulled from the lazy batches
+        iter_doc: Iterator[Doc] = iter(docs)
+        list_para_nid: List[int] = []
+        while True:
+            with self.metrics.time_stage("spacy_parse"):
+                doc = next(iter_doc, None)
+            if doc is None:
+                break
+            list_para_nid.append(self.add_doc(doc=doc))
+
+        self.logger.info(
+            f"Appended {len(list_para_nid)} paragraphs to a corpus graph now holding "
+            f"{len(self)} paragraphs, {len(self.graph.nodes)} nodes "
+            f"and {len(self.graph.edges)} edges"
+        )
+
+        return list_para_nid
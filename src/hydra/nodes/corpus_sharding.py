@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from logging import Logger
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from dataclasses_json import dataclass_json
+from networkx import Graph
+
+from .linguistic_graph_arrays import GraphArrays
+from .linguistic_graph_builder import ParaGraphBuilder
+from .linguistic_graph_config import NetworkXGraphType
+from .linguistic_graph_construction import add_spacy_doc_to_graph_builder
+from .linguistic_graph_csr import CSRGraph
+from .utils import iter_windows
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+# spacy model loaded once by each worker process
+_worker_nlp: Optional[Language] = None
+
+
+@dataclass_json
+@dataclass
+class ShardedBuildStats:
+    n_workers: int
+    n_texts: int
+    n_shards: int
+    n_nodes: int
+    n_edges: int
+    elapsed_seconds: float
+
+    @property
+    def texts_per_second(self) -> float:
+        return self.n_texts / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+def _init_shard_worker(model_loader: Callable[[], Language]) -> None:
+    global _worker_nlp
+    _worker_nlp = model_loader()
+
+
+def _build_shard_graph_arrays(
+    texts: List[str], batch_size: int, vectorized: bool
+) -> GraphArrays:
+    if _worker_nlp is None:
+        raise RuntimeError("Shard worker was started without loading a spacy model")
+
+    logger = logging.getLogger(__name__)
+
+    # Contract nodes across all paragraphs of the shard before sending it back
+    shard_graph_builder = ParaGraphBuilder(logger=logger)
+    for doc in _worker_nlp.pipe(texts, batch_size=batch_size):
+        add_spacy_doc_to_graph_builder(
+            para_graph_builder=shard_graph_builder,
+            doc=doc,
+            logger=logger,
+            vectorized=vectorized,
+        )
+
+    return GraphArrays.from_networkx(nx_g=shard_graph_builder.graph)
+
+
+def build_corpus_graph_sharded(  # type: ignore[no-any-unimported]
+    texts: Iterable[str],
+    model_loader: Callable[[], Language],
+    logger: Logger,
+    n_workers: int = 4,
+    shard_size: int = 256,
+    batch_size: int = 64,
+    vectorized: bool = False,
+    graph_type: NetworkXGraphType = NetworkXGraphType.digraph,
+) -> Tuple[Union[Graph, CSRGraph], ShardedBuildStats]:
+    logger.info(
+        f"Building a corpus graph with {n_workers} workers "
+        f"over shards of {shard_size} texts"
+    )
+
+    start_time = time.perf_counter()
+
+    # Merge partial graphs in shard order with the same text keyed contraction
+    corpus_graph_builder = ParaGraphBuilder(logger=logger)
+
+    n_texts: int = 0
+    n_shards: int = 0
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_shard_worker,
+        initargs=(model_loader,),
+    ) as executor:
+        # Keep a bounded number of shards in flight so that neither the corpus
+        # nor the partial graphs pile up in the parent process
+        deque_future: Deque[Future[GraphArrays]] = deque()
+        for shard in iter_windows(iterable=texts, window_size=shard_size):
+            deque_future.append(
+                executor.submit(
+                    _build_shard_graph_arrays, shard, batch_size, vectorized
+                )
+            )
+            n_texts += len(shard)
+            n_shards += 1
+
+            if len(deque_future) >= 2 * n_workers:
+                corpus_graph_builder.add_graph_arrays(
+                    graph_arrays=deque_future.popleft().result()
+                )
+
+        while deque_future:
+            corpus_graph_builder.add_graph_arrays(
+                graph_arrays=deque_future.popleft().result()
+            )
+
+    corpus_graph = corpus_graph_builder.graph
+
+    sharded_build_stats = ShardedBuildStats(
+        n_workers=n_workers,
+        n_texts=n_texts,
+        n_shards=n_shards,
+        n_nodes=len(corpus_graph.nodes),
+        n_edges=len(corpus_graph.edges),
+        elapsed_seconds=time.perf_counter() - start_time,
+    )
+
+    logger.info(
+        f"Built a corpus graph with {sharded_build_stats.n_nodes} nodes and "
+        f"{sharded_build_stats.n_edges} edges from {n_texts} texts in {n_shards} "
+        f"shards at {sharded_build_stats.texts_per_second:.1f} texts per second"
+    )
+
+    if graph_type == NetworkXGraphType.csr:
+        return CSRGraph.from_networkx(nx_g=corpus_graph), sharded_build_stats
+
+    return corpus_graph, sharded_build_stats
+
+
+def measure_sharded_scaling(
+    texts: List[str],
+    model_loader: Callable[[], Language],
+    logger: Logger,
+    list_n_workers: List[int],
+    shard_size: int = 256,
+    batch_size: int = 64,
+    vectorized: bool = False,
+) -> List[ShardedBuildStats]:
+    list_sharded_build_stats: List[ShardedBuildStats] = []
+    for n_workers in list_n_workers:
+        _, sharded_build_stats = build_corpus_graph_sharded(
+            texts=texts,
+            model_loader=model_loader,
+            logger=logger,
+            n_workers=n_workers,
+            shard_size=shard_size,
+            batch_size=batch_size,
+            vectorized=vectorized,
+        )
+        list_sharded_build_stats.append(sharded_build_stats)
+
+    # Report throughput relative to the first worker count measured
+    base_texts_per_second = list_sharded_build_stats[0].texts_per_second
+    for sharded_build_stats in list_sharded_build_stats:
+        speedup = (
+            sharded_build_stats.texts_per_second / base_texts_per_second
+            if base_texts_per_second > 0
+            else 0.0
+        )
+        logger.info(
+            f"{sharded_build_stats.n_workers} workers: "
+            f"{sharded_build_stats.texts_per_second:.1f} texts per second, "
+            f"{speedup:.2f}x over {list_sharded_build_stats[0].n_workers} workers"
+        )
+
+    return list_sharded_build_stats
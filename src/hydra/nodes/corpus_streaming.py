@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+from logging import Logger
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, TextIO, Union
+
+from networkx import Graph, node_link_data
+
+from .linguistic_graph_config import CorpusFormat, NetworkXGraphType
+from .linguistic_graph_construction import parse_many_para_graphs
+from .linguistic_graph_csr import CSRGraph
+from .linguistic_graph_schema import GraphSchema
+from .pipeline_metrics import PipelineMetrics
+from .sent_graph_memo import SentGraphMemo
+from .spacy_length_batching import SpacyLengthBatcher
+from .spacy_parse_cache import SpacyParseCache
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+
+class CorpusFormatError(ValueError):
+    pass
+
+
+def _iter_paragraphs(f_corpus: TextIO) -> Iterator[str]:
+    # Accumulate lines until a blank line closes the paragraph
+    list_line: List[str] = []
+    for line in f_corpus:
+        if line.strip():
+            list_line.append(line)
+        elif list_line:
+            yield "".join(list_line).strip()
+            list_line = []
+    if list_line:
+        yield "".join(list_line).strip()
+
+
+def _iter_lines(f_corpus: TextIO) -> Iterator[str]:
+    for line in f_corpus:
+        if line.strip():
+            yield line.strip()
+
+
+def _iter_jsonl_field(f_corpus: TextIO, text_field: str) -> Iterator[str]:
+    for line_number, line in enumerate(f_corpus, start=1):
+        if not line.strip():
+            continue
+        try:
+            text = json.loads(line)[text_field]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise CorpusFormatError(
+                f"Line {line_number} of the corpus is not a json object with a "
+                f"{text_field!r} field: {e!r}"
+            ) from e
+        yield text
+
+
+def iter_corpus_texts(
+    f_corpus: TextIO,
+    corpus_format: CorpusFormat,
+    logger: Logger,
+    text_field: str = "text",
+) -> Iterator[str]:
+    if corpus_format == CorpusFormat.text:
+        texts = _iter_paragraphs(f_corpus=f_corpus)
+    elif corpus_format == CorpusFormat.lines:
+        texts = _iter_lines(f_corpus=f_corpus)
+    elif corpus_format == CorpusFormat.jsonl:
+        texts = _iter_jsonl_field(f_corpus=f_corpus, text_field=text_field)
+    else:
+        raise NotImplementedError(f"{corpus_format} is not defined in its enum class")
+
+    n_text: int = 0
+    for text in texts:
+        yield text
+        n_text += 1
+
+    logger.debug(f"Read {n_text} texts from a corpus of format {corpus_format}")
+
+
+def para_graph_to_json_line(  # type: ignore[no-any-unimported]
+    para_graph: Union[Graph, CSRGraph], index: int
+) -> str:
+    nx_g = para_graph.to_networkx() if isinstance(para_graph, CSRGraph) else para_graph
+    record: Dict[str, Any] = {"index": index, "graph": node_link_data(nx_g)}
+
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def stream_corpus_to_para_graphs(
+    f_corpus: TextIO,
+    f_output: TextIO,
+    nlp: Language,
+    logger: Logger,
+    corpus_format: CorpusFormat = CorpusFormat.lines,
+    text_field: str = "text",
+    batch_size: int = 64,
+    n_process: int = 1,
+    flush_every: int = 1024,
+    vectorized: bool = False,
+    graph_type: NetworkXGraphType = NetworkXGraphType.digraph,
+    parse_cache: Optional[SpacyParseCache] = None,
+    metrics: Optional[PipelineMetrics] = None,
+    schema: Optional[GraphSchema] = None,
+    length_batcher: Optional[SpacyLengthBatcher] = None,
+    sent_graph_memo: Optional[SentGraphMemo] = None,
+) -> int:
+    logger.info(
+        f"Streaming a corpus of format {corpus_format} into paragraph graphs "
+        f"in batches of {batch_size} texts, flushing every {flush_every} graphs"
+    )
+
+    texts = iter_corpus_texts(
+        f_corpus=f_corpus,
+        corpus_format=corpus_format,
+        logger=logger,
+        text_field=text_field,
+    )
+
+    # Texts are read lazily by one pipeline call over the whole corpus, which
+    # starts spacy's worker pool once. Memory follows the batch size, the
+    # number of processes and the length batcher's window rather than the
+    # corpus size, and graphs are written as they come
+    n_graph: int = 0
+    for para_graph in parse_many_para_graphs(
+        texts=texts,
+        nlp=nlp,
+        logger=logger,
+        batch_size=batch_size,
+        n_process=n_process,
+        vectorized=vectorized,
+        graph_type=graph_type,
+        parse_cache=parse_cache,
+        metrics=metrics,
+        schema=schema,
+        length_batcher=length_batcher,
+        sent_graph_memo=sent_graph_memo,
+    ):
+        f_output.write(para_graph_to_json_line(para_graph=para_graph, index=n_graph))
+        n_graph += 1
+        if n_graph % flush_every == 0:
+            f_output.flush()
+            logger.info(f"Wrote {n_graph} paragraph graphs")
+    f_output.flush()
+    logger.info(f"Wrote {n_graph} paragraph graphs")
+
+    if parse_cache is not None:
+        logger.info(f"Spacy parse cache stats: {parse_cache.stats}")
+    if sent_graph_memo is not None:
+        logger.info(f"Sentence graph memo stats: {sent_graph_memo.stats}")
+    if length_batcher is not None:
+        stats = length_batcher.stats
+        logger.info(
+            f"Length batching stats: {stats} at {stats.docs_per_second:.1f} docs "
+            f"per second with padding ratio {stats.padding_ratio:.3f}"
+        )
+
+    return n_graph
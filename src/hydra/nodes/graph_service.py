@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import Logger
+from time import perf_counter
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Deque, List, Optional, Tuple, Type
+
+import numpy as np
+from dataclasses_json import dataclass_json
+
+from .corpus_streaming import para_graph_to_json_line
+from .linguistic_graph_config import NetworkXGraphType
+from .linguistic_graph_construction import parse_many_para_graphs
+from .linguistic_graph_schema import GraphSchema
+from .pipeline_metrics import PipelineMetrics
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+
+@dataclass_json
+@dataclass
+class GraphServiceStats:
+    n_requests: int
+    n_batches: int
+    queue_depth: int
+    mean_batch_size: float
+    latency_p50_seconds: float
+    latency_p99_seconds: float
+
+
+class GraphService:
+    # Queue texts from concurrent callers and parse them in batches, flushing a
+    # batch once it is full or its first text has waited long enough
+    def __init__(
+        self,
+        nlp: Language,
+        logger: Logger,
+        max_batch_size: int = 32,
+        max_wait_seconds: float = 0.005,
+        vectorized: bool = False,
+        graph_type: NetworkXGraphType = NetworkXGraphType.digraph,
+        schema: Optional[GraphSchema] = None,
+        metrics: Optional[PipelineMetrics] = None,
+        executor: Optional[Executor] = None,
+        n_latency_window: int = 10000,
+    ) -> None:
+        self.nlp = nlp
+        self.logger = logger
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.vectorized = vectorized
+        self.graph_type = graph_type
+        self.schema = schema
+        self.metrics = metrics
+        # One worker parses batches in order, as spacy models are not shared
+        # safely between threads, while the event loop keeps queueing texts
+        self.executor: Executor = (
+            ThreadPoolExecutor(max_workers=1) if executor is None else executor
+        )
+
+        self.queue: Optional[asyncio.Queue[Tuple[str, asyncio.Future[str]]]] = None
+        self.task_batching: Optional[asyncio.Task[None]] = None
+        self.task_get: Optional[asyncio.Task[Tuple[str, asyncio.Future[str]]]] = None
+        self.list_item_in_flight: List[Tuple[str, asyncio.Future[str]]] = []
+
+        self.n_requests: int = 0
+        self.n_batches: int = 0
+        self.n_batched_texts: int = 0
+        self.deque_latency: Deque[float] = deque(maxlen=n_latency_window)
+
+    async def __aenter__(self) -> GraphService:
+        await self.start()
+
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        # The queue is bound to the running event loop, so it is made here
+        self.queue = asyncio.Queue()
+        self.task_batching = asyncio.get_running_loop().create_task(self._run_batches())
+
+        self.logger.info(
+            f"Started graph service with batches of at most {self.max_batch_size} "
+            f"texts flushed after {self.max_wait_seconds} seconds"
+        )
+
+    async def stop(self) -> None:
+        for task in [self.task_get, self.task_batching]:
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        self.task_get, self.task_batching = None, None
+
+        # Fail callers whose texts were never parsed
+        list_item = self.list_item_in_flight
+        if self.queue is not None:
+            while not self.queue.empty():
+                list_item.append(self.queue.get_nowait())
+            self.queue = None
+        for _, future in list_item:
+            if not future.done():
+                future.set_exception(RuntimeError("Graph service stopped"))
+        self.list_item_in_flight = []
+
+        self.logger.info(f"Stopped graph service with stats {self.stats}")
+
+    async def submit(self, text: str) -> str:
+        if self.queue is None:
+            raise RuntimeError("Graph service is not started")
+
+        time_start = perf_counter()
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        await self.queue.put((text, future))
+        self.n_requests += 1
+
+        json_line = await future
+        self.deque_latency.append(perf_counter() - time_start)
+
+        return json_line
+
+    @property
+    def stats(self) -> GraphServiceStats:
+        arr_latency = np.array(self.deque_latency, dtype=np.float64)
+        arr_percentile = (
+            np.percentile(arr_latency, [50, 99])
+            if arr_latency.shape[0] > 0
+            else np.zeros(2)
+        )
+
+        return GraphServiceStats(
+            n_requests=self.n_requests,
+            n_batches=self.n_batches,
+            queue_depth=0 if self.queue is None else self.queue.qsize(),
+            mean_batch_size=self.n_batched_texts / max(self.n_batches, 1),
+            latency_p50_seconds=float(arr_percentile[0]),
+            latency_p99_seconds=float(arr_percentile[1]),
+        )
+
+    async def _get_item(
+        self, timeout: Optional[float]
+    ) -> Optional[Tuple[str, asyncio.Future[str]]]:
+        # Keep an unfinished get for the next call instead of cancelling it, so
+        # an item arriving as the wait times out is not lost
+        assert self.queue is not None
+        if self.task_get is None:
+            self.task_get = asyncio.get_running_loop().create_task(self.queue.get())
+        done, _ = await asyncio.wait({self.task_get}, timeout=timeout)
+        if not done:
+            return None
+
+        item = self.task_get.result()
+        self.task_get = None
+
+        return item
+
+    async def _collect_batch(self) -> List[Tuple[str, asyncio.Future[str]]]:
+        assert self.queue is not None
+        loop = asyncio.get_running_loop()
+
+        first_item = await self._get_item(timeout=None)
+        assert first_item is not None
+        list_item = [first_item]
+        time_deadline = loop.time() + self.max_wait_seconds
+        while len(list_item) < self.max_batch_size:
+            if not self.queue.empty():
+                list_item.append(self.queue.get_nowait())
+                continue
+            timeout = time_deadline - loop.time()
+            if timeout <= 0:
+                break
+            item = await self._get_item(timeout=timeout)
+            if item is None:
+                break
+            list_item.append(item)
+
+        return list_item
+
+    def _build_batch(self, list_text: List[str], index_start: int) -> List[str]:
+        return [
+            para_graph_to_json_line(para_graph=para_graph, index=index_start + i)
+            for i, para_graph in enumerate(
+                parse_many_para_graphs(
+                    texts=list_text,
+                    nlp=self.nlp,
+                    logger=self.logger,
+                    batch_size=len(list_text),
+                    vectorized=self.vectorized,
+                    graph_type=self.graph_type,
+                    metrics=self.metrics,
+                    schema=self.schema,
+                )
+            )
+        ]
+
+    async def _run_batches(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            list_item = await self._collect_batch()
+            self.list_item_in_flight = list_item
+            list_text = [text for text, _ in list_item]
+
+            # Parse off the event loop, which keeps queueing texts meanwhile
+            try:
+                list_json_line = await loop.run_in_executor(
+                    self.executor, self._build_batch, list_text, self.n_batched_texts
+                )
+            except Exception as e:
+                self.logger.exception(f"Failed a batch of {len(list_text)} texts")
+                for _, future in list_item:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            finally:
+                self.n_batches += 1
+                self.n_batched_texts += len(list_text)
+
+            for (_, future), json_line in zip(list_item, list_json_line):
+                if not future.done():
+                    future.set_result(json_line)
+
+
+async def _get_graph_service_stats(graph_service: GraphService) -> GraphServiceStats:
+    return graph_service.stats
+
+
+class GraphServiceRequestHandler(BaseHTTPRequestHandler):
+    server: GraphServiceHTTPServer
+
+    def _send(self, status: int, body: str) -> None:
+        bytes_body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(bytes_body)))
+        self.end_headers()
+        self.wfile.write(bytes_body)
+
+    def _send_error(self, status: int, message: str) -> None:
+        self._send(status, json.dumps({"error": message}))
+
+    def _read_text(self) -> Optional[str]:
+        # A body of invalid length or encoding is the client's error
+        try:
+            n_bytes = int(self.headers.get("Content-Length", 0))
+            if n_bytes < 0:
+                raise ValueError(f"Content-Length {n_bytes} is negative")
+            return self.rfile.read(n_bytes).decode("utf-8")
+        except ValueError as e:
+            self._send_error(400, f"Invalid request body: {e}")
+            return None
+
+    def do_POST(self) -> None:
+        if self.path != "/graph":
+            self._send_error(404, f"{self.path} is not found")
+            return
+
+        text = self._read_text()
+        if text is None:
+            return
+
+        # Hand the text to the service on its event loop and wait for the graph
+        future = asyncio.run_coroutine_threadsafe(
+            self.server.graph_service.submit(text=text), self.server.loop
+        )
+        try:
+            json_line = future.result(timeout=self.server.request_timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            self._send_error(
+                503, f"No graph within {self.server.request_timeout} seconds"
+            )
+            return
+        except Exception as e:
+            self._send_error(500, f"Failed to build a graph: {e!r}")
+            return
+        self._send(200, json_line)
+
+    def do_GET(self) -> None:
+        if self.path != "/stats":
+            self._send_error(404, f"{self.path} is not found")
+            return
+
+        stats = asyncio.run_coroutine_threadsafe(
+            _get_graph_service_stats(graph_service=self.server.graph_service),
+            self.server.loop,
+        ).result()
+        self._send(200, stats.to_json())  # type: ignore[attr-defined]
+
+    def log_message(self, format: str, *args: Any) -> None:
+        self.server.graph_service.logger.debug(format % args)
+
+
+class GraphServiceHTTPServer(ThreadingHTTPServer):
+    # Serve a graph service running on an event loop in another thread, with
+    # POST /graph taking a text and GET /stats reporting the service stats
+    def __init__(
+        self,
+        server_address: Tuple[str, int],
+        graph_service: GraphService,
+        loop: asyncio.AbstractEventLoop,
+        request_timeout: float = 300.0,
+    ) -> None:
+        super().__init__(server_address, GraphServiceRequestHandler)
+        self.graph_service = graph_service
+        self.loop = loop
+        self.request_timeout = request_timeout
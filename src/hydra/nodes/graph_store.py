@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import json
+import shutil
+from logging import Logger
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+import numpy as np
+from networkx import DiGraph, Graph
+
+from .linguistic_graph_arrays import GraphArrays, StringTable
+from .linguistic_graph_csr import CSRGraph
+from .linguistic_graph_vocab import GraphVocab
+
+# A store file holds the magic bytes, the byte length of a json header, the
+# header itself, then every column as raw little endian data aligned to 64 bytes
+STORE_MAGIC: bytes = b"HYDRAGS1"
+STORE_ALIGNMENT: int = 64
+
+# Per-graph node and edge columns, with node ids local to each graph and text
+# held as ids into a string table shared by all graphs of the store
+LIST_STORE_COLUMN: List[Tuple[str, str]] = [
+    ("node_ntype", "<i1"),
+    ("node_text", "<i4"),
+    ("node_position_id", "<i4"),
+    ("edge_src", "<i4"),
+    ("edge_dst", "<i4"),
+    ("edge_etype", "<i1"),
+    ("edge_text", "<i4"),
+]
+
+
+def _align(n_bytes: int) -> int:
+    return -(-n_bytes // STORE_ALIGNMENT) * STORE_ALIGNMENT
+
+
+def _to_graph_arrays(  # type: ignore[no-any-unimported]
+    graph: Union[Graph, CSRGraph, GraphArrays],
+    vocab: Optional[GraphVocab] = None,
+) -> GraphArrays:
+    if isinstance(graph, GraphArrays):
+        return graph
+    if isinstance(graph, CSRGraph):
+        return graph.to_graph_arrays()
+
+    return GraphArrays.from_networkx(nx_g=graph, vocab=vocab)
+
+
+class GraphStoreWriter:
+    def __init__(self, path: Path, logger: Logger) -> None:
+        self.path = path
+        self.logger = logger
+        self.string_table = StringTable()
+        self.list_n_nodes: List[int] = []
+        self.list_n_edges: List[int] = []
+        self.closed: bool = False
+
+        # Spool columns to temporary files so that appending graphs only holds
+        # the string table and per-graph sizes in memory
+        self.dict_column_path: Dict[str, Path] = {
+            name: path.with_name(f"{path.name}.{name}.tmp")
+            for name, _ in LIST_STORE_COLUMN
+        }
+        self.dict_column_file: Dict[str, IO[bytes]] = {
+            name: open(column_path, "wb")
+            for name, column_path in self.dict_column_path.items()
+        }
+
+    def __enter__(self) -> GraphStoreWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._discard_spool()
+
+    def __len__(self) -> int:
+        return len(self.list_n_nodes)
+
+    def append(  # type: ignore[no-any-unimported]
+        self,
+        graph: Union[Graph, CSRGraph, GraphArrays],
+        vocab: Optional[GraphVocab] = None,
+    ) -> int:
+        # Networkx graphs encoded by a vocab are decoded into the store's text
+        graph_arrays = _to_graph_arrays(graph=graph, vocab=vocab)
+
+        dict_column: Dict[str, np.ndarray] = {
+            "node_ntype": graph_arrays.node_ntype,
+            "node_text": self.string_table.intern_many(graph_arrays.node_text.tolist()),
+            "node_position_id": graph_arrays.node_position_id,
+            "edge_src": graph_arrays.edge_src,
+            "edge_dst": graph_arrays.edge_dst,
+            "edge_etype": graph_arrays.edge_etype,
+            "edge_text": self.string_table.intern_many(graph_arrays.edge_text.tolist()),
+        }
+        for name, dtype in LIST_STORE_COLUMN:
+            self.dict_column_file[name].write(
+                dict_column[name].astype(dtype, copy=False).tobytes()
+            )
+
+        self.list_n_nodes.append(graph_arrays.n_nodes)
+        self.list_n_edges.append(graph_arrays.n_edges)
+
+        return len(self.list_n_nodes) - 1
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+
+        for f_column in self.dict_column_file.values():
+            f_column.close()
+
+        # Encode the string table as utf-8 bytes indexed by offsets
+        list_string_bytes = [
+            string.encode("utf-8") for string in self.string_table.list_string
+        ]
+        dict_small_column: Dict[str, np.ndarray] = {
+            "graph_node_offsets": np.concatenate(
+                [[0], np.cumsum(self.list_n_nodes, dtype=np.int64)]
+            ).astype("<i8"),
+            "graph_edge_offsets": np.concatenate(
+                [[0], np.cumsum(self.list_n_edges, dtype=np.int64)]
+            ).astype("<i8"),
+            "string_offsets": np.concatenate(
+                [[0], np.cumsum([len(b) for b in list_string_bytes], dtype=np.int64)]
+            ).astype("<i8"),
+            "string_data": np.frombuffer(b"".join(list_string_bytes), dtype="<u1"),
+        }
+
+        # Lay out columns with offsets relative to the aligned start of data
+        dict_column_spec: Dict[str, Dict[str, Any]] = {}
+        curr_offset: int = 0
+        for name, dtype in LIST_STORE_COLUMN:
+            n_bytes = self.dict_column_path[name].stat().st_size
+            dict_column_spec[name] = {
+                "dtype": dtype,
+                "shape": [n_bytes // np.dtype(dtype).itemsize],
+                "offset": curr_offset,
+            }
+            curr_offset = _align(curr_offset + n_bytes)
+        for name, arr in dict_small_column.items():
+            dict_column_spec[name] = {
+                "dtype": arr.dtype.str,
+                "shape": [int(arr.shape[0])],
+                "offset": curr_offset,
+            }
+            curr_offset = _align(curr_offset + arr.nbytes)
+
+        header = json.dumps(
+            {"n_graphs": len(self), "columns": dict_column_spec}
+        ).encode("utf-8")
+        data_start = _align(len(STORE_MAGIC) + 8 + len(header))
+
+        with open(self.path, "wb") as f_store:
+            f_store.write(STORE_MAGIC)
+            f_store.write(len(header).to_bytes(8, "little"))
+            f_store.write(header)
+            for name, _ in LIST_STORE_COLUMN:
+                f_store.seek(data_start + dict_column_spec[name]["offset"])
+                with open(self.dict_column_path[name], "rb") as f_column:
+                    shutil.copyfileobj(f_column, f_store)
+            for name, arr in dict_small_column.items():
+                f_store.seek(data_start + dict_column_spec[name]["offset"])
+                f_store.write(arr.tobytes())
+            f_store.truncate(data_start + curr_offset)
+
+        self._discard_spool()
+
+        self.logger.debug(
+            f"Wrote {len(self)} graphs with {sum(self.list_n_nodes)} nodes, "
+            f"{sum(self.list_n_edges)} edges and {len(self.string_table)} strings "
+            f"to {self.path}"
+        )
+
+    def _discard_spool(self) -> None:
+        for name, column_path in self.dict_column_path.items():
+            self.dict_column_file[name].close()
+            column_path.unlink(missing_ok=True)
+
+
+class GraphStoreReader:
+    def __init__(self, path: Path, logger: Logger) -> None:
+        self.path = path
+        self.logger = logger
+
+        with open(path, "rb") as f_store:
+            magic = f_store.read(len(STORE_MAGIC))
+            if magic != STORE_MAGIC:
+                raise ValueError(f"{path} is not a graph store file")
+            n_header_bytes = int.from_bytes(f_store.read(8), "little")
+            header: Dict[str, Any] = json.loads(f_store.read(n_header_bytes))
+        data_start = _align(len(STORE_MAGIC) + 8 + n_header_bytes)
+
+        # Map the file once and view every column in place without reading it
+        self.n_graphs: int = header["n_graphs"]
+        self.mmap = np.memmap(path, dtype=np.uint8, mode="r")
+        self.dict_column: Dict[str, np.ndarray] = {
+            name: np.frombuffer(
+                self.mmap,
+                dtype=spec["dtype"],
+                count=spec["shape"][0],
+                offset=data_start + spec["offset"],
+            )
+            for name, spec in header["columns"].items()
+        }
+
+        self.logger.debug(f"Opened graph store {path} holding {self.n_graphs} graphs")
+
+    def __len__(self) -> int:
+        return self.n_graphs
+
+    def __getitem__(self, index: int) -> GraphArrays:
+        return self.get_graph_arrays(index=index)
+
+    def __iter__(self) -> Iterator[GraphArrays]:
+        for index in range(self.n_graphs):
+            yield self.get_graph_arrays(index=index)
+
+    def _decode_string_ids(self, arr_string_id: np.ndarray) -> np.ndarray:
+        # Decode only the strings used by the requested graph
+        arr_string_offsets = self.dict_column["string_offsets"]
+        arr_string_data = self.dict_column["string_data"]
+        arr_unique_string_id, arr_inverse = np.unique(
+            arr_string_id, return_inverse=True
+        )
+        arr_unique_string = np.empty(arr_unique_string_id.shape[0], dtype=object)
+        arr_unique_string[:] = [
+            arr_string_data[
+                arr_string_offsets[string_id] : arr_string_offsets[string_id + 1]
+            ]
+            .tobytes()
+            .decode("utf-8")
+            for string_id in arr_unique_string_id.tolist()
+        ]
+        arr_string: np.ndarray = arr_unique_string[arr_inverse.reshape(-1)]
+
+        return arr_string
+
+    def get_graph_arrays(self, index: int) -> GraphArrays:
+        if not 0 <= index < self.n_graphs:
+            raise IndexError(f"Graph index {index} is out of range {self.n_graphs}")
+
+        dict_column = self.dict_column
+        n_start, n_end = dict_column["graph_node_offsets"][index : index + 2].tolist()
+        e_start, e_end = dict_column["graph_edge_offsets"][index : index + 2].tolist()
+
+        return GraphArrays(
+            node_ntype=np.array(dict_column["node_ntype"][n_start:n_end]),
+            node_text=self._decode_string_ids(dict_column["node_text"][n_start:n_end]),
+            node_position_id=dict_column["node_position_id"][n_start:n_end].astype(
+                np.int64
+            ),
+            edge_src=dict_column["edge_src"][e_start:e_end].astype(np.int64),
+            edge_dst=dict_column["edge_dst"][e_start:e_end].astype(np.int64),
+            edge_etype=np.array(dict_column["edge_etype"][e_start:e_end]),
+            edge_text=self._decode_string_ids(dict_column["edge_text"][e_start:e_end]),
+        )
+
+    def get_networkx(self, index: int) -> DiGraph:  # type: ignore[no-any-unimported]
+        graph_arrays = self.get_graph_arrays(index=index)
+
+        nx_g = DiGraph()
+        nx_g.add_nodes_from(graph_arrays.to_list_node_tuple())
+        nx_g.add_edges_from(graph_arrays.to_list_edge_tuple())
+
+        return nx_g
+
+    def get_csr_graph(
+        self, index: int, string_table: Optional[StringTable] = None
+    ) -> CSRGraph:
+        return CSRGraph.from_graph_arrays(
+            graph_arrays=self.get_graph_arrays(index=index), string_table=string_table
+        )
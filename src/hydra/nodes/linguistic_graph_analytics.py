@@ -0,0 +1,390 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from dataclasses_json import dataclass_json
+from networkx import Graph
+from scipy.sparse import coo_matrix, csr_matrix
+
+from .linguistic_graph_arrays import (
+    DICT_ETYPE_CODE,
+    LIST_NTYPE,
+    GraphArrays,
+    StringTable,
+)
+from .linguistic_graph_columns import (
+    EdgeColumns,
+    NodeColumns,
+    columns_to_graph_arrays,
+)
+from .linguistic_graph_csr import CSRGraph
+from .linguistic_graph_edges import EdgeTuples, EdgeType
+from .linguistic_graph_nodes import NodeTuples
+from .linguistic_graph_vocab import GraphVocab
+
+# Edge types between nodes whose texts co-occur, such as a token and its NER
+# label, a token and its universal POS tag, or the head and child of an arc
+LIST_COOCCURRENCE_ETYPE: List[EdgeType] = [
+    EdgeType.token_to_ner,
+    EdgeType.token_to_uni_pos,
+    EdgeType.dependency_arc,
+]
+
+
+@dataclass_json
+@dataclass
+class DegreeSummary:
+    n_nodes: int
+    mean_in_degree: float
+    mean_out_degree: float
+    median_degree: float
+    p99_degree: float
+    max_degree: int
+
+
+def _get_row_ids(  # type: ignore[no-any-unimported]
+    matrix: csr_matrix,
+) -> np.ndarray:
+    # Row of every stored value of a csr matrix
+    arr_row_id: np.ndarray = np.repeat(
+        np.arange(matrix.shape[0], dtype=np.int64), np.diff(matrix.indptr)
+    )
+
+    return arr_row_id
+
+
+def _get_marginal_counts(  # type: ignore[no-any-unimported]
+    matrix: csr_matrix,
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    # Row, column and total counts of a csr matrix
+    arr_row_count = np.asarray(matrix.sum(axis=1), dtype=np.float64).reshape(-1)
+    arr_col_count = np.asarray(matrix.sum(axis=0), dtype=np.float64).reshape(-1)
+
+    return arr_row_count, arr_col_count, float(arr_row_count.sum())
+
+
+def _get_pmi(
+    arr_count: np.ndarray,
+    arr_row_count: np.ndarray,
+    arr_col_count: np.ndarray,
+    n_total: float,
+) -> np.ndarray:
+    arr_pmi: np.ndarray = np.log(arr_count * n_total / (arr_row_count * arr_col_count))
+
+    return arr_pmi
+
+
+def compute_pmi(  # type: ignore[no-any-unimported]
+    matrix: csr_matrix, positive: bool = True
+) -> csr_matrix:
+    # Pointwise mutual information of the stored pairs only, from the row,
+    # column and total counts of the matrix
+    matrix = csr_matrix(matrix, dtype=np.float64)
+    matrix.sum_duplicates()
+    arr_row_count, arr_col_count, n_total = _get_marginal_counts(matrix=matrix)
+
+    arr_pmi = _get_pmi(
+        arr_count=matrix.data,
+        arr_row_count=arr_row_count[_get_row_ids(matrix=matrix)],
+        arr_col_count=arr_col_count[matrix.indices],
+        n_total=n_total,
+    )
+    pmi_matrix = csr_matrix(
+        (arr_pmi, matrix.indices.copy(), matrix.indptr.copy()), shape=matrix.shape
+    )
+    if positive:
+        pmi_matrix.data = np.maximum(pmi_matrix.data, 0.0)
+        pmi_matrix.eliminate_zeros()
+
+    return pmi_matrix
+
+
+def get_top_k(  # type: ignore[no-any-unimported]
+    matrix: csr_matrix, k: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Rows, columns and values of the k largest stored values of every row,
+    # sorted by row then by decreasing value
+    matrix = csr_matrix(matrix)
+    matrix.sum_duplicates()
+    arr_row_id = _get_row_ids(matrix=matrix)
+    arr_order = np.lexsort((-matrix.data, arr_row_id))
+    arr_rank = np.arange(arr_order.shape[0]) - matrix.indptr[arr_row_id[arr_order]]
+    arr_top = arr_order[arr_rank < k]
+
+    return arr_row_id[arr_top], matrix.indices[arr_top], matrix.data[arr_top]
+
+
+@dataclass
+class CooccurrenceMatrix:  # type: ignore[no-any-unimported]
+    # Counts of edges of an edge type, with rows and columns indexed by the
+    # string table ids of their source and destination node texts
+    matrix: csr_matrix  # type: ignore[no-any-unimported]
+    etype: EdgeType
+    string_table: StringTable
+
+    # Row, column and total counts, computed once on the first PMI lookup
+    marginal_counts: Optional[Tuple[np.ndarray, np.ndarray, float]] = field(
+        default=None, init=False, repr=False
+    )
+
+    def get_count(self, src_text: str, dst_text: str) -> float:
+        mapping_string_to_id = self.string_table.mapping_string_to_id
+        src_id = mapping_string_to_id.get(src_text)
+        dst_id = mapping_string_to_id.get(dst_text)
+        if src_id is None or dst_id is None:
+            return 0.0
+
+        return float(self.matrix[src_id, dst_id])
+
+    def pmi(  # type: ignore[no-any-unimported]
+        self, positive: bool = True
+    ) -> csr_matrix:
+        return compute_pmi(matrix=self.matrix, positive=positive)
+
+    def top_k(
+        self, src_text: str, k: int, use_pmi: bool = False
+    ) -> List[Tuple[str, float]]:
+        # Destination texts of a source text with the largest counts or PMI
+        src_id = self.string_table.mapping_string_to_id.get(src_text)
+        if src_id is None:
+            return []
+
+        row = self.matrix.getrow(src_id)
+        row.sum_duplicates()
+        if use_pmi:
+            row = self._get_row_pmi(src_id=src_id, row=row)
+        arr_top = np.argsort(-row.data, kind="stable")[:k]
+
+        return list(
+            zip(
+                self.string_table.lookup_many(row.indices[arr_top]),
+                row.data[arr_top].tolist(),
+            )
+        )
+
+    def _get_row_pmi(  # type: ignore[no-any-unimported]
+        self, src_id: int, row: csr_matrix
+    ) -> csr_matrix:
+        # Positive PMI of one row, as in the whole matrix's PMI, without
+        # computing it for the other rows
+        if self.marginal_counts is None:
+            self.marginal_counts = _get_marginal_counts(matrix=self.matrix)
+        arr_row_count, arr_col_count, n_total = self.marginal_counts
+
+        arr_pmi = _get_pmi(
+            arr_count=row.data.astype(np.float64),
+            arr_row_count=arr_row_count[src_id],
+            arr_col_count=arr_col_count[row.indices],
+            n_total=n_total,
+        )
+        arr_is_positive = arr_pmi > 0.0
+        pmi_row = csr_matrix(
+            (
+                arr_pmi[arr_is_positive],
+                row.indices[arr_is_positive],
+                np.array([0, int(arr_is_positive.sum())]),
+            ),
+            shape=row.shape,
+        )
+
+        return pmi_row
+
+
+class CooccurrenceCounter:
+    # Accumulate edges of co-occurrence edge types as pairs of interned node
+    # texts, compacting pending pairs into sparse counts every so often. The
+    # elements of every sentence count each occurrence, while an edge of a
+    # contracted graph counts once unless given the number of edges it stands for
+    def __init__(
+        self,
+        string_table: Optional[StringTable] = None,
+        list_etype: Optional[List[EdgeType]] = None,
+        max_pending_pairs: int = 1 << 22,
+    ) -> None:
+        self.string_table = StringTable() if string_table is None else string_table
+        self.list_etype = LIST_COOCCURRENCE_ETYPE if list_etype is None else list_etype
+        self.max_pending_pairs = max_pending_pairs
+
+        self.dict_etype_matrix: Dict[  # type: ignore[no-any-unimported]
+            EdgeType, csr_matrix
+        ] = {etype: csr_matrix((0, 0), dtype=np.int64) for etype in self.list_etype}
+        self.dict_etype_pending: Dict[EdgeType, List[np.ndarray]] = {
+            etype: [] for etype in self.list_etype
+        }
+        self.dict_etype_pending_count: Dict[EdgeType, List[np.ndarray]] = {
+            etype: [] for etype in self.list_etype
+        }
+        self.n_pending_pairs: int = 0
+
+    def add_graph_arrays(
+        self, graph_arrays: GraphArrays, edge_count: Optional[np.ndarray] = None
+    ) -> None:
+        self._add_columns(
+            node_text_id=self.string_table.intern_many(graph_arrays.node_text.tolist()),
+            edge_src=graph_arrays.edge_src,
+            edge_dst=graph_arrays.edge_dst,
+            edge_etype=graph_arrays.edge_etype,
+            edge_count=edge_count,
+        )
+
+    def add_csr_graph(self, csr_g: CSRGraph) -> None:
+        # Texts of a graph interned into another string table are mapped across
+        node_text_id = (
+            csr_g.node_text
+            if csr_g.string_table is self.string_table
+            else self.string_table.intern_many(
+                csr_g.string_table.lookup_many(csr_g.node_text)
+            )
+        )
+        self._add_columns(
+            node_text_id=node_text_id,
+            edge_src=csr_g.edge_src,
+            edge_dst=csr_g.out_indices,
+            edge_etype=csr_g.edge_etype,
+        )
+
+    def add_graph(  # type: ignore[no-any-unimported]
+        self,
+        graph: Union[Graph, CSRGraph, GraphArrays],
+        mapping_edge_to_count: Optional[Dict[Tuple[int, int], int]] = None,
+        vocab: Optional[GraphVocab] = None,
+    ) -> None:
+        # Edges of a networkx graph contracted by a builder tracking references
+        # can count the sentence edges they stand for, as in the builder's
+        # mapping_edge_to_n_ref, instead of once each
+        if mapping_edge_to_count is not None and isinstance(
+            graph, (CSRGraph, GraphArrays)
+        ):
+            raise ValueError("Edge counts are only taken with a networkx graph")
+
+        if isinstance(graph, GraphArrays):
+            self.add_graph_arrays(graph_arrays=graph)
+        elif isinstance(graph, CSRGraph):
+            self.add_csr_graph(csr_g=graph)
+        else:
+            self.add_graph_arrays(
+                graph_arrays=GraphArrays.from_networkx(nx_g=graph, vocab=vocab),
+                edge_count=(
+                    None
+                    if mapping_edge_to_count is None
+                    else np.array(
+                        [mapping_edge_to_count.get(edge, 1) for edge in graph.edges],
+                        dtype=np.int64,
+                    )
+                ),
+            )
+
+    def add_sent_elements(
+        self, node_tuples: NodeTuples, edge_tuples: EdgeTuples
+    ) -> None:
+        # Elements of one sentence as collected from spacy, before contraction
+        self.add_graph_arrays(
+            graph_arrays=columns_to_graph_arrays(
+                node_columns=NodeColumns.from_node_tuples(node_tuples=node_tuples),
+                edge_columns=EdgeColumns.from_edge_tuples(edge_tuples=edge_tuples),
+            )
+        )
+
+    def _add_columns(
+        self,
+        node_text_id: np.ndarray,
+        edge_src: np.ndarray,
+        edge_dst: np.ndarray,
+        edge_etype: np.ndarray,
+        edge_count: Optional[np.ndarray] = None,
+    ) -> None:
+        if edge_count is None:
+            edge_count = np.ones(edge_etype.shape[0], dtype=np.int64)
+        for etype in self.list_etype:
+            arr_is_etype = edge_etype == DICT_ETYPE_CODE[etype]
+            arr_pair = np.stack(
+                [
+                    node_text_id[edge_src[arr_is_etype]],
+                    node_text_id[edge_dst[arr_is_etype]],
+                ]
+            )
+            self.dict_etype_pending[etype].append(arr_pair)
+            self.dict_etype_pending_count[etype].append(edge_count[arr_is_etype])
+            self.n_pending_pairs += arr_pair.shape[1]
+
+        if self.n_pending_pairs > self.max_pending_pairs:
+            self._compact()
+
+    def _compact(self) -> None:
+        # Sum pending pairs into the counts, grown to the string table's size
+        n_text = len(self.string_table)
+        for etype in self.list_etype:
+            # Matrices already handed out keep their shape, so a copy is grown
+            matrix = self.dict_etype_matrix[etype]
+            if matrix.shape != (n_text, n_text):
+                matrix = matrix.copy()
+                matrix.resize((n_text, n_text))
+            list_pair = self.dict_etype_pending[etype]
+            if list_pair:
+                arr_pair = np.concatenate(list_pair, axis=1)
+                arr_count = np.concatenate(self.dict_etype_pending_count[etype])
+                matrix = (
+                    matrix
+                    + coo_matrix(
+                        (arr_count, tuple(arr_pair)), shape=(n_text, n_text)
+                    ).tocsr()
+                )
+            self.dict_etype_matrix[etype] = matrix
+            self.dict_etype_pending[etype] = []
+            self.dict_etype_pending_count[etype] = []
+        self.n_pending_pairs = 0
+
+    def get_matrix(self, etype: EdgeType) -> CooccurrenceMatrix:
+        if etype not in self.dict_etype_matrix:
+            raise KeyError(f"{etype} is not counted by this co-occurrence counter")
+        self._compact()
+
+        return CooccurrenceMatrix(
+            matrix=self.dict_etype_matrix[etype],
+            etype=etype,
+            string_table=self.string_table,
+        )
+
+
+def _summarize_degree(
+    arr_in_degree: np.ndarray, arr_out_degree: np.ndarray
+) -> DegreeSummary:
+    arr_degree = arr_in_degree + arr_out_degree
+
+    return DegreeSummary(
+        n_nodes=int(arr_degree.shape[0]),
+        mean_in_degree=float(arr_in_degree.mean()),
+        mean_out_degree=float(arr_out_degree.mean()),
+        median_degree=float(np.median(arr_degree)),
+        p99_degree=float(np.percentile(arr_degree, 99)),
+        max_degree=int(arr_degree.max()),
+    )
+
+
+def summarize_degrees(  # type: ignore[no-any-unimported]
+    graph: Union[Graph, CSRGraph, GraphArrays],
+    vocab: Optional[GraphVocab] = None,
+) -> Dict[str, DegreeSummary]:
+    # Degree summaries of the nodes of every node type in a graph
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_graph_arrays(
+            graph_arrays=(
+                graph
+                if isinstance(graph, GraphArrays)
+                else GraphArrays.from_networkx(nx_g=graph, vocab=vocab)
+            )
+        )
+    arr_in_degree = graph.in_degree()
+    arr_out_degree = graph.out_degree()
+
+    dict_ntype_summary: Dict[str, DegreeSummary] = {}
+    for ntype_code in np.unique(graph.node_ntype).tolist():
+        arr_is_ntype = graph.node_ntype == ntype_code
+        dict_ntype_summary[LIST_NTYPE[ntype_code].value] = _summarize_degree(
+            arr_in_degree=arr_in_degree[arr_is_ntype],
+            arr_out_degree=arr_out_degree[arr_is_ntype],
+        )
+
+    return dict_ntype_summary
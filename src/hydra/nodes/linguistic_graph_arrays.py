@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from networkx import Graph
+
+from .linguistic_graph_edges import EdgeType
+from .linguistic_graph_nodes import NodeType
+
+if TYPE_CHECKING:
+    from .linguistic_graph_vocab import GraphVocab
+
+# Integer codes of node types and edge types are their positions in the enums
+LIST_NTYPE: List[NodeType] = list(NodeType)
+LIST_ETYPE: List[EdgeType] = list(EdgeType)
+DICT_NTYPE_CODE: Dict[NodeType, int] = {
+    ntype: code for code, ntype in enumerate(LIST_NTYPE)
+}
+DICT_ETYPE_CODE: Dict[EdgeType, int] = {
+    etype: code for code, etype in enumerate(LIST_ETYPE)
+}
+DICT_NTYPE_VALUE_CODE: Dict[str, int] = {
+    ntype.value: code for code, ntype in enumerate(LIST_NTYPE)
+}
+DICT_ETYPE_VALUE_CODE: Dict[str, int] = {
+    etype.value: code for code, etype in enumerate(LIST_ETYPE)
+}
+
+
+class StringTable:
+    def __init__(self) -> None:
+        self.list_string: List[str] = []
+        self.mapping_string_to_id: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.list_string)
+
+    def intern(self, string: str) -> int:
+        string_id = self.mapping_string_to_id.get(string)
+        if string_id is None:
+            string_id = len(self.list_string)
+            self.mapping_string_to_id[string] = string_id
+            self.list_string.append(string)
+
+        return string_id
+
+    def intern_many(self, strings: Iterable[str]) -> np.ndarray:
+        intern = self.intern
+
+        return np.fromiter((intern(string) for string in strings), dtype=np.int32)
+
+    def lookup(self, string_id: int) -> str:
+        return self.list_string[string_id]
+
+    def lookup_many(self, string_ids: np.ndarray) -> List[str]:
+        list_string = self.list_string
+
+        return [list_string[string_id] for string_id in string_ids.tolist()]
+
+
+@dataclass
+class GraphArrays:
+    # Node ids are implicit and equal to positions in the node columns
+    node_ntype: np.ndarray
+    node_text: np.ndarray
+    node_position_id: np.ndarray
+    edge_src: np.ndarray
+    edge_dst: np.ndarray
+    edge_etype: np.ndarray
+    edge_text: np.ndarray
+
+    @property
+    def n_nodes(self) -> int:
+        return int(self.node_ntype.shape[0])
+
+    @classmethod
+    def from_elements(
+        cls,
+        list_node_tuple: Iterable[Tuple[Any, Dict[str, Any]]],
+        list_edge_tuple: Iterable[Tuple[Any, Any, Dict[str, Any]]],
+    ) -> GraphArrays:
+        # Node ids are replaced by dense ids following the order of the nodes
+        mapping_nid_to_dense_nid: Dict[Any, int] = {}
+        list_ntype: List[int] = []
+        list_text: List[str] = []
+        list_position_id: List[int] = []
+        for nid, nfeats in list_node_tuple:
+            mapping_nid_to_dense_nid[nid] = len(mapping_nid_to_dense_nid)
+            ntype_code = DICT_NTYPE_VALUE_CODE.get(nfeats["ntype"])
+            if ntype_code is None:
+                raise ValueError(
+                    f"Node {nid!r} has unknown node type {nfeats['ntype']!r}, graphs"
+                    " encoded by a GraphVocab need it to be decoded"
+                )
+            list_ntype.append(ntype_code)
+            list_text.append(nfeats["text"])
+            list_position_id.append(nfeats.get("position_id", -1))
+
+        list_src: List[int] = []
+        list_dst: List[int] = []
+        list_etype: List[int] = []
+        list_etext: List[str] = []
+        for u, v, efeats in list_edge_tuple:
+            list_src.append(mapping_nid_to_dense_nid[u])
+            list_dst.append(mapping_nid_to_dense_nid[v])
+            etype_code = DICT_ETYPE_VALUE_CODE.get(efeats["etype"])
+            if etype_code is None:
+                raise ValueError(
+                    f"Edge {(u, v)!r} has unknown edge type {efeats['etype']!r},"
+                    " graphs encoded by a GraphVocab need it to be decoded"
+                )
+            list_etype.append(etype_code)
+            list_etext.append(efeats.get("text", ""))
+
+        node_text = np.empty(len(list_text), dtype=object)
+        node_text[:] = list_text
+        edge_text = np.empty(len(list_etext), dtype=object)
+        edge_text[:] = list_etext
+
+        return cls(
+            node_ntype=np.array(list_ntype, dtype=np.int8),
+            node_text=node_text,
+            node_position_id=np.array(list_position_id, dtype=np.int64),
+            edge_src=np.array(list_src, dtype=np.int64),
+            edge_dst=np.array(list_dst, dtype=np.int64),
+            edge_etype=np.array(list_etype, dtype=np.int8),
+            edge_text=edge_text,
+        )
+
+    @classmethod
+    def from_networkx(  # type: ignore[no-any-unimported]
+        cls, nx_g: Graph, vocab: Optional[GraphVocab] = None
+    ) -> GraphArrays:
+        # Attributes of a graph encoded by a vocab are decoded on the way
+        if vocab is None:
+            return cls.from_elements(
+                list_node_tuple=nx_g.nodes.data(), list_edge_tuple=nx_g.edges.data()
+            )
+
+        return cls.from_elements(
+            list_node_tuple=(
+                (nid, vocab.decode_node_feats(nfeats))
+                for nid, nfeats in nx_g.nodes.data()
+            ),
+            list_edge_tuple=(
+                (u, v, vocab.decode_edge_feats(efeats))
+                for u, v, efeats in nx_g.edges.data()
+            ),
+        )
+
+    @property
+    def n_edges(self) -> int:
+        return int(self.edge_src.shape[0])
+
+    def to_list_node_tuple(self) -> List[Tuple[int, Dict[str, Any]]]:
+        arr_ntype_value = np.array([ntype.value for ntype in LIST_NTYPE], dtype=object)
+        list_ntype_value: List[str] = arr_ntype_value[self.node_ntype].tolist()
+        list_text: List[str] = self.node_text.tolist()
+        list_position_id: List[int] = self.node_position_id.tolist()
+
+        # Only token nodes carry a position id, as with TokenNodeFeats
+        untyped_list_node_tuple: List[Tuple[int, Dict[str, Any]]] = [
+            (
+                (nid, {"ntype": ntype_value, "text": text})
+                if position_id < 0
+                else (
+                    nid,
+                    {"ntype": ntype_value, "text": text, "position_id": position_id},
+                )
+            )
+            for nid, (ntype_value, text, position_id) in enumerate(
+                zip(list_ntype_value, list_text, list_position_id)
+            )
+        ]
+
+        return untyped_list_node_tuple
+
+    def to_list_edge_tuple(self) -> List[Tuple[int, int, Dict[str, Any]]]:
+        arr_etype_value = np.array([etype.value for etype in LIST_ETYPE], dtype=object)
+        list_etype_value: List[str] = arr_etype_value[self.edge_etype].tolist()
+
+        untyped_list_edge_tuple: List[Tuple[int, int, Dict[str, Any]]] = [
+            (src_id, dst_id, {"etype": etype_value, "text": text})
+            for src_id, dst_id, etype_value, text in zip(
+                self.edge_src.tolist(),
+                self.edge_dst.tolist(),
+                list_etype_value,
+                self.edge_text.tolist(),
+            )
+        ]
+
+        return untyped_list_edge_tuple
+
+    def to_list_interned_node_tuple(
+        self, string_table: StringTable
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        # Node types stay integer codes and text becomes string table ids
+        list_ntype_code: List[int] = self.node_ntype.tolist()
+        list_text_id: List[int] = string_table.intern_many(
+            self.node_text.tolist()
+        ).tolist()
+        list_position_id: List[int] = self.node_position_id.tolist()
+
+        untyped_list_node_tuple: List[Tuple[int, Dict[str, Any]]] = [
+            (
+                (nid, {"ntype": ntype_code, "text": text_id})
+                if position_id < 0
+                else (
+                    nid,
+                    {"ntype": ntype_code, "text": text_id, "position_id": position_id},
+                )
+            )
+            for nid, (ntype_code, text_id, position_id) in enumerate(
+                zip(list_ntype_code, list_text_id, list_position_id)
+            )
+        ]
+
+        return untyped_list_node_tuple
+
+    def to_list_interned_edge_tuple(
+        self, string_table: StringTable
+    ) -> List[Tuple[int, int, Dict[str, Any]]]:
+        untyped_list_edge_tuple: List[Tuple[int, int, Dict[str, Any]]] = [
+            (src_id, dst_id, {"etype": etype_code, "text": text_id})
+            for src_id, dst_id, etype_code, text_id in zip(
+                self.edge_src.tolist(),
+                self.edge_dst.tolist(),
+                self.edge_etype.tolist(),
+                string_table.intern_many(self.edge_text.tolist()).tolist(),
+            )
+        ]
+
+        return untyped_list_edge_tuple
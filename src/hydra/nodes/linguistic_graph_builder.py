@@ -0,0 +1,495 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from logging import Logger
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from networkx import DiGraph, Graph
+
+from .linguistic_graph_arrays import DICT_NTYPE_CODE, GraphArrays
+from .linguistic_graph_columns import EdgeColumns, NodeColumns, columns_to_graph_arrays
+from .linguistic_graph_config import NetworkXGraphType
+from .linguistic_graph_edges import EdgeTuples
+from .linguistic_graph_index import GraphIndex
+from .linguistic_graph_nodes import NodeTuples, NodeType
+from .linguistic_graph_vocab import GraphVocab
+from .pipeline_metrics import NULL_PIPELINE_METRICS, PipelineMetrics
+
+# Node types contracted by identical text in paragraph graphs
+LIST_CONTRACT_NTYPE: List[NodeType] = [
+    NodeType.token,
+    NodeType.ner,
+    NodeType.uni_pos,
+]
+
+
+@dataclass
+class ReferenceRecord:
+    # Graph node ids and edge endpoints referenced by added elements, once per
+    # element, so the elements can later be retracted
+    record_id: int
+    arr_nid: np.ndarray
+    arr_edge: np.ndarray
+
+
+class ParaGraphBuilder:
+    def __init__(
+        self,
+        logger: Logger,
+        list_contract_ntype: Optional[List[NodeType]] = None,
+        graph_type: NetworkXGraphType = NetworkXGraphType.digraph,
+        nfeat_ntype: str = "ntype",
+        nfeat_text: str = "text",
+        metrics: Optional[PipelineMetrics] = None,
+        vocab: Optional[GraphVocab] = None,
+        track_references: bool = False,
+        build_index: bool = False,
+    ) -> None:
+        # Initiate networkx graph
+        if graph_type == NetworkXGraphType.digraph:
+            self.nx_g = DiGraph()
+        else:
+            raise NotImplementedError(f"{graph_type} is not defined in its enum class")
+
+        self.logger = logger
+        self.list_contract_ntype: List[NodeType] = (
+            LIST_CONTRACT_NTYPE if list_contract_ntype is None else list_contract_ntype
+        )
+        # With a vocab, node attributes are held interned as integer ids
+        self.vocab = vocab
+        self.set_contract_ntype: Set[Any] = {
+            ntype.value if vocab is None else DICT_NTYPE_CODE[ntype]
+            for ntype in self.list_contract_ntype
+        }
+        self.nfeat_ntype = nfeat_ntype
+        self.nfeat_text = nfeat_text
+        self.metrics: PipelineMetrics = (
+            NULL_PIPELINE_METRICS if metrics is None else metrics
+        )
+
+        # Interning table from node type and text to the node id holding them
+        self.mapping_ntype_text_to_nid: Dict[Tuple[Any, Any], int] = {}
+
+        # Node ids are never reused, so ids of removed nodes stay free
+        self.next_nid: int = 0
+
+        # Count the elements referencing each node and edge when tracked, with
+        # the references added since they were last taken
+        self.track_references = track_references
+        self.mapping_nid_to_n_ref: Dict[int, int] = {}
+        self.mapping_edge_to_n_ref: Dict[Tuple[int, int], int] = {}
+        self.list_ref_nid: List[int] = []
+        self.list_ref_edge: List[Tuple[int, int]] = []
+
+        # Attributes each reference record brought to a node or edge, in order
+        # of addition, as the first remaining record's attributes are restored
+        # when the record whose attributes a node or edge holds is removed
+        self.next_record_id: int = 0
+        self.mapping_nid_to_record_nfeats: Dict[int, Dict[int, Dict[str, Any]]] = {}
+        self.mapping_edge_to_record_efeats: Dict[
+            Tuple[int, int], Dict[int, Dict[str, Any]]
+        ] = {}
+
+        # Index of nodes and edges by type and text, kept up to date when built
+        self.index: Optional[GraphIndex] = (
+            GraphIndex(nfeat_ntype=nfeat_ntype, nfeat_text=nfeat_text)
+            if build_index
+            else None
+        )
+
+    @classmethod
+    def from_graph(  # type: ignore[no-any-unimported]
+        cls,
+        nx_g: DiGraph,
+        logger: Logger,
+        list_contract_ntype: Optional[List[NodeType]] = None,
+        nfeat_ntype: str = "ntype",
+        nfeat_text: str = "text",
+        metrics: Optional[PipelineMetrics] = None,
+        vocab: Optional[GraphVocab] = None,
+        track_references: bool = False,
+        build_index: bool = False,
+    ) -> ParaGraphBuilder:
+        para_graph_builder = cls(
+            logger=logger,
+            list_contract_ntype=list_contract_ntype,
+            nfeat_ntype=nfeat_ntype,
+            nfeat_text=nfeat_text,
+            metrics=metrics,
+            vocab=vocab,
+            track_references=track_references,
+        )
+        para_graph_builder.nx_g = nx_g
+        if build_index:
+            para_graph_builder.index = GraphIndex.from_graph(
+                nx_g=nx_g, nfeat_ntype=nfeat_ntype, nfeat_text=nfeat_text
+            )
+        para_graph_builder.next_nid = max(nx_g, default=-1) + 1
+
+        # Elements already in the graph hold one reference which is never taken
+        # back, as the elements referencing them are unknown
+        if track_references:
+            para_graph_builder.mapping_nid_to_n_ref.update((nid, 1) for nid in nx_g)
+            para_graph_builder.mapping_edge_to_n_ref.update(
+                (edge, 1) for edge in nx_g.edges
+            )
+            para_graph_builder.mapping_nid_to_record_nfeats.update(
+                (nid, {-1: dict(nfeats)}) for nid, nfeats in nx_g.nodes.data()
+            )
+            para_graph_builder.mapping_edge_to_record_efeats.update(
+                ((u, v), {-1: dict(efeats)}) for u, v, efeats in nx_g.edges.data()
+            )
+
+        # Rebuild the interning table from the graph's nodes of types to contract
+        set_contract_ntype = para_graph_builder.set_contract_ntype
+        mapping_ntype_text_to_nid = para_graph_builder.mapping_ntype_text_to_nid
+        for nid, nfeats in nx_g.nodes.data():
+            ntype_value = nfeats.get(nfeat_ntype)
+            if ntype_value in set_contract_ntype:
+                mapping_ntype_text_to_nid.setdefault(
+                    (ntype_value, nfeats.get(nfeat_text)), nid
+                )
+
+        return para_graph_builder
+
+    @property
+    def graph(self) -> Graph:  # type: ignore[no-any-unimported]
+        return self.nx_g
+
+    def add_elements(
+        self,
+        list_node_tuple: Iterable[Tuple[Any, Dict[str, Any]]],
+        list_edge_tuple: Iterable[Tuple[Any, Any, Dict[str, Any]]],
+    ) -> Dict[Any, int]:
+        with self.metrics.time_stage("graph_build"):
+            return self._add_elements(
+                list_node_tuple=list_node_tuple,
+                list_edge_tuple=list_edge_tuple,
+                needs_encoding=self.vocab is not None,
+            )
+
+    def _add_elements(
+        self,
+        list_node_tuple: Iterable[Tuple[Any, Dict[str, Any]]],
+        list_edge_tuple: Iterable[Tuple[Any, Any, Dict[str, Any]]],
+        needs_encoding: bool,
+    ) -> Dict[Any, int]:
+        vocab = self.vocab
+        if needs_encoding and vocab is not None:
+            list_node_tuple = (
+                (local_nid, vocab.encode_node_feats(nfeats))
+                for local_nid, nfeats in list_node_tuple
+            )
+            list_edge_tuple = (
+                (local_u, local_v, vocab.encode_edge_feats(efeats))
+                for local_u, local_v, efeats in list_edge_tuple
+            )
+
+        nx_g = self.nx_g
+        mapping_ntype_text_to_nid = self.mapping_ntype_text_to_nid
+        set_contract_ntype = self.set_contract_ntype
+        nfeat_ntype, nfeat_text = self.nfeat_ntype, self.nfeat_text
+        n_node_before: int = len(nx_g)
+        next_nid_before: int = self.next_nid
+        next_nid: int = next_nid_before
+
+        # Map local node ids onto dense graph node ids, reusing the interned
+        # node for node types to contract and adding a new node otherwise
+        mapping_local_nid_to_nid: Dict[Any, int] = {}
+        mapping_ntype_to_n_contracted: Dict[Any, int] = {}
+        if self.track_references:
+            list_node_tuple = list(list_node_tuple)
+        for local_nid, nfeats in list_node_tuple:
+            ntype_value = nfeats.get(nfeat_ntype)
+            if ntype_value in set_contract_ntype:
+                key = (ntype_value, nfeats.get(nfeat_text))
+                nid = mapping_ntype_text_to_nid.get(key)
+                if nid is None:
+                    nid = next_nid
+                    next_nid += 1
+                    mapping_ntype_text_to_nid[key] = nid
+                    nx_g.add_node(nid, **nfeats)
+                else:
+                    mapping_ntype_to_n_contracted[ntype_value] = (
+                        mapping_ntype_to_n_contracted.get(ntype_value, 0) + 1
+                    )
+            else:
+                nid = next_nid
+                next_nid += 1
+                nx_g.add_node(nid, **nfeats)
+            mapping_local_nid_to_nid[local_nid] = nid
+        self.next_nid = next_nid
+
+        if self.track_references:
+            self._record_nodes(
+                list_node_tuple=[
+                    (mapping_local_nid_to_nid[local_nid], nfeats)
+                    for local_nid, nfeats in list_node_tuple
+                ]
+            )
+        if self.index is not None:
+            self.index.add_nodes(
+                (nid, nx_g.nodes[nid]) for nid in range(next_nid_before, next_nid)
+            )
+
+        n_edge_added = self._add_edges(
+            mapping_local_nid_to_nid=mapping_local_nid_to_nid,
+            list_edge_tuple=list_edge_tuple,
+        )
+
+        self._count_added(
+            n_node_added=len(nx_g) - n_node_before,
+            n_edge_added=n_edge_added,
+            mapping_ntype_to_n_contracted=mapping_ntype_to_n_contracted,
+        )
+
+        return mapping_local_nid_to_nid
+
+    def _count_added(
+        self,
+        n_node_added: int,
+        n_edge_added: int,
+        mapping_ntype_to_n_contracted: Dict[Any, int],
+    ) -> None:
+        metrics = self.metrics
+        if not metrics.enabled:
+            return
+        metrics.count("nodes_added", n_node_added)
+        metrics.count("edges_added", n_edge_added)
+        vocab = self.vocab
+        for ntype_value, n_contracted in mapping_ntype_to_n_contracted.items():
+            if vocab is not None:
+                ntype_value = vocab.lookup_ntype(ntype_value).value
+            metrics.count("contracted_nodes", n_contracted, ntype=str(ntype_value))
+
+    def _record_nodes(self, list_node_tuple: List[Tuple[int, Dict[str, Any]]]) -> None:
+        mapping_nid_to_record_nfeats = self.mapping_nid_to_record_nfeats
+        record_id = self.next_record_id
+        for nid, nfeats in list_node_tuple:
+            self.list_ref_nid.append(nid)
+            mapping_nid_to_record_nfeats.setdefault(nid, {}).setdefault(
+                record_id, nfeats
+            )
+
+    def _add_edges(
+        self,
+        mapping_local_nid_to_nid: Dict[Any, int],
+        list_edge_tuple: Iterable[Tuple[Any, Any, Dict[str, Any]]],
+    ) -> int:
+        # Keep the attributes of the first edge added between two nodes
+        nx_g = self.nx_g
+        n_edge_added: int = 0
+        records_edges: bool = self.track_references or self.index is not None
+        if records_edges:
+            list_edge_tuple = list(list_edge_tuple)
+        for local_u, local_v, efeats in list_edge_tuple:
+            u = mapping_local_nid_to_nid[local_u]
+            v = mapping_local_nid_to_nid[local_v]
+            if not nx_g.has_edge(u, v):
+                nx_g.add_edge(u, v, **efeats)
+                n_edge_added += 1
+
+        if records_edges:
+            self._record_edges(
+                list_edge_tuple=[
+                    (
+                        mapping_local_nid_to_nid[local_u],
+                        mapping_local_nid_to_nid[local_v],
+                        efeats,
+                    )
+                    for local_u, local_v, efeats in list_edge_tuple
+                ]
+            )
+
+        return n_edge_added
+
+    def _record_edges(
+        self, list_edge_tuple: List[Tuple[int, int, Dict[str, Any]]]
+    ) -> None:
+        # Edges already in the graph are indexed again under their kept type
+        if self.track_references:
+            mapping_edge_to_record_efeats = self.mapping_edge_to_record_efeats
+            record_id = self.next_record_id
+            for u, v, efeats in list_edge_tuple:
+                self.list_ref_edge.append((u, v))
+                mapping_edge_to_record_efeats.setdefault((u, v), {}).setdefault(
+                    record_id, efeats
+                )
+        if self.index is not None:
+            succ = self.nx_g.succ
+            self.index.add_edges((u, v, succ[u][v]) for u, v, _ in list_edge_tuple)
+
+    def add_edges(
+        self, list_edge_tuple: Iterable[Tuple[int, int, Dict[str, Any]]]
+    ) -> int:
+        # Add edges between nodes already in the graph, by their graph node ids
+        vocab = self.vocab
+        list_edge_tuple = [
+            (u, v, efeats if vocab is None else vocab.encode_edge_feats(efeats))
+            for u, v, efeats in list_edge_tuple
+        ]
+        mapping_nid_to_nid: Dict[Any, int] = {
+            nid: nid for u, v, _ in list_edge_tuple for nid in (u, v)
+        }
+
+        with self.metrics.time_stage("graph_build"):
+            n_edge_added = self._add_edges(
+                mapping_local_nid_to_nid=mapping_nid_to_nid,
+                list_edge_tuple=list_edge_tuple,
+            )
+        self.metrics.count("edges_added", n_edge_added)
+
+        return n_edge_added
+
+    def take_references(self) -> ReferenceRecord:
+        # Count the references added since the last call and hand them over
+        mapping_nid_to_n_ref = self.mapping_nid_to_n_ref
+        for nid in self.list_ref_nid:
+            mapping_nid_to_n_ref[nid] = mapping_nid_to_n_ref.get(nid, 0) + 1
+        mapping_edge_to_n_ref = self.mapping_edge_to_n_ref
+        for edge in self.list_ref_edge:
+            mapping_edge_to_n_ref[edge] = mapping_edge_to_n_ref.get(edge, 0) + 1
+
+        reference_record = ReferenceRecord(
+            record_id=self.next_record_id,
+            arr_nid=np.array(self.list_ref_nid, dtype=np.int64),
+            arr_edge=np.array(self.list_ref_edge, dtype=np.int64).reshape(-1, 2),
+        )
+        self.list_ref_nid, self.list_ref_edge = [], []
+        self.next_record_id += 1
+
+        return reference_record
+
+    @staticmethod
+    def _remove_record_feats(
+        mapping_record_feats: Dict[int, Dict[str, Any]], record_id: int
+    ) -> Optional[Dict[str, Any]]:
+        # Attributes of the first remaining record, when the removed record was
+        # the first one and so brought the attributes held in the graph
+        is_first = next(iter(mapping_record_feats)) == record_id
+        del mapping_record_feats[record_id]
+
+        return next(iter(mapping_record_feats.values())) if is_first else None
+
+    def _restore_edge_feats(self, u: int, v: int, record_id: int) -> None:
+        efeats = self.nx_g.succ[u][v]
+        restored_efeats = self._remove_record_feats(
+            mapping_record_feats=self.mapping_edge_to_record_efeats[(u, v)],
+            record_id=record_id,
+        )
+        if restored_efeats is None or restored_efeats == efeats:
+            return
+        if self.index is not None:
+            self.index.remove_edge(u=u, v=v, efeats=efeats)
+            self.index.add_edges([(u, v, restored_efeats)])
+        efeats.clear()
+        efeats.update(restored_efeats)
+
+    def _restore_node_feats(self, nid: int, record_id: int) -> None:
+        # Contracted nodes keep their type and text, so the index is unchanged
+        restored_nfeats = self._remove_record_feats(
+            mapping_record_feats=self.mapping_nid_to_record_nfeats[nid],
+            record_id=record_id,
+        )
+        if restored_nfeats is not None:
+            nfeats = self.nx_g.nodes[nid]
+            nfeats.clear()
+            nfeats.update(restored_nfeats)
+
+    def remove_references(self, reference_record: ReferenceRecord) -> Tuple[int, int]:
+        # Drop edges and then nodes no longer referenced by any element, and
+        # restore the attributes of those still referenced from the elements
+        # added first among the remaining ones
+        nx_g = self.nx_g
+        n_node_before, n_edge_before = len(nx_g), nx_g.number_of_edges()
+        record_id = reference_record.record_id
+
+        mapping_edge_to_n_ref = self.mapping_edge_to_n_ref
+        arr_unique_edge, arr_edge_n_ref = np.unique(
+            reference_record.arr_edge, axis=0, return_counts=True
+        )
+        for (u, v), n_ref in zip(arr_unique_edge.tolist(), arr_edge_n_ref.tolist()):
+            n_ref = mapping_edge_to_n_ref[(u, v)] - n_ref
+            if n_ref > 0:
+                mapping_edge_to_n_ref[(u, v)] = n_ref
+                self._restore_edge_feats(u=u, v=v, record_id=record_id)
+            else:
+                del mapping_edge_to_n_ref[(u, v)]
+                del self.mapping_edge_to_record_efeats[(u, v)]
+                if self.index is not None:
+                    self.index.remove_edge(u=u, v=v, efeats=nx_g.succ[u][v])
+                nx_g.remove_edge(u, v)
+
+        mapping_nid_to_n_ref = self.mapping_nid_to_n_ref
+        mapping_ntype_text_to_nid = self.mapping_ntype_text_to_nid
+        arr_unique_nid, arr_nid_n_ref = np.unique(
+            reference_record.arr_nid, return_counts=True
+        )
+        for nid, n_ref in zip(arr_unique_nid.tolist(), arr_nid_n_ref.tolist()):
+            n_ref = mapping_nid_to_n_ref[nid] - n_ref
+            if n_ref > 0:
+                mapping_nid_to_n_ref[nid] = n_ref
+                self._restore_node_feats(nid=nid, record_id=record_id)
+                continue
+            del mapping_nid_to_n_ref[nid]
+            del self.mapping_nid_to_record_nfeats[nid]
+            nfeats = nx_g.nodes[nid]
+            key = (nfeats.get(self.nfeat_ntype), nfeats.get(self.nfeat_text))
+            if mapping_ntype_text_to_nid.get(key) == nid:
+                del mapping_ntype_text_to_nid[key]
+            if self.index is not None:
+                self.index.remove_node(nid=nid, nfeats=nfeats)
+            nx_g.remove_node(nid)
+
+        return n_node_before - len(nx_g), n_edge_before - nx_g.number_of_edges()
+
+    def add_node_tuples_and_edge_tuples(
+        self, node_tuples: NodeTuples, edge_tuples: EdgeTuples
+    ) -> Dict[Any, int]:
+        return self.add_elements(
+            list_node_tuple=node_tuples.to_list_node_tuple(),
+            list_edge_tuple=edge_tuples.to_list_edge_tuple(),
+        )
+
+    def add_graph_arrays(self, graph_arrays: GraphArrays) -> Dict[Any, int]:
+        if self.vocab is None:
+            return self.add_elements(
+                list_node_tuple=graph_arrays.to_list_node_tuple(),
+                list_edge_tuple=graph_arrays.to_list_edge_tuple(),
+            )
+
+        # Intern whole text columns at once rather than node by node
+        string_table = self.vocab.string_table
+        with self.metrics.time_stage("graph_build"):
+            return self._add_elements(
+                list_node_tuple=graph_arrays.to_list_interned_node_tuple(
+                    string_table=string_table
+                ),
+                list_edge_tuple=graph_arrays.to_list_interned_edge_tuple(
+                    string_table=string_table
+                ),
+                needs_encoding=False,
+            )
+
+    def add_node_columns_and_edge_columns(
+        self, node_columns: NodeColumns, edge_columns: EdgeColumns
+    ) -> Dict[Any, int]:
+        mapping_position_to_nid = self.add_graph_arrays(
+            graph_arrays=columns_to_graph_arrays(
+                node_columns=node_columns, edge_columns=edge_columns
+            )
+        )
+        if node_columns.has_dense_ids:
+            return mapping_position_to_nid
+
+        return dict(
+            zip(node_columns.node_id.tolist(), mapping_position_to_nid.values())
+        )
+
+    def add_graph(  # type: ignore[no-any-unimported]
+        self, nx_g: Graph
+    ) -> Dict[Any, int]:
+        return self.add_elements(
+            list_node_tuple=nx_g.nodes.data(), list_edge_tuple=nx_g.edges.data()
+        )
@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+import json
+import struct
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .linguistic_graph_arrays import (
+    DICT_ETYPE_CODE,
+    DICT_ETYPE_VALUE_CODE,
+    DICT_NTYPE_CODE,
+    DICT_NTYPE_VALUE_CODE,
+    LIST_ETYPE,
+    LIST_NTYPE,
+    GraphArrays,
+    StringTable,
+)
+from .linguistic_graph_edges import BaseEdgeFeats, EdgeTuple, EdgeTuples
+from .linguistic_graph_nodes import (
+    BaseNodeFeats,
+    NodeTuple,
+    NodeTuples,
+    TokenNodeFeats,
+)
+
+# Binary layout: a magic tag and row count, fixed width columns from the widest
+# type down, then text as ids into a table of distinct strings
+NODE_COLUMNS_MAGIC: bytes = b"HYNC"
+EDGE_COLUMNS_MAGIC: bytes = b"HYEC"
+COLUMNS_HEADER = struct.Struct("<4sQ")
+
+
+def _texts_to_bytes(arr_text: np.ndarray) -> bytes:
+    # Each distinct string is encoded once and rows refer to it by id
+    string_table = StringTable()
+    arr_text_id = string_table.intern_many(arr_text.tolist())
+    list_encoded = [string.encode("utf-8") for string in string_table.list_string]
+
+    return b"".join(
+        [
+            arr_text_id.astype("<i4").tobytes(),
+            struct.pack("<Q", len(list_encoded)),
+            np.fromiter(map(len, list_encoded), dtype="<u4").tobytes(),
+            *list_encoded,
+        ]
+    )
+
+
+def _texts_from_bytes(buffer: bytes, offset: int, n_row: int) -> np.ndarray:
+    arr_text_id = np.frombuffer(buffer, dtype="<i4", count=n_row, offset=offset)
+    offset += arr_text_id.nbytes
+    (n_string,) = struct.unpack_from("<Q", buffer, offset)
+    offset += 8
+    arr_length = np.frombuffer(buffer, dtype="<u4", count=n_string, offset=offset)
+    offset += arr_length.nbytes
+
+    list_string: List[str] = []
+    for length in arr_length.tolist():
+        list_string.append(buffer[offset : offset + length].decode("utf-8"))
+        offset += length
+    arr_string = np.empty(n_string, dtype=object)
+    arr_string[:] = list_string
+
+    arr_text: np.ndarray = arr_string[arr_text_id]
+
+    return arr_text
+
+
+def _columns_from_bytes(
+    buffer: bytes, magic: bytes, list_dtype: List[str]
+) -> Tuple[List[np.ndarray], np.ndarray]:
+    buffer_magic, n_row = COLUMNS_HEADER.unpack_from(buffer, 0)
+    if buffer_magic != magic:
+        raise ValueError(f"Buffer starts with {buffer_magic!r} instead of {magic!r}")
+
+    # Fixed width columns are read in place without copying
+    offset: int = COLUMNS_HEADER.size
+    list_arr: List[np.ndarray] = []
+    for dtype in list_dtype:
+        arr = np.frombuffer(buffer, dtype=dtype, count=n_row, offset=offset)
+        list_arr.append(arr)
+        offset += arr.nbytes
+
+    return list_arr, _texts_from_bytes(buffer=buffer, offset=offset, n_row=n_row)
+
+
+def _object_array(list_value: List[Any]) -> np.ndarray:
+    arr = np.empty(len(list_value), dtype=object)
+    arr[:] = list_value
+
+    return arr
+
+
+@dataclass
+class NodeColumns:
+    # One row per node as parallel columns, with a position id of -1 for
+    # nodes other than tokens
+    node_id: np.ndarray
+    node_ntype: np.ndarray
+    node_text: np.ndarray
+    node_position_id: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.node_id.shape[0])
+
+    @property
+    def has_dense_ids(self) -> bool:
+        return bool(np.array_equal(self.node_id, np.arange(len(self))))
+
+    @classmethod
+    def from_node_tuples(cls, node_tuples: NodeTuples) -> NodeColumns:
+        list_node_tuple = node_tuples.list_node_tuple
+
+        return cls(
+            node_id=np.fromiter(
+                (node_tuple.node_id for node_tuple in list_node_tuple), dtype=np.int64
+            ),
+            node_ntype=np.fromiter(
+                (
+                    DICT_NTYPE_CODE[node_tuple.node_feats.ntype]
+                    for node_tuple in list_node_tuple
+                ),
+                dtype=np.int8,
+            ),
+            node_text=_object_array(
+                [node_tuple.node_feats.text for node_tuple in list_node_tuple]
+            ),
+            node_position_id=np.fromiter(
+                (
+                    getattr(node_tuple.node_feats, "position_id", -1)
+                    for node_tuple in list_node_tuple
+                ),
+                dtype=np.int64,
+            ),
+        )
+
+    def to_node_tuples(self) -> NodeTuples:
+        # Dataclass view of the columns for code using the element API
+        list_node_tuple: List[NodeTuple] = []
+        for node_id, ntype_code, text, position_id in zip(
+            self.node_id.tolist(),
+            self.node_ntype.tolist(),
+            self.node_text.tolist(),
+            self.node_position_id.tolist(),
+        ):
+            node_feats = (
+                BaseNodeFeats(ntype=LIST_NTYPE[ntype_code], text=text)
+                if position_id < 0
+                else TokenNodeFeats(
+                    ntype=LIST_NTYPE[ntype_code], text=text, position_id=position_id
+                )
+            )
+            list_node_tuple.append(NodeTuple(node_id=node_id, node_feats=node_feats))
+
+        return NodeTuples(list_node_tuple=list_node_tuple)
+
+    def to_json(self) -> str:
+        arr_ntype_value = np.array([ntype.value for ntype in LIST_NTYPE], dtype=object)
+
+        return json.dumps(
+            {
+                "node_id": self.node_id.tolist(),
+                "ntype": arr_ntype_value[self.node_ntype].tolist(),
+                "text": self.node_text.tolist(),
+                "position_id": self.node_position_id.tolist(),
+            },
+            ensure_ascii=False,
+        )
+
+    @classmethod
+    def from_json(cls, s: str) -> NodeColumns:
+        record: Dict[str, List[Any]] = json.loads(s)
+
+        return cls(
+            node_id=np.array(record["node_id"], dtype=np.int64),
+            node_ntype=np.array(
+                [DICT_NTYPE_VALUE_CODE[value] for value in record["ntype"]],
+                dtype=np.int8,
+            ),
+            node_text=_object_array(record["text"]),
+            node_position_id=np.array(record["position_id"], dtype=np.int64),
+        )
+
+    def to_bytes(self) -> bytes:
+        return b"".join(
+            [
+                COLUMNS_HEADER.pack(NODE_COLUMNS_MAGIC, len(self)),
+                self.node_id.astype("<i8").tobytes(),
+                self.node_position_id.astype("<i8").tobytes(),
+                self.node_ntype.astype("<i1").tobytes(),
+                _texts_to_bytes(arr_text=self.node_text),
+            ]
+        )
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes) -> NodeColumns:
+        (node_id, node_position_id, node_ntype), node_text = _columns_from_bytes(
+            buffer=buffer, magic=NODE_COLUMNS_MAGIC, list_dtype=["<i8", "<i8", "<i1"]
+        )
+
+        return cls(
+            node_id=node_id,
+            node_ntype=node_ntype,
+            node_text=node_text,
+            node_position_id=node_position_id,
+        )
+
+
+@dataclass
+class EdgeColumns:
+    # One row per edge as parallel columns of node ids, edge type and text
+    edge_src: np.ndarray
+    edge_dst: np.ndarray
+    edge_etype: np.ndarray
+    edge_text: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.edge_src.shape[0])
+
+    @classmethod
+    def from_edge_tuples(cls, edge_tuples: EdgeTuples) -> EdgeColumns:
+        list_edge_tuple = edge_tuples.list_edge_tuple
+
+        return cls(
+            edge_src=np.fromiter(
+                (edge_tuple.src_id for edge_tuple in list_edge_tuple), dtype=np.int64
+            ),
+            edge_dst=np.fromiter(
+                (edge_tuple.dst_id for edge_tuple in list_edge_tuple), dtype=np.int64
+            ),
+            edge_etype=np.fromiter(
+                (
+                    DICT_ETYPE_CODE[edge_tuple.edge_feats.etype]
+                    for edge_tuple in list_edge_tuple
+                ),
+                dtype=np.int8,
+            ),
+            edge_text=_object_array(
+                [edge_tuple.edge_feats.text for edge_tuple in list_edge_tuple]
+            ),
+        )
+
+    def to_edge_tuples(self) -> EdgeTuples:
+        return EdgeTuples(
+            list_edge_tuple=[
+                EdgeTuple(
+                    src_id=src_id,
+                    dst_id=dst_id,
+                    edge_feats=BaseEdgeFeats(etype=LIST_ETYPE[etype_code], text=text),
+                )
+                for src_id, dst_id, etype_code, text in zip(
+                    self.edge_src.tolist(),
+                    self.edge_dst.tolist(),
+                    self.edge_etype.tolist(),
+                    self.edge_text.tolist(),
+                )
+            ]
+        )
+
+    def to_json(self) -> str:
+        arr_etype_value = np.array([etype.value for etype in LIST_ETYPE], dtype=object)
+
+        return json.dumps(
+            {
+                "src_id": self.edge_src.tolist(),
+                "dst_id": self.edge_dst.tolist(),
+                "etype": arr_etype_value[self.edge_etype].tolist(),
+                "text": self.edge_text.tolist(),
+            },
+            ensure_ascii=False,
+        )
+
+    @classmethod
+    def from_json(cls, s: str) -> EdgeColumns:
+        record: Dict[str, List[Any]] = json.loads(s)
+
+        return cls(
+            edge_src=np.array(record["src_id"], dtype=np.int64),
+            edge_dst=np.array(record["dst_id"], dtype=np.int64),
+            edge_etype=np.array(
+                [DICT_ETYPE_VALUE_CODE[value] for value in record["etype"]],
+                dtype=np.int8,
+            ),
+            edge_text=_object_array(record["text"]),
+        )
+
+    def to_bytes(self) -> bytes:
+        return b"".join(
+            [
+                COLUMNS_HEADER.pack(EDGE_COLUMNS_MAGIC, len(self)),
+                self.edge_src.astype("<i8").tobytes(),
+                self.edge_dst.astype("<i8").tobytes(),
+                self.edge_etype.astype("<i1").tobytes(),
+                _texts_to_bytes(arr_text=self.edge_text),
+            ]
+        )
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes) -> EdgeColumns:
+        (edge_src, edge_dst, edge_etype), edge_text = _columns_from_bytes(
+            buffer=buffer, magic=EDGE_COLUMNS_MAGIC, list_dtype=["<i8", "<i8", "<i1"]
+        )
+
+        return cls(
+            edge_src=edge_src,
+            edge_dst=edge_dst,
+            edge_etype=edge_etype,
+            edge_text=edge_text,
+        )
+
+
+def columns_to_graph_arrays(
+    node_columns: NodeColumns, edge_columns: EdgeColumns
+) -> GraphArrays:
+    # Columns are shared as they are when node ids already equal row positions,
+    # otherwise edge endpoints are mapped from node ids to row positions
+    edge_src, edge_dst = edge_columns.edge_src, edge_columns.edge_dst
+    if not node_columns.has_dense_ids:
+        arr_order = np.argsort(node_columns.node_id, kind="stable")
+        arr_sorted_id = node_columns.node_id[arr_order]
+        edge_src = arr_order[np.searchsorted(arr_sorted_id, edge_src)]
+        edge_dst = arr_order[np.searchsorted(arr_sorted_id, edge_dst)]
+
+    return GraphArrays(
+        node_ntype=node_columns.node_ntype,
+        node_text=node_columns.node_text,
+        node_position_id=node_columns.node_position_id,
+        edge_src=edge_src,
+        edge_dst=edge_dst,
+        edge_etype=edge_columns.edge_etype,
+        edge_text=edge_columns.edge_text,
+    )
+
+
+def graph_arrays_to_columns(
+    graph_arrays: GraphArrays,
+) -> Tuple[NodeColumns, EdgeColumns]:
+    # Node ids of graph arrays are implicit, so they become row positions
+    return (
+        NodeColumns(
+            node_id=np.arange(graph_arrays.n_nodes, dtype=np.int64),
+            node_ntype=graph_arrays.node_ntype,
+            node_text=graph_arrays.node_text,
+            node_position_id=graph_arrays.node_position_id,
+        ),
+        EdgeColumns(
+            edge_src=graph_arrays.edge_src,
+            edge_dst=graph_arrays.edge_dst,
+            edge_etype=graph_arrays.edge_etype,
+            edge_text=graph_arrays.edge_text,
+        ),
+    )
@@ -3,3 +3,13 @@ from enum import Enum, auto
 
 class NetworkXGraphType(Enum):
     digraph = auto()
+    csr = auto()
+
+
+class CorpusFormat(Enum):
+    # Paragraphs separated by blank lines
+    text = auto()
+    # One paragraph per line
+    lines = auto()
+    # One json object per line holding a paragraph in a text field
+    jsonl = auto()
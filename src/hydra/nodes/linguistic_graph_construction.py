@@ -1,15 +1,28 @@
 from __future__ import annotations
 
-from logging import Logger
-from typing import Dict, List, Set, Tuple
+from logging import DEBUG, Logger
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-import networkx as nx
+import numpy as np
 from networkx import DiGraph, Graph
-from networkx_query import search_nodes
-from spacy.language import Language
-from spacy.tokens import Span
 
+from .linguistic_graph_arrays import DICT_ETYPE_CODE, DICT_NTYPE_CODE, GraphArrays
+from .linguistic_graph_builder import ParaGraphBuilder
+from .linguistic_graph_columns import EdgeColumns, NodeColumns, columns_to_graph_arrays
 from .linguistic_graph_config import NetworkXGraphType
+from .linguistic_graph_csr import CSRGraph
 from .linguistic_graph_edges import (
     BaseEdgeFeats,
     DependencyLabel,
@@ -17,6 +30,7 @@ from .linguistic_graph_edges import (
     EdgeTuples,
     EdgeType,
 )
+from .linguistic_graph_index import GraphIndex
 from .linguistic_graph_nodes import (
     BaseNodeFeats,
     NamedEntityLabel,
@@ -26,19 +40,32 @@ from .linguistic_graph_nodes import (
     TokenNodeFeats,
     UniversalPOSTag,
 )
-from .utils import group_dict_key_by_value
+from .linguistic_graph_schema import (
+    FULL_GRAPH_SCHEMA,
+    GraphSchema,
+    get_spacy_pipes_to_disable,
+)
+from .linguistic_graph_vocab import GraphVocab
+from .pipeline_metrics import NULL_PIPELINE_METRICS, PipelineMetrics
+from .sent_graph_memo import SentGraphMemo
+from .spacy_length_batching import SpacyLengthBatcher
+from .spacy_parse_cache import SpacyParseCache
 
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens import Doc, Span
 
-def collect_sent_graph_elements_from_spacy(
-    sent: Span, logger: Logger
-) -> Tuple[NodeTuples, EdgeTuples]:
+
+def _collect_sent_node_tuples(
+    sent: Span, schema: GraphSchema, position_offset: int = 0
+) -> Tuple[NodeTuples, Optional[int], Dict[int, int], Dict[int, int], Dict[int, int]]:
     # Initiate result variable
     node_tuples = NodeTuples(list_node_tuple=[])
-    edge_tuples = EdgeTuples(list_edge_tuple=[])
 
     # Initiate mappings from token indices in the sentence to node ids
+    sent_nid: Optional[int] = None
     mapping_token_i_to_token_nid: Dict[int, int] = {}
-    mapping_ent_id_to_ner_nid: Dict[int, int] = {}
+    mapping_ent_start_to_ner_nid: Dict[int, int] = {}
     mapping_token_i_to_uni_pos_nid: Dict[int, int] = {}
 
     # Initiate a counter for node ids
@@ -46,105 +73,142 @@ def collect_sent_graph_elements_from_spacy(
 
     #
     # Parse sentence level spacy output into nodes
+    #
 
     # Collect a sentence node
-    sent_node_feats = BaseNodeFeats(ntype=NodeType.sentence, text=sent.text)
-    sent_node_tuple = NodeTuple(node_id=curr_nid, node_feats=sent_node_feats)
+    if schema.has_ntype(NodeType.sentence):
+        sent_node_feats = BaseNodeFeats(ntype=NodeType.sentence, text=sent.text)
+        sent_node_tuple = NodeTuple(node_id=curr_nid, node_feats=sent_node_feats)
 
-    curr_nid += 1
+        node_tuples.list_node_tuple.append(sent_node_tuple)
+        sent_nid = curr_nid
+        curr_nid += 1
 
     # Collect ner nodes
-    ner_node_tuples = NodeTuples(list_node_tuple=[])
-    set_ner: Set[str] = set()
-    for ent in sent.ents:
-        # Populate mapping from spacy ner id to ner node id
-        mapping_ent_id_to_ner_nid.update({ent.ent_id: curr_nid})
-
-        ner_node_feats = BaseNodeFeats(
-            ntype=NodeType.ner, text=NamedEntityLabel(ent.label_).value
-        )
-        ner_node_tuple = NodeTuple(node_id=curr_nid, node_feats=ner_node_feats)
+    if schema.has_ntype(NodeType.ner):
+        for ent in sent.ents:
+            # Populate mapping from spacy entity start to ner node id
+            mapping_ent_start_to_ner_nid.update({ent.start: curr_nid})
 
-        ner_node_tuples.list_node_tuple.append(ner_node_tuple)
-        set_ner.add(ent.label_)
-        curr_nid += 1
+            ner_node_feats = BaseNodeFeats(
+                ntype=NodeType.ner, text=NamedEntityLabel(ent.label_).value
+            )
+            ner_node_tuple = NodeTuple(node_id=curr_nid, node_feats=ner_node_feats)
+
+            node_tuples.list_node_tuple.append(ner_node_tuple)
+            curr_nid += 1
 
     #
     # Parse token level spacy output into nodes
     #
 
+    has_token: bool = schema.has_ntype(NodeType.token)
+    has_uni_pos: bool = schema.has_ntype(NodeType.uni_pos)
+
     token_node_tuples = NodeTuples(list_node_tuple=[])
     uni_pos_node_tuples = NodeTuples(list_node_tuple=[])
-    set_uni_pos: Set[str] = set()
     for token in sent:
-        mapping_token_i_to_token_nid.update({token.i: curr_nid})
+        if has_token:
+            mapping_token_i_to_token_nid.update({token.i: curr_nid})
+
+            # Collect a token node
+            token_node_feats = TokenNodeFeats(
+                ntype=NodeType.token,
+                text=token.text,
+                position_id=position_offset + token.i,
+            )
+            token_node_tuple = NodeTuple(node_id=curr_nid, node_feats=token_node_feats)
 
-        # Collect a token node
-        token_node_feats = TokenNodeFeats(
-            ntype=NodeType.token, text=token.text, position_id=token.i
-        )
-        token_node_tuple = NodeTuple(node_id=curr_nid, node_feats=token_node_feats)
+            token_node_tuples.list_node_tuple.append(token_node_tuple)
+            curr_nid += 1
 
-        token_node_tuples.list_node_tuple.append(token_node_tuple)
+        if has_uni_pos:
+            mapping_token_i_to_uni_pos_nid.update({token.i: curr_nid})
 
-        curr_nid += 1
+            # Collect the token node's universal part-of-speech node
+            uni_pos_feats = BaseNodeFeats(
+                ntype=NodeType.uni_pos, text=UniversalPOSTag(token.pos_.upper()).value
+            )
+            uni_pos_tuple = NodeTuple(node_id=curr_nid, node_feats=uni_pos_feats)
 
-        mapping_token_i_to_uni_pos_nid.update({token.i: curr_nid})
+            uni_pos_node_tuples.list_node_tuple.append(uni_pos_tuple)
+            curr_nid += 1
 
-        # Collect the token node's universal part-of-speech node
-        uni_pos_feats = BaseNodeFeats(
-            ntype=NodeType.uni_pos, text=UniversalPOSTag(token.pos_.upper()).value
-        )
-        uni_pos_tuple = NodeTuple(node_id=curr_nid, node_feats=uni_pos_feats)
+    node_tuples.list_node_tuple.extend(token_node_tuples.list_node_tuple)
+    node_tuples.list_node_tuple.extend(uni_pos_node_tuples.list_node_tuple)
+
+    return (
+        node_tuples,
+        sent_nid,
+        mapping_ent_start_to_ner_nid,
+        mapping_token_i_to_token_nid,
+        mapping_token_i_to_uni_pos_nid,
+    )
 
-        uni_pos_node_tuples.list_node_tuple.append(uni_pos_tuple)
-        set_uni_pos.add(token.pos_)
-        curr_nid += 1
 
+def _collect_sent_edge_tuples(
+    sent: Span,
+    schema: GraphSchema,
+    sent_nid: Optional[int],
+    mapping_ent_start_to_ner_nid: Dict[int, int],
+    mapping_token_i_to_token_nid: Dict[int, int],
+    mapping_token_i_to_uni_pos_nid: Dict[int, int],
+) -> EdgeTuples:
     #
     # Parse sentence level spacy output into edges
     #
 
     token_to_ner_tuples = EdgeTuples(list_edge_tuple=[])
-    for ent in sent.ents:
-        for token in ent:
-            # Collect a token-to-ner edge
-            token_to_ner_feats = BaseEdgeFeats(etype=EdgeType.token_to_ner, text="")
-            token_to_ner_tuple = EdgeTuple(
-                src_id=mapping_token_i_to_token_nid[token.i],
-                dst_id=mapping_ent_id_to_ner_nid[ent.ent_id],
-                edge_feats=token_to_ner_feats,
-            )
-            token_to_ner_tuples.list_edge_tuple.append(token_to_ner_tuple)
+    if schema.has_etype(EdgeType.token_to_ner):
+        for ent in sent.ents:
+            for token in ent:
+                # Collect a token-to-ner edge
+                token_to_ner_feats = BaseEdgeFeats(etype=EdgeType.token_to_ner, text="")
+                token_to_ner_tuple = EdgeTuple(
+                    src_id=mapping_token_i_to_token_nid[token.i],
+                    dst_id=mapping_ent_start_to_ner_nid[ent.start],
+                    edge_feats=token_to_ner_feats,
+                )
+                token_to_ner_tuples.list_edge_tuple.append(token_to_ner_tuple)
 
     #
     # Parse token level spacy output into edges
     #
 
+    has_token_to_sent: bool = schema.has_etype(EdgeType.token_to_sent)
+    has_token_to_uni_pos: bool = schema.has_etype(EdgeType.token_to_uni_pos)
+    has_dependency_arc: bool = schema.has_etype(EdgeType.dependency_arc)
+
     token_to_sent_tuples = EdgeTuples(list_edge_tuple=[])
     token_to_uni_pos_tuples = EdgeTuples(list_edge_tuple=[])
     dependency_arc_tuples = EdgeTuples(list_edge_tuple=[])
     for token in sent:
         # Collect a token-to-sent edge
-        token_to_sent_feats = BaseEdgeFeats(etype=EdgeType.token_to_sent, text="")
-        token_to_sent_tuple = EdgeTuple(
-            src_id=mapping_token_i_to_token_nid[token.i],
-            dst_id=sent_node_tuple.node_id,
-            edge_feats=token_to_sent_feats,
-        )
+        if has_token_to_sent and sent_nid is not None:
+            token_to_sent_feats = BaseEdgeFeats(etype=EdgeType.token_to_sent, text="")
+            token_to_sent_tuple = EdgeTuple(
+                src_id=mapping_token_i_to_token_nid[token.i],
+                dst_id=sent_nid,
+                edge_feats=token_to_sent_feats,
+            )
 
-        token_to_sent_tuples.list_edge_tuple.append(token_to_sent_tuple)
+            token_to_sent_tuples.list_edge_tuple.append(token_to_sent_tuple)
 
         # Collect a token-to-uni-pos edge
-        token_to_uni_pos_feats = BaseEdgeFeats(etype=EdgeType.token_to_uni_pos, text="")
-        token_to_uni_pos_tuple = EdgeTuple(
-            src_id=mapping_token_i_to_token_nid[token.i],
-            dst_id=mapping_token_i_to_uni_pos_nid[token.i],
-            edge_feats=token_to_uni_pos_feats,
-        )
+        if has_token_to_uni_pos:
+            token_to_uni_pos_feats = BaseEdgeFeats(
+                etype=EdgeType.token_to_uni_pos, text=""
+            )
+            token_to_uni_pos_tuple = EdgeTuple(
+                src_id=mapping_token_i_to_token_nid[token.i],
+                dst_id=mapping_token_i_to_uni_pos_nid[token.i],
+                edge_feats=token_to_uni_pos_feats,
+            )
 
-        token_to_uni_pos_tuples.list_edge_tuple.append(token_to_uni_pos_tuple)
+            token_to_uni_pos_tuples.list_edge_tuple.append(token_to_uni_pos_tuple)
 
+        if not has_dependency_arc:
+            continue
         for child in token.children:
             # Collect a dependency-arc edge
             dependency_arc_feats = BaseEdgeFeats(
@@ -160,36 +224,321 @@ def collect_sent_graph_elements_from_spacy(
             dependency_arc_tuples.list_edge_tuple.append(dependency_arc_tuple)
 
     #
-    # Collect all node tuples and edge tuples
+    # Collect all edge tuples
     #
 
-    node_tuples.list_node_tuple.append(sent_node_tuple)
-    node_tuples.list_node_tuple.extend(ner_node_tuples.list_node_tuple)
-    node_tuples.list_node_tuple.extend(token_node_tuples.list_node_tuple)
-    node_tuples.list_node_tuple.extend(uni_pos_node_tuples.list_node_tuple)
-
+    edge_tuples = EdgeTuples(list_edge_tuple=[])
     edge_tuples.list_edge_tuple.extend(token_to_ner_tuples.list_edge_tuple)
     edge_tuples.list_edge_tuple.extend(token_to_sent_tuples.list_edge_tuple)
     edge_tuples.list_edge_tuple.extend(token_to_uni_pos_tuples.list_edge_tuple)
     edge_tuples.list_edge_tuple.extend(dependency_arc_tuples.list_edge_tuple)
 
-    logger.debug(
-        f"Parsed {len(node_tuples.list_node_tuple)} node tuples "
-        f"and {len(edge_tuples.list_edge_tuple)} edge tuples "
-        f" from span of length {len(sent.text)} "
-        f"whose span id is {sent.id} and whose parent "
-        f"doc object's text field is of size {len(sent.doc.text)}"
+    return edge_tuples
+
+
+def collect_sent_graph_elements_from_spacy(
+    sent: Span,
+    logger: Logger,
+    schema: Optional[GraphSchema] = None,
+    position_offset: int = 0,
+) -> Tuple[NodeTuples, EdgeTuples]:
+    schema = FULL_GRAPH_SCHEMA if schema is None else schema
+
+    (
+        node_tuples,
+        sent_nid,
+        mapping_ent_start_to_ner_nid,
+        mapping_token_i_to_token_nid,
+        mapping_token_i_to_uni_pos_nid,
+    ) = _collect_sent_node_tuples(
+        sent=sent, schema=schema, position_offset=position_offset
+    )
+
+    edge_tuples = _collect_sent_edge_tuples(
+        sent=sent,
+        schema=schema,
+        sent_nid=sent_nid,
+        mapping_ent_start_to_ner_nid=mapping_ent_start_to_ner_nid,
+        mapping_token_i_to_token_nid=mapping_token_i_to_token_nid,
+        mapping_token_i_to_uni_pos_nid=mapping_token_i_to_uni_pos_nid,
     )
 
+    # Only format the message when it is emitted, as rebuilding the parent doc's
+    # text for every sentence is quadratic in the doc length
+    if logger.isEnabledFor(DEBUG):
+        logger.debug(
+            f"Parsed {len(node_tuples.list_node_tuple)} node tuples "
+            f"and {len(edge_tuples.list_edge_tuple)} edge tuples "
+            f" from span of length {len(sent.text)} "
+            f"whose span id is {sent.id} and whose parent "
+            f"doc object's text field is of size {len(sent.doc.text)}"
+        )
+
     return node_tuples, edge_tuples
 
 
+def _decode_spacy_hashes(
+    arr_hash: np.ndarray, doc: Doc, normalise: Callable[[str], str]
+) -> np.ndarray:
+    # Look up and validate each distinct string once, then broadcast it back
+    arr_unique_hash, arr_inverse = np.unique(arr_hash, return_inverse=True)
+    arr_unique_text = np.array(
+        [normalise(doc.vocab.strings[h]) for h in arr_unique_hash.tolist()],
+        dtype=object,
+    )
+
+    arr_text: np.ndarray = arr_unique_text[arr_inverse.reshape(-1)]
+
+    return arr_text
+
+
+def collect_doc_graph_arrays_from_spacy(
+    doc: Doc,
+    logger: Logger,
+    schema: Optional[GraphSchema] = None,
+    position_offset: int = 0,
+) -> GraphArrays:
+    from spacy.attrs import DEP, ENT_IOB, ENT_TYPE, HEAD, ORTH, POS, SENT_START
+
+    schema = FULL_GRAPH_SCHEMA if schema is None else schema
+    has_sent = int(schema.has_ntype(NodeType.sentence))
+    has_ner = int(schema.has_ntype(NodeType.ner))
+    has_token = int(schema.has_ntype(NodeType.token))
+    has_uni_pos = int(schema.has_ntype(NodeType.uni_pos))
+
+    # Export token level spacy output as integer columns in one call
+    arr_attr = doc.to_array(
+        [ORTH, POS, DEP, HEAD, ENT_IOB, ENT_TYPE, SENT_START]
+    ).reshape(len(doc), 7)
+    arr_orth, arr_pos, arr_dep = arr_attr[:, 0], arr_attr[:, 1], arr_attr[:, 2]
+    arr_head_offset = arr_attr[:, 3].astype(np.int64)
+    arr_ent_iob, arr_ent_type = arr_attr[:, 4], arr_attr[:, 5]
+    arr_sent_start = arr_attr[:, 6].astype(np.int64) == 1
+
+    n_token: int = len(doc)
+    arr_token_i = np.arange(n_token, dtype=np.int64)
+    if n_token > 0:
+        arr_sent_start[0] = True
+
+    #
+    # Assign tokens and entities to sentences
+    #
+
+    arr_token_sent = np.cumsum(arr_sent_start) - 1
+    arr_sent_first_token = np.flatnonzero(arr_sent_start)
+    n_sent: int = int(arr_sent_first_token.shape[0])
+    arr_sent_n_token = np.bincount(arr_token_sent, minlength=n_sent)
+
+    # ENT_IOB is 3 for a token beginning an entity and 1 for one inside it
+    arr_ent_first_token = np.flatnonzero(arr_ent_iob == 3)
+    arr_is_ent_token = (arr_ent_iob == 3) | (arr_ent_iob == 1)
+    arr_token_ent = np.cumsum(arr_ent_iob == 3) - 1
+    arr_ent_sent = arr_token_sent[arr_ent_first_token]
+    n_ent: int = int(arr_ent_first_token.shape[0])
+    arr_sent_n_ent = np.bincount(arr_ent_sent, minlength=n_sent)
+    arr_sent_first_ent = np.cumsum(arr_sent_n_ent) - arr_sent_n_ent
+
+    #
+    # Lay out node ids sentence by sentence as the sentence collector does:
+    # a sentence node, its ner nodes, its token nodes, then its universal pos
+    # nodes, leaving out node types missing from the schema
+    #
+
+    arr_sent_n_node = (
+        has_sent
+        + has_ner * arr_sent_n_ent
+        + (has_token + has_uni_pos) * arr_sent_n_token
+    )
+    arr_sent_nid = np.cumsum(arr_sent_n_node) - arr_sent_n_node
+    n_node: int = int(arr_sent_n_node.sum())
+
+    arr_ner_nid = (
+        arr_sent_nid[arr_ent_sent]
+        + has_sent
+        + np.arange(n_ent, dtype=np.int64)
+        - arr_sent_first_ent[arr_ent_sent]
+    )
+    arr_token_nid = (
+        arr_sent_nid[arr_token_sent]
+        + has_sent
+        + has_ner * arr_sent_n_ent[arr_token_sent]
+        + arr_token_i
+        - arr_sent_first_token[arr_token_sent]
+    )
+    arr_uni_pos_nid = arr_token_nid + has_token * arr_sent_n_token[arr_token_sent]
+
+    node_ntype = np.empty(n_node, dtype=np.int8)
+    node_text = np.empty(n_node, dtype=object)
+    node_position_id = np.full(n_node, -1, dtype=np.int64)
+
+    if has_sent:
+        node_ntype[arr_sent_nid] = DICT_NTYPE_CODE[NodeType.sentence]
+        node_text[arr_sent_nid] = [
+            doc[start:end].text
+            for start, end in zip(
+                arr_sent_first_token.tolist(),
+                (arr_sent_first_token + arr_sent_n_token).tolist(),
+            )
+        ]
+    if has_ner:
+        node_ntype[arr_ner_nid] = DICT_NTYPE_CODE[NodeType.ner]
+        node_text[arr_ner_nid] = _decode_spacy_hashes(
+            arr_hash=arr_ent_type[arr_ent_first_token],
+            doc=doc,
+            normalise=lambda label: NamedEntityLabel(label).value,
+        )
+    if has_token:
+        node_ntype[arr_token_nid] = DICT_NTYPE_CODE[NodeType.token]
+        node_text[arr_token_nid] = _decode_spacy_hashes(
+            arr_hash=arr_orth, doc=doc, normalise=str
+        )
+        node_position_id[arr_token_nid] = position_offset + arr_token_i
+    if has_uni_pos:
+        node_ntype[arr_uni_pos_nid] = DICT_NTYPE_CODE[NodeType.uni_pos]
+        node_text[arr_uni_pos_nid] = _decode_spacy_hashes(
+            arr_hash=arr_pos,
+            doc=doc,
+            normalise=lambda pos: UniversalPOSTag(pos.upper()).value,
+        )
+
+    #
+    # Collect edges of every edge type as id columns
+    #
+
+    arr_ent_token_i = arr_token_i[arr_is_ent_token]
+
+    # Dependency arcs point from heads to children ordered by head then child,
+    # skipping sentence roots whose head offset is zero
+    arr_child_i = np.flatnonzero(arr_head_offset != 0)
+    arr_head_i = arr_child_i + arr_head_offset[arr_child_i]
+    arr_arc_order = np.lexsort((arr_child_i, arr_head_i))
+    arr_child_i, arr_head_i = arr_child_i[arr_arc_order], arr_head_i[arr_arc_order]
+
+    list_edge_part: List[Tuple[np.ndarray, np.ndarray, EdgeType, np.ndarray]] = [
+        part
+        for part in [
+            (
+                arr_token_nid[arr_ent_token_i],
+                arr_ner_nid[arr_token_ent[arr_ent_token_i]],
+                EdgeType.token_to_ner,
+                arr_token_sent[arr_ent_token_i],
+            ),
+            (
+                arr_token_nid,
+                arr_sent_nid[arr_token_sent],
+                EdgeType.token_to_sent,
+                arr_token_sent,
+            ),
+            (arr_token_nid, arr_uni_pos_nid, EdgeType.token_to_uni_pos, arr_token_sent),
+            (
+                arr_token_nid[arr_head_i],
+                arr_token_nid[arr_child_i],
+                EdgeType.dependency_arc,
+                arr_token_sent[arr_head_i],
+            ),
+        ]
+        if schema.has_etype(part[2])
+    ]
+
+    arr_empty = np.zeros(0, dtype=np.int64)
+    edge_src = np.concatenate(
+        [arr_empty] + [part[0] for part in list_edge_part]
+    ).astype(np.int64)
+    edge_dst = np.concatenate(
+        [arr_empty] + [part[1] for part in list_edge_part]
+    ).astype(np.int64)
+    edge_etype = np.concatenate(
+        [arr_empty]
+        + [np.full(len(part[0]), DICT_ETYPE_CODE[part[2]]) for part in list_edge_part]
+    ).astype(np.int8)
+    edge_text = np.full(edge_src.shape[0], "", dtype=object)
+    if schema.has_etype(EdgeType.dependency_arc):
+        # Dependency arcs are the last edges and the only ones holding text
+        edge_text[edge_src.shape[0] - arr_child_i.shape[0] :] = _decode_spacy_hashes(
+            arr_hash=arr_dep[arr_child_i],
+            doc=doc,
+            normalise=lambda dep: DependencyLabel(dep.upper()).value,
+        )
+
+    # Group edges by sentence, keeping edge type order within each sentence
+    arr_edge_order = np.argsort(
+        np.concatenate([arr_empty] + [part[3] for part in list_edge_part]),
+        kind="stable",
+    )
+
+    graph_arrays = GraphArrays(
+        node_ntype=node_ntype,
+        node_text=node_text,
+        node_position_id=node_position_id,
+        edge_src=edge_src[arr_edge_order],
+        edge_dst=edge_dst[arr_edge_order],
+        edge_etype=edge_etype[arr_edge_order],
+        edge_text=edge_text[arr_edge_order],
+    )
+
+    if logger.isEnabledFor(DEBUG):
+        logger.debug(
+            f"Collected {graph_arrays.n_nodes} nodes and {graph_arrays.n_edges} "
+            f"edges as arrays from {n_sent} sentences of a doc with {n_token} tokens"
+        )
+
+    return graph_arrays
+
+
+def build_graph_from_graph_arrays(  # type: ignore[no-any-unimported]
+    graph_arrays: GraphArrays,
+    logger: Logger,
+    graph_type: NetworkXGraphType = NetworkXGraphType.digraph,
+) -> Union[Graph, CSRGraph]:
+    # Build an array backed graph straight from the columns
+    if graph_type == NetworkXGraphType.csr:
+        csr_g = CSRGraph.from_graph_arrays(graph_arrays=graph_arrays)
+
+        logger.debug(
+            f"Constructed CSR graph with {csr_g.n_nodes} nodes "
+            f"and {csr_g.n_edges} edges from arrays"
+        )
+
+        return csr_g
+
+    # Initiate networkx graph
+    if graph_type == NetworkXGraphType.digraph:
+        nx_g = DiGraph()
+    else:
+        raise NotImplementedError(f"{graph_type} is not defined in its enum class")
+
+    # Populate the initialised graph
+    nx_g.add_nodes_from(nodes_for_adding=graph_arrays.to_list_node_tuple())
+    nx_g.add_edges_from(ebunch_to_add=graph_arrays.to_list_edge_tuple())
+
+    logger.debug(
+        f"Constructed networkx graph of type {nx_g.__class__} "
+        f"with {len(nx_g.nodes)} nodes and {len(nx_g.edges)} edges from arrays"
+    )
+
+    return nx_g
+
+
 def build_graph_from_node_tuples_and_edge_tuples(  # type: ignore[no-any-unimported]
     node_tuples: NodeTuples,
     edge_tuples: EdgeTuples,
     logger: Logger,
     graph_type: NetworkXGraphType = NetworkXGraphType.digraph,
-) -> Graph:
+) -> Union[Graph, CSRGraph]:
+    # Build an array backed graph with dense node ids following node order
+    if graph_type == NetworkXGraphType.csr:
+        csr_g = CSRGraph.from_elements(
+            list_node_tuple=node_tuples.to_list_node_tuple(),
+            list_edge_tuple=edge_tuples.to_list_edge_tuple(),
+        )
+
+        logger.debug(
+            f"Constructed CSR graph with {csr_g.n_nodes} nodes "
+            f"and {csr_g.n_edges} edges"
+        )
+
+        return csr_g
+
     # Initiate networkx graph
     if graph_type == NetworkXGraphType.digraph:
         nx_g = DiGraph()
@@ -208,135 +557,505 @@ def build_graph_from_node_tuples_and_edge_tuples(  # type: ignore[no-any-unimpor
     return nx_g
 
 
-def contract_ntype_nodes_by_identical_text(  # type: ignore[no-any-unimported]
+def contract_nodes_by_identical_text(  # type: ignore[no-any-unimported]
     nx_g: Graph,
-    ntype: NodeType,
+    list_ntype: List[NodeType],
     logger: Logger,
     nfeat_ntype: str = "ntype",
     nfeat_text: str = "text",
-    drop_nfeat_contraction: bool = True,
+    metrics: Optional[PipelineMetrics] = None,
+) -> Graph:
+    metrics = NULL_PIPELINE_METRICS if metrics is None else metrics
+
+    with metrics.time_stage("contraction"):
+        contracted_g = _contract_nodes_by_identical_text(
+            nx_g=nx_g,
+            list_ntype=list_ntype,
+            logger=logger,
+            nfeat_ntype=nfeat_ntype,
+            nfeat_text=nfeat_text,
+            metrics=metrics,
+        )
+
+    return contracted_g
+
+
+def _contract_nodes_by_identical_text(  # type: ignore[no-any-unimported]
+    nx_g: Graph,
+    list_ntype: List[NodeType],
+    logger: Logger,
+    nfeat_ntype: str,
+    nfeat_text: str,
+    metrics: PipelineMetrics,
 ) -> Graph:
     logger.debug(
         f"Pre contraction graph of type {nx_g.__class__} has "
         f"{len(nx_g.nodes)} nodes and {len(nx_g.edges)} edges"
     )
 
-    # Gather node ids of all nodes of a specific type
-    list_ntype_nid: List[int] = list(
-        search_nodes(graph=nx_g, query={"==": [(nfeat_ntype,), ntype.value]})
+    set_contract_ntype: Set[str] = {ntype.value for ntype in list_ntype}
+
+    # Initiate the contracted graph as an empty graph of the same class
+    contracted_g = nx_g.__class__()
+    contracted_g.graph.update(nx_g.graph)
+
+    # Map every node to the first node seen with the same node type and text,
+    # only keeping those representative nodes and their attributes
+    mapping_nid_to_rep_nid: Dict[Any, Any] = {}
+    mapping_ntype_text_to_rep_nid: Dict[Tuple[Any, Any], Any] = {}
+    mapping_ntype_to_n_contracted: Dict[Any, int] = {}
+    for nid, nfeats in nx_g.nodes.data():
+        ntype_value = nfeats.get(nfeat_ntype)
+        if ntype_value in set_contract_ntype:
+            rep_nid = mapping_ntype_text_to_rep_nid.setdefault(
+                (ntype_value, nfeats.get(nfeat_text)), nid
+            )
+        else:
+            rep_nid = nid
+        mapping_nid_to_rep_nid[nid] = rep_nid
+
+        if rep_nid == nid:
+            contracted_g.add_node(nid, **nfeats)
+        else:
+            mapping_ntype_to_n_contracted[ntype_value] = (
+                mapping_ntype_to_n_contracted.get(ntype_value, 0) + 1
+            )
+
+    logger.debug(
+        f"Identified {len(mapping_ntype_text_to_rep_nid)} groups of nodes "
+        f"of types {sorted(set_contract_ntype)} by identical text"
     )
 
+    # Redirect every edge onto representative nodes, keeping the attributes
+    # of the first edge seen between a pair of representative nodes
+    is_multigraph: bool = nx_g.is_multigraph()
+    for u, v, efeats in nx_g.edges.data():
+        rep_u, rep_v = mapping_nid_to_rep_nid[u], mapping_nid_to_rep_nid[v]
+        if is_multigraph or not contracted_g.has_edge(rep_u, rep_v):
+            contracted_g.add_edge(rep_u, rep_v, **efeats)
+
     logger.debug(
-        f"Identified {len(list_ntype_nid)} nodes of type {ntype.value} "
-        f"as candidates for contraction"
+        f"Contracted {len(nx_g.nodes) - len(contracted_g.nodes)} nodes into "
+        f"a graph with {len(contracted_g.nodes)} nodes "
+        f"and {len(contracted_g.edges)} edges"
     )
 
-    # Identify sets of node ids with identical text value
-    dict_nid_text: Dict[str, int] = nx.get_node_attributes(G=nx_g, name=nfeat_text)
-    dict_text_list_nid = group_dict_key_by_value(d_input=dict_nid_text)
+    if metrics.enabled:
+        for ntype_value, n_contracted in mapping_ntype_to_n_contracted.items():
+            metrics.count("contracted_nodes", n_contracted, ntype=str(ntype_value))
 
-    # Iteratively contract nodes based on the mapping above
-    n_contraction_group: int = 0
-    for list_nid in dict_text_list_nid.values():
-        if len(list_nid) == 1:
-            # No contraction for nodes with unique text
-            continue
-        else:
-            n_contraction_group += 1
-
-        for i in range(1, len(list_nid)):
-            nx_g = nx.contracted_nodes(
-                G=nx_g,
-                u=list_nid[0],
-                v=list_nid[i],
-                # the below argument needs to be false to avoid copying
-                copy=False,
-            )
+    return contracted_g
 
-    logger.debug(f"Contracted {n_contraction_group} groups of nodes by identical text")
 
-    if drop_nfeat_contraction:
-        n_nfeat_contraction: int = 0
-        n_efeat_contraction: int = 0
-        # Remove "contraction" as a node attribute added
-        for nid, feats in nx_g.nodes.data():
-            if "contraction" in feats.keys():
-                del nx_g.nodes[nid]["contraction"]
-                n_nfeat_contraction += 1
+def contract_ntype_nodes_by_identical_text(  # type: ignore[no-any-unimported]
+    nx_g: Graph,
+    ntype: NodeType,
+    logger: Logger,
+    nfeat_ntype: str = "ntype",
+    nfeat_text: str = "text",
+    metrics: Optional[PipelineMetrics] = None,
+) -> Graph:
+    return contract_nodes_by_identical_text(
+        nx_g=nx_g,
+        list_ntype=[ntype],
+        logger=logger,
+        nfeat_ntype=nfeat_ntype,
+        nfeat_text=nfeat_text,
+        metrics=metrics,
+    )
 
-        # Remove "contraction" as an edge attribute added
-        for u, v, efeats in nx_g.edges.data():
-            if "contraction" in efeats.keys():
-                del nx_g.edges[u, v]["contraction"]
-                n_efeat_contraction += 1
 
-        logger.debug(
-            f"Removed {n_nfeat_contraction} 'contraction' node attributes "
-            f"and {n_efeat_contraction} 'contraction' edge attributes "
-            f"from a graph with {len(nx_g.nodes)} nodes and {len(nx_g.edges)} edges"
+def contract_nodes_in_place_with_index(  # type: ignore[no-any-unimported]
+    nx_g: DiGraph,
+    graph_index: GraphIndex,
+    list_ntype: List[NodeType],
+    logger: Logger,
+    metrics: Optional[PipelineMetrics] = None,
+) -> DiGraph:
+    metrics = NULL_PIPELINE_METRICS if metrics is None else metrics
+
+    with metrics.time_stage("contraction"):
+        n_contracted = _contract_nodes_in_place_with_index(
+            nx_g=nx_g, graph_index=graph_index, list_ntype=list_ntype, metrics=metrics
         )
 
+    logger.debug(
+        f"Contracted {n_contracted} nodes of types {list_ntype} in place into "
+        f"a graph with {len(nx_g.nodes)} nodes and {len(nx_g.edges)} edges"
+    )
+
     return nx_g
 
 
-def parse_for_para_graph_with_spacy(  # type: ignore[no-any-unimported]
-    text: str, nlp: Language, logger: Logger
-) -> Graph:
-    logger.debug(
-        "Attempting to construct a graph from a text sequence " f"of length {len(text)}"
+def _contract_nodes_in_place_with_index(  # type: ignore[no-any-unimported]
+    nx_g: DiGraph,
+    graph_index: GraphIndex,
+    list_ntype: List[NodeType],
+    metrics: PipelineMetrics,
+) -> int:
+    # Only groups of nodes sharing a node type and text are visited, merging
+    # every node of a group into its first node along with its edges
+    set_contract_ntype: Set[str] = {ntype.value for ntype in list_ntype}
+    list_group = [
+        list(nids)
+        for (ntype_value, _), nids in graph_index.mapping_ntype_text_to_nids.items()
+        if ntype_value in set_contract_ntype and len(nids) > 1
+    ]
+
+    n_contracted: int = 0
+    for list_nid in list_group:
+        rep_nid = list_nid[0]
+        for nid in list_nid[1:]:
+            _merge_node_in_place(
+                nx_g=nx_g, graph_index=graph_index, nid=nid, rep_nid=rep_nid
+            )
+        n_contracted += len(list_nid) - 1
+        if metrics.enabled:
+            metrics.count(
+                "contracted_nodes",
+                len(list_nid) - 1,
+                ntype=str(nx_g.nodes[rep_nid].get(graph_index.nfeat_ntype)),
+            )
+
+    return n_contracted
+
+
+def _merge_node_in_place(  # type: ignore[no-any-unimported]
+    nx_g: DiGraph, graph_index: GraphIndex, nid: int, rep_nid: int
+) -> None:
+    # Redirect edges onto the representative node, keeping its own edges
+    # where both have an edge to the same node
+    list_edge_tuple = [(nid, v, efeats) for v, efeats in nx_g.succ[nid].items()] + [
+        (u, nid, efeats) for u, efeats in nx_g.pred[nid].items() if u != nid
+    ]
+    for u, v, efeats in list_edge_tuple:
+        graph_index.remove_edge(u=u, v=v, efeats=efeats)
+        rep_u = rep_nid if u == nid else u
+        rep_v = rep_nid if v == nid else v
+        if not nx_g.has_edge(rep_u, rep_v):
+            nx_g.add_edge(rep_u, rep_v, **efeats)
+            graph_index.add_edges(list_edge_tuple=[(rep_u, rep_v, efeats)])
+
+    graph_index.remove_node(nid=nid, nfeats=nx_g.nodes[nid])
+    nx_g.remove_node(nid)
+
+
+def _add_sent_to_graph_builder_with_memo(
+    para_graph_builder: ParaGraphBuilder,
+    sent: Span,
+    logger: Logger,
+    schema: GraphSchema,
+    position_offset: int,
+    sent_graph_memo: SentGraphMemo,
+) -> List[int]:
+    # Sentences seen before skip collection and go straight to the builder
+    position_start = position_offset + sent.start
+    graph_arrays = sent_graph_memo.get(
+        sent_text=sent.text,
+        n_tokens=len(sent),
+        schema=schema,
+        position_start=position_start,
     )
+    if graph_arrays is None:
+        with para_graph_builder.metrics.time_stage("collect_elements"):
+            node_tuples, edge_tuples = collect_sent_graph_elements_from_spacy(
+                sent=sent,
+                logger=logger,
+                schema=schema,
+                position_offset=position_offset,
+            )
+            graph_arrays = columns_to_graph_arrays(
+                node_columns=NodeColumns.from_node_tuples(node_tuples=node_tuples),
+                edge_columns=EdgeColumns.from_edge_tuples(edge_tuples=edge_tuples),
+            )
+        sent_graph_memo.put(
+            sent_text=sent.text,
+            n_tokens=len(sent),
+            schema=schema,
+            graph_arrays=graph_arrays,
+            position_start=position_start,
+        )
 
-    # Define types of nodes for contraction
-    list_contract_ntype: List[NodeType] = [
-        NodeType.token,
-        NodeType.ner,
-        NodeType.uni_pos,
+    mapping_local_nid_to_nid = para_graph_builder.add_graph_arrays(
+        graph_arrays=graph_arrays
+    )
+
+    return [
+        mapping_local_nid_to_nid[local_nid]
+        for local_nid in np.flatnonzero(
+            graph_arrays.node_ntype == DICT_NTYPE_CODE[NodeType.sentence]
+        ).tolist()
     ]
 
+
+def add_spacy_doc_to_graph_builder(
+    para_graph_builder: ParaGraphBuilder,
+    doc: Doc,
+    logger: Logger,
+    vectorized: bool = False,
+    schema: Optional[GraphSchema] = None,
+    position_offset: int = 0,
+    sent_graph_memo: Optional[SentGraphMemo] = None,
+) -> List[int]:
+    metrics = para_graph_builder.metrics
+
+    # Graph node ids of the doc's sentence nodes, in sentence order
+    list_sent_nid: List[int] = []
+
+    if sent_graph_memo is not None:
+        # Memoized elements are added sentence by sentence, even if vectorized
+        for sent in doc.sents:
+            list_sent_nid.extend(
+                _add_sent_to_graph_builder_with_memo(
+                    para_graph_builder=para_graph_builder,
+                    sent=sent,
+                    logger=logger,
+                    schema=FULL_GRAPH_SCHEMA if schema is None else schema,
+                    position_offset=position_offset,
+                    sent_graph_memo=sent_graph_memo,
+                )
+            )
+    elif vectorized:
+        # Collect the elements of all sentences at once as arrays
+        with metrics.time_stage("collect_elements"):
+            graph_arrays = collect_doc_graph_arrays_from_spacy(
+                doc=doc, logger=logger, schema=schema, position_offset=position_offset
+            )
+        mapping_local_nid_to_nid = para_graph_builder.add_graph_arrays(
+            graph_arrays=graph_arrays
+        )
+        list_sent_nid.extend(
+            mapping_local_nid_to_nid[local_nid]
+            for local_nid in np.flatnonzero(
+                graph_arrays.node_ntype == DICT_NTYPE_CODE[NodeType.sentence]
+            ).tolist()
+        )
+    else:
+        n_sent: int = 0
+        for sent in doc.sents:
+            with metrics.time_stage("collect_elements"):
+                node_tuples, edge_tuples = collect_sent_graph_elements_from_spacy(
+                    sent=sent,
+                    logger=logger,
+                    schema=schema,
+                    position_offset=position_offset,
+                )
+            mapping_local_nid_to_nid = (
+                para_graph_builder.add_node_tuples_and_edge_tuples(
+                    node_tuples=node_tuples, edge_tuples=edge_tuples
+                )
+            )
+            list_sent_nid.extend(
+                mapping_local_nid_to_nid[node_tuple.node_id]
+                for node_tuple in node_tuples.list_node_tuple
+                if node_tuple.node_feats.ntype == NodeType.sentence
+            )
+            n_sent += 1
+
+        logger.debug("Added elements of %d sentences to the graph builder", n_sent)
+
+    return list_sent_nid
+
+
+def build_para_graph_from_spacy_doc(  # type: ignore[no-any-unimported]
+    doc: Doc,
+    logger: Logger,
+    vectorized: bool = False,
+    graph_type: NetworkXGraphType = NetworkXGraphType.digraph,
+    metrics: Optional[PipelineMetrics] = None,
+    schema: Optional[GraphSchema] = None,
+    vocab: Optional[GraphVocab] = None,
+    sent_graph_memo: Optional[SentGraphMemo] = None,
+) -> Union[Graph, CSRGraph]:
+    metrics = NULL_PIPELINE_METRICS if metrics is None else metrics
+
+    # Intern nodes of types to contract while adding elements into one graph
+    para_graph_builder = ParaGraphBuilder(logger=logger, metrics=metrics, vocab=vocab)
+
     logger.debug(
-        "Nodes of the following list of node types is specified to be contracted"
-        f"{list_contract_ntype}"
+        "Nodes of the following list of node types is specified to be contracted%s",
+        para_graph_builder.list_contract_ntype,
     )
 
-    # Parse paragraph text with a spacy model
-    doc = nlp(text)
+    add_spacy_doc_to_graph_builder(
+        para_graph_builder=para_graph_builder,
+        doc=doc,
+        logger=logger,
+        vectorized=vectorized,
+        schema=schema,
+        sent_graph_memo=sent_graph_memo,
+    )
 
-    # Initiate an iterable to store sentence graphs
-    list_sent_graph: List[Graph] = []  # type: ignore[no-any-unimported]
+    return finish_para_graph(
+        para_graph_builder=para_graph_builder,
+        logger=logger,
+        graph_type=graph_type,
+        vocab=vocab,
+    )
 
-    for sent in doc.sents:
-        #
-        # Construct a sentence graph
-        #
 
-        node_tuples, edge_tuples = collect_sent_graph_elements_from_spacy(
-            sent=sent, logger=logger
-        )
-        nx_g = build_graph_from_node_tuples_and_edge_tuples(
-            node_tuples=node_tuples, edge_tuples=edge_tuples, logger=logger
+def finish_para_graph(  # type: ignore[no-any-unimported]
+    para_graph_builder: ParaGraphBuilder,
+    logger: Logger,
+    graph_type: NetworkXGraphType = NetworkXGraphType.digraph,
+    vocab: Optional[GraphVocab] = None,
+) -> Union[Graph, CSRGraph]:
+    metrics = para_graph_builder.metrics
+    para_graph = para_graph_builder.graph
+
+    if metrics.enabled:
+        metrics.count("para_graphs")
+        metrics.count("nodes", para_graph.number_of_nodes())
+        metrics.count("edges", para_graph.number_of_edges())
+    if logger.isEnabledFor(DEBUG):
+        logger.debug(
+            f"Constructed paragraph graph with {len(para_graph.nodes)} nodes "
+            f"and {len(para_graph.edges)} edges"
         )
-        for ntype in list_contract_ntype:
-            nx_g = contract_ntype_nodes_by_identical_text(
-                nx_g=nx_g, ntype=ntype, logger=logger
+
+    if graph_type == NetworkXGraphType.csr:
+        with metrics.time_stage("csr_convert"):
+            if vocab is None:
+                return CSRGraph.from_networkx(nx_g=para_graph)
+            # Share the vocab's string table so text ids agree across both forms
+            return CSRGraph.from_networkx(
+                nx_g=vocab.decode_graph(nx_g=para_graph),
+                string_table=vocab.string_table,
             )
-        list_sent_graph.append(nx_g)
 
-    logger.debug(f"Collected {len(list_sent_graph)} sentence graphs")
+    return para_graph
+
+
+def parse_for_para_graph_with_spacy(  # type: ignore[no-any-unimported]
+    text: str,
+    nlp: Language,
+    logger: Logger,
+    vectorized: bool = False,
+    graph_type: NetworkXGraphType = NetworkXGraphType.digraph,
+    parse_cache: Optional[SpacyParseCache] = None,
+    metrics: Optional[PipelineMetrics] = None,
+    schema: Optional[GraphSchema] = None,
+    vocab: Optional[GraphVocab] = None,
+    sent_graph_memo: Optional[SentGraphMemo] = None,
+) -> Union[Graph, CSRGraph]:
+    metrics = NULL_PIPELINE_METRICS if metrics is None else metrics
+    schema = FULL_GRAPH_SCHEMA if schema is None else schema
+
+    logger.debug(
+        "Attempting to construct a graph from a text sequence of length %d", len(text)
+    )
 
-    # Perform a simple union over all sentence graphs
-    para_graph = nx.disjoint_union_all(graphs=list_sent_graph)
+    # Skip spacy components whose annotations the schema does not read
+    list_disable_pipe = get_spacy_pipes_to_disable(nlp=nlp, schema=schema)
 
-    for ntype in list_contract_ntype:
-        para_graph = contract_ntype_nodes_by_identical_text(
-            nx_g=para_graph, ntype=ntype, logger=logger
+    # Parse paragraph text with a spacy model, unless its parse is cached
+    with metrics.time_stage("spacy_parse"):
+        doc = (
+            nlp(text, disable=list_disable_pipe)
+            if parse_cache is None
+            else parse_cache.parse(text=text, nlp=nlp, disable=list_disable_pipe)
         )
 
-    # Relabel node ids to narrow the range of node ids
-    para_graph = nx.convert_node_labels_to_integers(G=para_graph)
+    return build_para_graph_from_spacy_doc(
+        doc=doc,
+        logger=logger,
+        vectorized=vectorized,
+        graph_type=graph_type,
+        metrics=metrics,
+        schema=schema,
+        vocab=vocab,
+        sent_graph_memo=sent_graph_memo,
+    )
+
+
+def pipe_spacy_docs(
+    texts: Iterable[str],
+    nlp: Language,
+    batch_size: int = 64,
+    n_process: int = 1,
+    disable: Optional[List[str]] = None,
+    parse_cache: Optional[SpacyParseCache] = None,
+    length_batcher: Optional[SpacyLengthBatcher] = None,
+) -> Iterable[Doc]:
+    # Batch parses by count in arrival order unless batched by token length,
+    # reading cached parses first when a cache is given
+    if parse_cache is not None:
+        return parse_cache.pipe(
+            texts=texts,
+            nlp=nlp,
+            batch_size=batch_size,
+            n_process=n_process,
+            disable=disable,
+            length_batcher=length_batcher,
+        )
+    if length_batcher is not None:
+        return length_batcher.pipe(
+            texts=texts, nlp=nlp, n_process=n_process, disable=disable
+        )
+
+    return nlp.pipe(
+        texts,
+        batch_size=batch_size,
+        n_process=n_process,
+        disable=[] if disable is None else disable,
+    )
+
+
+def parse_many_para_graphs(  # type: ignore[no-any-unimported]
+    texts: Iterable[str],
+    nlp: Language,
+    logger: Logger,
+    batch_size: int = 64,
+    n_process: int = 1,
+    vectorized: bool = False,
+    graph_type: NetworkXGraphType = NetworkXGraphType.digraph,
+    parse_cache: Optional[SpacyParseCache] = None,
+    metrics: Optional[PipelineMetrics] = None,
+    schema: Optional[GraphSchema] = None,
+    vocab: Optional[GraphVocab] = None,
+    length_batcher: Optional[SpacyLengthBatcher] = None,
+    sent_graph_memo: Optional[SentGraphMemo] = None,
+) -> Iterator[Union[Graph, CSRGraph]]:
+    metrics = NULL_PIPELINE_METRICS if metrics is None else metrics
+    schema = FULL_GRAPH_SCHEMA if schema is None else schema
 
     logger.debug(
-        "Relabelled paragraph graph whose maximum node id is "
-        f"{max(para_graph.nodes)}"
+        "Attempting to construct paragraph graphs from a stream of text sequences "
+        f"with batch size {batch_size} and {n_process} process(es)"
     )
 
-    return para_graph
+    # Skip spacy components whose annotations the schema does not read
+    list_disable_pipe = get_spacy_pipes_to_disable(nlp=nlp, schema=schema)
+
+    # Parse paragraph texts in batches with a spacy model, lazily and in order
+    docs = pipe_spacy_docs(
+        texts=texts,
+        nlp=nlp,
+        batch_size=batch_size,
+        n_process=n_process,
+        disable=list_disable_pipe,
+        parse_cache=parse_cache,
+        length_batcher=length_batcher,
+    )
+
+    # Time the parse of each doc as it is pulled from the lazy batches
+    iter_doc = iter(docs)
+    n_para: int = 0
+    while True:
+        with metrics.time_stage("spacy_parse"):
+            doc = next(iter_doc, None)
+        if doc is None:
+            break
+        yield build_para_graph_from_spacy_doc(
+            doc=doc,
+            logger=logger,
+            vectorized=vectorized,
+            graph_type=graph_type,
+            metrics=metrics,
+            schema=schema,
+            vocab=vocab,
+            sent_graph_memo=sent_graph_memo,
+        )
+        n_para += 1
+
+    logger.debug(f"Constructed {n_para} paragraph graphs from the stream")
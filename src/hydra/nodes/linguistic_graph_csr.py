@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from networkx import DiGraph
+
+from .linguistic_graph_arrays import (
+    LIST_ETYPE,
+    LIST_NTYPE,
+    GraphArrays,
+    StringTable,
+)
+
+
+def _offsets_from_sorted_ids(arr_sorted_id: np.ndarray, n_nodes: int) -> np.ndarray:
+    arr_offsets = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(arr_sorted_id, minlength=n_nodes), out=arr_offsets[1:])
+
+    return arr_offsets
+
+
+@dataclass
+class CSRGraph:
+    # Node columns indexed by dense node id, with text held as string table ids
+    node_ntype: np.ndarray
+    node_text: np.ndarray
+    node_position_id: np.ndarray
+    # Out-edges grouped by source node, whose edge columns are aligned
+    out_offsets: np.ndarray
+    out_indices: np.ndarray
+    edge_etype: np.ndarray
+    edge_text: np.ndarray
+    # In-edges grouped by destination node, pointing back into the out-edges
+    in_offsets: np.ndarray
+    in_indices: np.ndarray
+    in_edge_ids: np.ndarray
+    # String table possibly shared with other graphs
+    string_table: StringTable
+
+    @property
+    def n_nodes(self) -> int:
+        return int(self.node_ntype.shape[0])
+
+    @property
+    def n_edges(self) -> int:
+        return int(self.out_indices.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        # Size of the array columns, excluding the possibly shared string table
+        return sum(
+            arr.nbytes
+            for arr in (
+                self.node_ntype,
+                self.node_text,
+                self.node_position_id,
+                self.out_offsets,
+                self.out_indices,
+                self.edge_etype,
+                self.edge_text,
+                self.in_offsets,
+                self.in_indices,
+                self.in_edge_ids,
+            )
+        )
+
+    @property
+    def edge_src(self) -> np.ndarray:
+        arr_edge_src: np.ndarray = np.repeat(
+            np.arange(self.n_nodes, dtype=np.int32), np.diff(self.out_offsets)
+        )
+
+        return arr_edge_src
+
+    def successors(self, nid: int) -> np.ndarray:
+        arr_successor: np.ndarray = self.out_indices[
+            self.out_offsets[nid] : self.out_offsets[nid + 1]
+        ]
+
+        return arr_successor
+
+    def predecessors(self, nid: int) -> np.ndarray:
+        arr_predecessor: np.ndarray = self.in_indices[
+            self.in_offsets[nid] : self.in_offsets[nid + 1]
+        ]
+
+        return arr_predecessor
+
+    def out_degree(self) -> np.ndarray:
+        arr_out_degree: np.ndarray = np.diff(self.out_offsets)
+
+        return arr_out_degree
+
+    def in_degree(self) -> np.ndarray:
+        arr_in_degree: np.ndarray = np.diff(self.in_offsets)
+
+        return arr_in_degree
+
+    @classmethod
+    def from_columns(
+        cls,
+        node_ntype: np.ndarray,
+        node_text: np.ndarray,
+        node_position_id: np.ndarray,
+        edge_src: np.ndarray,
+        edge_dst: np.ndarray,
+        edge_etype: np.ndarray,
+        edge_text: np.ndarray,
+        string_table: StringTable,
+    ) -> CSRGraph:
+        n_nodes: int = int(node_ntype.shape[0])
+
+        # Drop repeated edges between two nodes, keeping the first one added
+        _, arr_first_edge_id = np.unique(
+            edge_src.astype(np.int64) * max(n_nodes, 1) + edge_dst, return_index=True
+        )
+        arr_first_edge_id.sort()
+        edge_src, edge_dst = edge_src[arr_first_edge_id], edge_dst[arr_first_edge_id]
+        edge_etype, edge_text = (
+            edge_etype[arr_first_edge_id],
+            edge_text[arr_first_edge_id],
+        )
+
+        # Sort edges by source node, then index them by destination node
+        arr_out_order = np.argsort(edge_src, kind="stable")
+        edge_src, edge_dst = edge_src[arr_out_order], edge_dst[arr_out_order]
+        arr_in_order = np.argsort(edge_dst, kind="stable")
+
+        return cls(
+            node_ntype=node_ntype.astype(np.int8),
+            node_text=node_text.astype(np.int32),
+            node_position_id=node_position_id.astype(np.int32),
+            out_offsets=_offsets_from_sorted_ids(edge_src, n_nodes),
+            out_indices=edge_dst.astype(np.int32),
+            edge_etype=edge_etype[arr_out_order].astype(np.int8),
+            edge_text=edge_text[arr_out_order].astype(np.int32),
+            in_offsets=_offsets_from_sorted_ids(edge_dst[arr_in_order], n_nodes),
+            in_indices=edge_src[arr_in_order].astype(np.int32),
+            in_edge_ids=arr_in_order.astype(np.int32),
+            string_table=string_table,
+        )
+
+    @classmethod
+    def from_graph_arrays(
+        cls, graph_arrays: GraphArrays, string_table: Optional[StringTable] = None
+    ) -> CSRGraph:
+        string_table = StringTable() if string_table is None else string_table
+
+        return cls.from_columns(
+            node_ntype=graph_arrays.node_ntype,
+            node_text=string_table.intern_many(graph_arrays.node_text.tolist()),
+            node_position_id=graph_arrays.node_position_id,
+            edge_src=graph_arrays.edge_src,
+            edge_dst=graph_arrays.edge_dst,
+            edge_etype=graph_arrays.edge_etype,
+            edge_text=string_table.intern_many(graph_arrays.edge_text.tolist()),
+            string_table=string_table,
+        )
+
+    @classmethod
+    def from_elements(
+        cls,
+        list_node_tuple: Iterable[Tuple[Any, Dict[str, Any]]],
+        list_edge_tuple: Iterable[Tuple[Any, Any, Dict[str, Any]]],
+        string_table: Optional[StringTable] = None,
+    ) -> CSRGraph:
+        # Node ids are replaced by dense ids following the order of the nodes
+        return cls.from_graph_arrays(
+            graph_arrays=GraphArrays.from_elements(
+                list_node_tuple=list_node_tuple, list_edge_tuple=list_edge_tuple
+            ),
+            string_table=string_table,
+        )
+
+    @classmethod
+    def from_networkx(  # type: ignore[no-any-unimported]
+        cls, nx_g: DiGraph, string_table: Optional[StringTable] = None
+    ) -> CSRGraph:
+        return cls.from_elements(
+            list_node_tuple=nx_g.nodes.data(),
+            list_edge_tuple=nx_g.edges.data(),
+            string_table=string_table,
+        )
+
+    def to_graph_arrays(self) -> GraphArrays:
+        node_text = np.empty(self.n_nodes, dtype=object)
+        node_text[:] = self.string_table.lookup_many(self.node_text)
+        edge_text = np.empty(self.n_edges, dtype=object)
+        edge_text[:] = self.string_table.lookup_many(self.edge_text)
+
+        return GraphArrays(
+            node_ntype=self.node_ntype,
+            node_text=node_text,
+            node_position_id=self.node_position_id.astype(np.int64),
+            edge_src=self.edge_src.astype(np.int64),
+            edge_dst=self.out_indices.astype(np.int64),
+            edge_etype=self.edge_etype,
+            edge_text=edge_text,
+        )
+
+    def to_networkx(self) -> DiGraph:  # type: ignore[no-any-unimported]
+        arr_ntype_value = np.array([ntype.value for ntype in LIST_NTYPE], dtype=object)
+        arr_etype_value = np.array([etype.value for etype in LIST_ETYPE], dtype=object)
+        list_ntype_value: List[str] = arr_ntype_value[self.node_ntype].tolist()
+        list_etype_value: List[str] = arr_etype_value[self.edge_etype].tolist()
+        list_node_text = self.string_table.lookup_many(self.node_text)
+        list_edge_text = self.string_table.lookup_many(self.edge_text)
+
+        nx_g = DiGraph()
+        nx_g.add_nodes_from(
+            (
+                nid,
+                (
+                    {"ntype": ntype_value, "text": text}
+                    if position_id < 0
+                    else {
+                        "ntype": ntype_value,
+                        "text": text,
+                        "position_id": position_id,
+                    }
+                ),
+            )
+            for nid, (ntype_value, text, position_id) in enumerate(
+                zip(list_ntype_value, list_node_text, self.node_position_id.tolist())
+            )
+        )
+        nx_g.add_edges_from(
+            (u, v, {"etype": etype_value, "text": text})
+            for u, v, etype_value, text in zip(
+                self.edge_src.tolist(),
+                self.out_indices.tolist(),
+                list_etype_value,
+                list_edge_text,
+            )
+        )
+
+        return nx_g
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from networkx import DiGraph
+
+
+class GraphIndex:
+    # Node ids by node type and by node type and text, and edges by edge type,
+    # held as insertion ordered dicts so lookups and removals are O(1) and
+    # results follow the order elements were added
+    def __init__(
+        self,
+        nfeat_ntype: str = "ntype",
+        nfeat_text: str = "text",
+        efeat_etype: str = "etype",
+    ) -> None:
+        self.nfeat_ntype = nfeat_ntype
+        self.nfeat_text = nfeat_text
+        self.efeat_etype = efeat_etype
+
+        self.mapping_ntype_to_nids: Dict[Any, Dict[int, None]] = {}
+        self.mapping_ntype_text_to_nids: Dict[Tuple[Any, Any], Dict[int, None]] = {}
+        self.mapping_etype_to_edges: Dict[Any, Dict[Tuple[int, int], None]] = {}
+
+    @classmethod
+    def from_graph(  # type: ignore[no-any-unimported]
+        cls,
+        nx_g: DiGraph,
+        nfeat_ntype: str = "ntype",
+        nfeat_text: str = "text",
+        efeat_etype: str = "etype",
+    ) -> GraphIndex:
+        graph_index = cls(
+            nfeat_ntype=nfeat_ntype, nfeat_text=nfeat_text, efeat_etype=efeat_etype
+        )
+        graph_index.add_nodes(list_node_tuple=nx_g.nodes.data())
+        graph_index.add_edges(list_edge_tuple=nx_g.edges.data())
+
+        return graph_index
+
+    def add_nodes(self, list_node_tuple: Iterable[Tuple[int, Dict[str, Any]]]) -> None:
+        mapping_ntype_to_nids = self.mapping_ntype_to_nids
+        mapping_ntype_text_to_nids = self.mapping_ntype_text_to_nids
+        nfeat_ntype, nfeat_text = self.nfeat_ntype, self.nfeat_text
+        for nid, nfeats in list_node_tuple:
+            ntype_value = nfeats.get(nfeat_ntype)
+            mapping_ntype_to_nids.setdefault(ntype_value, {})[nid] = None
+            mapping_ntype_text_to_nids.setdefault(
+                (ntype_value, nfeats.get(nfeat_text)), {}
+            )[nid] = None
+
+    def remove_node(self, nid: int, nfeats: Dict[str, Any]) -> None:
+        ntype_value = nfeats.get(self.nfeat_ntype)
+        key = (ntype_value, nfeats.get(self.nfeat_text))
+        for mapping_key_to_nids, key_value in [
+            (self.mapping_ntype_to_nids, ntype_value),
+            (self.mapping_ntype_text_to_nids, key),
+        ]:
+            nids = mapping_key_to_nids[key_value]
+            del nids[nid]
+            if not nids:
+                del mapping_key_to_nids[key_value]
+
+    def add_edges(
+        self, list_edge_tuple: Iterable[Tuple[int, int, Dict[str, Any]]]
+    ) -> None:
+        mapping_etype_to_edges = self.mapping_etype_to_edges
+        efeat_etype = self.efeat_etype
+        for u, v, efeats in list_edge_tuple:
+            mapping_etype_to_edges.setdefault(efeats.get(efeat_etype), {})[
+                (u, v)
+            ] = None
+
+    def remove_edge(self, u: int, v: int, efeats: Dict[str, Any]) -> None:
+        etype_value = efeats.get(self.efeat_etype)
+        edges = self.mapping_etype_to_edges[etype_value]
+        del edges[(u, v)]
+        if not edges:
+            del self.mapping_etype_to_edges[etype_value]
+
+    def get_nids(self, ntype_value: Any, text: Optional[Any] = None) -> List[int]:
+        nids = (
+            self.mapping_ntype_to_nids.get(ntype_value, {})
+            if text is None
+            else self.mapping_ntype_text_to_nids.get((ntype_value, text), {})
+        )
+
+        return list(nids)
+
+    def get_nids_by_text(self, text: Any) -> List[int]:
+        # Look the text up under each node type rather than scanning nodes
+        return [
+            nid
+            for ntype_value in self.mapping_ntype_to_nids
+            for nid in self.mapping_ntype_text_to_nids.get((ntype_value, text), {})
+        ]
+
+    def get_edges(self, etype_value: Any) -> List[Tuple[int, int]]:
+        return list(self.mapping_etype_to_edges.get(etype_value, {}))
+
+    def get_linked_nids(  # type: ignore[no-any-unimported]
+        self,
+        nx_g: DiGraph,
+        ntype_value: Any,
+        text: Any,
+        etype_value: Any,
+    ) -> List[int]:
+        # Source nodes of edges of an edge type into nodes of a type and text,
+        # such as the tokens of every PERSON ner node
+        efeat_etype = self.efeat_etype
+        mapping_nid_to_none: Dict[int, None] = {}
+        for nid in self.mapping_ntype_text_to_nids.get((ntype_value, text), {}):
+            for src_nid, efeats in nx_g.pred[nid].items():
+                if efeats.get(efeat_etype) == etype_value:
+                    mapping_nid_to_none[src_nid] = None
+
+        return list(mapping_nid_to_none)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Set
+
+from .linguistic_graph_edges import EdgeType
+from .linguistic_graph_nodes import NodeType
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+# Node and edge types built from a spacy doc, in the order they are collected
+LIST_SCHEMA_NTYPE: List[NodeType] = [
+    NodeType.sentence,
+    NodeType.ner,
+    NodeType.token,
+    NodeType.uni_pos,
+]
+LIST_SCHEMA_ETYPE: List[EdgeType] = [
+    EdgeType.token_to_ner,
+    EdgeType.token_to_sent,
+    EdgeType.token_to_uni_pos,
+    EdgeType.dependency_arc,
+]
+
+# Node types at the ends of each edge type
+DICT_ETYPE_ENDPOINT_NTYPE: Dict[EdgeType, Set[NodeType]] = {
+    EdgeType.token_to_ner: {NodeType.token, NodeType.ner},
+    EdgeType.token_to_sent: {NodeType.token, NodeType.sentence},
+    EdgeType.token_to_uni_pos: {NodeType.token, NodeType.uni_pos},
+    EdgeType.dependency_arc: {NodeType.token},
+}
+
+# Spacy components setting sentence boundaries apart from the parser
+SET_SENT_BOUNDARY_PIPE: Set[str] = {"senter", "sentencizer"}
+
+
+@dataclass
+class GraphSchema:
+    list_ntype: List[NodeType] = field(default_factory=lambda: list(LIST_SCHEMA_NTYPE))
+    list_etype: List[EdgeType] = field(default_factory=lambda: list(LIST_SCHEMA_ETYPE))
+
+    def __post_init__(self) -> None:
+        for ntype in self.list_ntype:
+            if ntype not in LIST_SCHEMA_NTYPE:
+                raise ValueError(f"{ntype} is not built from spacy docs")
+        for etype in self.list_etype:
+            if etype not in LIST_SCHEMA_ETYPE:
+                raise ValueError(f"{etype} is not built from spacy docs")
+            set_missing_ntype = DICT_ETYPE_ENDPOINT_NTYPE[etype] - set(self.list_ntype)
+            if set_missing_ntype:
+                raise ValueError(
+                    f"{etype} requires node types {sorted(set_missing_ntype, key=str)} "
+                    "which are not in the schema"
+                )
+
+    def has_ntype(self, ntype: NodeType) -> bool:
+        return ntype in self.list_ntype
+
+    def has_etype(self, etype: EdgeType) -> bool:
+        return etype in self.list_etype
+
+    @property
+    def is_full(self) -> bool:
+        return set(self.list_ntype) == set(LIST_SCHEMA_NTYPE) and set(
+            self.list_etype
+        ) == set(LIST_SCHEMA_ETYPE)
+
+
+# Schema building every node and edge type, used when none is given
+FULL_GRAPH_SCHEMA = GraphSchema()
+
+
+def get_spacy_pipes_to_disable(nlp: Language, schema: GraphSchema) -> List[str]:
+    # Decide the components whose annotations the schema reads, leaving any
+    # component this does not know about enabled
+    set_pipe_name: Set[str] = set(nlp.pipe_names)
+    needs_pos: bool = schema.has_ntype(NodeType.uni_pos)
+    needs_ner: bool = schema.has_ntype(NodeType.ner)
+    # Sentence boundaries are always read, as elements are collected by sentence
+    needs_parser: bool = schema.has_etype(EdgeType.dependency_arc) or not (
+        set_pipe_name & SET_SENT_BOUNDARY_PIPE
+    )
+
+    dict_pipe_needed: Dict[str, bool] = {
+        "tagger": needs_pos,
+        "morphologizer": needs_pos,
+        "attribute_ruler": needs_pos,
+        "lemmatizer": False,
+        "parser": needs_parser,
+        "senter": True,
+        "sentencizer": True,
+        "ner": needs_ner,
+        "entity_ruler": needs_ner,
+    }
+    set_pipe_needed: Set[str] = {
+        pipe_name
+        for pipe_name in nlp.pipe_names
+        if dict_pipe_needed.get(pipe_name, True)
+    }
+
+    # Embedding components are only needed while a needed component listens
+    list_pipe_to_disable: List[str] = []
+    for pipe_name, pipe in nlp.pipeline:
+        if hasattr(pipe, "listening_components"):
+            if not set_pipe_needed & set(pipe.listening_components):
+                list_pipe_to_disable.append(pipe_name)
+        elif pipe_name not in set_pipe_needed:
+            list_pipe_to_disable.append(pipe_name)
+
+    return list_pipe_to_disable
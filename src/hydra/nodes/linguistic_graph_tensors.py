@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+from networkx import Graph
+
+from .linguistic_graph_arrays import DICT_NTYPE_CODE, LIST_ETYPE, GraphArrays
+from .linguistic_graph_csr import CSRGraph
+from .linguistic_graph_edges import DependencyLabel, EdgeType
+from .linguistic_graph_nodes import NamedEntityLabel, NodeType, UniversalPOSTag
+from .linguistic_graph_vocab import GraphVocab
+
+# Integer codes of labels are their positions in the enums, -1 marking nodes
+# and edges of types without the label
+DICT_UNI_POS_VALUE_CODE: Dict[str, int] = {
+    tag.value: code for code, tag in enumerate(UniversalPOSTag)
+}
+DICT_NER_VALUE_CODE: Dict[str, int] = {
+    label.value: code for code, label in enumerate(NamedEntityLabel)
+}
+DICT_DEPENDENCY_VALUE_CODE: Dict[str, int] = {
+    label.value: code for code, label in enumerate(DependencyLabel)
+}
+
+
+def _encode_label_column(
+    arr_type: np.ndarray,
+    arr_text_key: np.ndarray,
+    type_code: int,
+    lookup: Callable[[Any], str],
+    dict_value_code: Dict[str, int],
+) -> np.ndarray:
+    # Look up each distinct label once, then broadcast its code back
+    arr_is_type = arr_type == type_code
+    arr_unique_key, arr_inverse = np.unique(
+        arr_text_key[arr_is_type], return_inverse=True
+    )
+    arr_unique_code = np.array(
+        [dict_value_code.get(lookup(key), -1) for key in arr_unique_key.tolist()],
+        dtype=np.int16,
+    )
+
+    arr_code = np.full(arr_type.shape[0], -1, dtype=np.int16)
+    arr_code[arr_is_type] = arr_unique_code[arr_inverse.reshape(-1)]
+
+    return arr_code
+
+
+@dataclass
+class GraphTensors:
+    # Node features indexed by node id, over one graph or a batch of graphs
+    node_ntype: np.ndarray
+    node_uni_pos: np.ndarray
+    node_ner: np.ndarray
+    node_position_id: np.ndarray
+    # Edges of each edge type as a 2 x n array of source and destination ids,
+    # with dependency labels aligned with the dependency arcs
+    dict_edge_index: Dict[EdgeType, np.ndarray]
+    dependency_arc_label: np.ndarray
+    # Nodes and edges of each graph of a batch lie between consecutive offsets
+    node_offsets: np.ndarray
+    dict_edge_offsets: Dict[EdgeType, np.ndarray]
+
+    @property
+    def n_graphs(self) -> int:
+        return int(self.node_offsets.shape[0]) - 1
+
+    @property
+    def n_nodes(self) -> int:
+        return int(self.node_ntype.shape[0])
+
+    @property
+    def node_graph_index(self) -> np.ndarray:
+        arr_node_graph_index: np.ndarray = np.repeat(
+            np.arange(self.n_graphs, dtype=np.int64), np.diff(self.node_offsets)
+        )
+
+        return arr_node_graph_index
+
+    @classmethod
+    def _from_columns(
+        cls,
+        node_ntype: np.ndarray,
+        node_text_key: np.ndarray,
+        node_position_id: np.ndarray,
+        edge_src: np.ndarray,
+        edge_dst: np.ndarray,
+        edge_etype: np.ndarray,
+        edge_text_key: np.ndarray,
+        lookup: Callable[[Any], str],
+    ) -> GraphTensors:
+        # Split edges by edge type, keeping their order within each edge type
+        arr_edge_order = np.argsort(edge_etype, kind="stable")
+        arr_etype_n_edge = np.bincount(
+            edge_etype.astype(np.int64), minlength=len(LIST_ETYPE)
+        )
+        arr_edge_index = np.stack([edge_src, edge_dst]).astype(np.int64)[
+            :, arr_edge_order
+        ]
+        list_edge_index = np.split(
+            arr_edge_index, np.cumsum(arr_etype_n_edge)[:-1], axis=1
+        )
+
+        dependency_arc_code = LIST_ETYPE.index(EdgeType.dependency_arc)
+        dependency_arc_label = _encode_label_column(
+            arr_type=edge_etype,
+            arr_text_key=edge_text_key,
+            type_code=dependency_arc_code,
+            lookup=lookup,
+            dict_value_code=DICT_DEPENDENCY_VALUE_CODE,
+        )[edge_etype == dependency_arc_code]
+
+        return cls(
+            node_ntype=node_ntype.astype(np.int8),
+            node_uni_pos=_encode_label_column(
+                arr_type=node_ntype,
+                arr_text_key=node_text_key,
+                type_code=DICT_NTYPE_CODE[NodeType.uni_pos],
+                lookup=lookup,
+                dict_value_code=DICT_UNI_POS_VALUE_CODE,
+            ),
+            node_ner=_encode_label_column(
+                arr_type=node_ntype,
+                arr_text_key=node_text_key,
+                type_code=DICT_NTYPE_CODE[NodeType.ner],
+                lookup=lookup,
+                dict_value_code=DICT_NER_VALUE_CODE,
+            ),
+            node_position_id=node_position_id.astype(np.int64),
+            dict_edge_index=dict(zip(LIST_ETYPE, list_edge_index)),
+            dependency_arc_label=dependency_arc_label,
+            node_offsets=np.array([0, node_ntype.shape[0]], dtype=np.int64),
+            dict_edge_offsets={
+                etype: np.array([0, n_edge], dtype=np.int64)
+                for etype, n_edge in zip(LIST_ETYPE, arr_etype_n_edge.tolist())
+            },
+        )
+
+    @classmethod
+    def from_graph_arrays(cls, graph_arrays: GraphArrays) -> GraphTensors:
+        return cls._from_columns(
+            node_ntype=graph_arrays.node_ntype,
+            node_text_key=graph_arrays.node_text,
+            node_position_id=graph_arrays.node_position_id,
+            edge_src=graph_arrays.edge_src,
+            edge_dst=graph_arrays.edge_dst,
+            edge_etype=graph_arrays.edge_etype,
+            edge_text_key=graph_arrays.edge_text,
+            lookup=str,
+        )
+
+    @classmethod
+    def from_csr_graph(cls, csr_g: CSRGraph) -> GraphTensors:
+        # Labels are looked up by string table id, without decoding all text
+        return cls._from_columns(
+            node_ntype=csr_g.node_ntype,
+            node_text_key=csr_g.node_text,
+            node_position_id=csr_g.node_position_id,
+            edge_src=csr_g.edge_src,
+            edge_dst=csr_g.out_indices,
+            edge_etype=csr_g.edge_etype,
+            edge_text_key=csr_g.edge_text,
+            lookup=csr_g.string_table.lookup,
+        )
+
+    @classmethod
+    def from_graph(  # type: ignore[no-any-unimported]
+        cls,
+        graph: Union[Graph, CSRGraph, GraphArrays],
+        vocab: Optional[GraphVocab] = None,
+    ) -> GraphTensors:
+        if isinstance(graph, GraphArrays):
+            return cls.from_graph_arrays(graph_arrays=graph)
+        if isinstance(graph, CSRGraph):
+            return cls.from_csr_graph(csr_g=graph)
+
+        return cls.from_graph_arrays(
+            graph_arrays=GraphArrays.from_networkx(nx_g=graph, vocab=vocab)
+        )
+
+
+def _concatenate_offsets(list_offsets: List[np.ndarray]) -> np.ndarray:
+    # Shift the offsets of each graph or batch past those before it
+    arr_n_item = np.concatenate([np.diff(offsets) for offsets in list_offsets])
+    arr_offsets = np.zeros(arr_n_item.shape[0] + 1, dtype=np.int64)
+    np.cumsum(arr_n_item, out=arr_offsets[1:])
+
+    return arr_offsets
+
+
+def collate_graph_tensors(list_graph_tensors: List[GraphTensors]) -> GraphTensors:
+    # Concatenate graphs or batches of graphs into one block whose node ids
+    # are shifted by the number of nodes before each graph
+    if not list_graph_tensors:
+        raise ValueError("At least one graph is needed to collate")
+
+    node_offsets = _concatenate_offsets(
+        [graph_tensors.node_offsets for graph_tensors in list_graph_tensors]
+    )
+    # Node shift of every graph of the result, indexed by graph
+    arr_graph_node_shift = node_offsets[:-1] - np.concatenate(
+        [graph_tensors.node_offsets[:-1] for graph_tensors in list_graph_tensors]
+    )
+
+    dict_edge_index: Dict[EdgeType, np.ndarray] = {}
+    dict_edge_offsets: Dict[EdgeType, np.ndarray] = {}
+    for etype in LIST_ETYPE:
+        edge_offsets = _concatenate_offsets(
+            [
+                graph_tensors.dict_edge_offsets[etype]
+                for graph_tensors in list_graph_tensors
+            ]
+        )
+        arr_edge_index = np.concatenate(
+            [np.zeros((2, 0), dtype=np.int64)]
+            + [
+                graph_tensors.dict_edge_index[etype]
+                for graph_tensors in list_graph_tensors
+            ],
+            axis=1,
+        )
+        dict_edge_index[etype] = arr_edge_index + np.repeat(
+            arr_graph_node_shift, np.diff(edge_offsets)
+        )
+        dict_edge_offsets[etype] = edge_offsets
+
+    return GraphTensors(
+        node_ntype=np.concatenate(
+            [graph_tensors.node_ntype for graph_tensors in list_graph_tensors]
+        ),
+        node_uni_pos=np.concatenate(
+            [graph_tensors.node_uni_pos for graph_tensors in list_graph_tensors]
+        ),
+        node_ner=np.concatenate(
+            [graph_tensors.node_ner for graph_tensors in list_graph_tensors]
+        ),
+        node_position_id=np.concatenate(
+            [graph_tensors.node_position_id for graph_tensors in list_graph_tensors]
+        ),
+        dict_edge_index=dict_edge_index,
+        dependency_arc_label=np.concatenate(
+            [graph_tensors.dependency_arc_label for graph_tensors in list_graph_tensors]
+        ),
+        node_offsets=node_offsets,
+        dict_edge_offsets=dict_edge_offsets,
+    )
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from networkx import Graph
+
+from .linguistic_graph_arrays import (
+    DICT_ETYPE_VALUE_CODE,
+    DICT_NTYPE_VALUE_CODE,
+    LIST_ETYPE,
+    LIST_NTYPE,
+    StringTable,
+)
+from .linguistic_graph_edges import EdgeType
+from .linguistic_graph_nodes import NodeType
+
+
+class GraphVocab:
+    # Node and edge types are held as their integer codes and text as ids into
+    # a string table, which a vocab shares across every graph it encodes
+    def __init__(self, string_table: Optional[StringTable] = None) -> None:
+        self.string_table = StringTable() if string_table is None else string_table
+
+    def __len__(self) -> int:
+        return len(self.string_table)
+
+    def intern_text(self, text: str) -> int:
+        return self.string_table.intern(text)
+
+    def lookup_text(self, text_id: int) -> str:
+        return self.string_table.lookup(text_id)
+
+    def lookup_ntype(self, ntype_code: int) -> NodeType:
+        return LIST_NTYPE[ntype_code]
+
+    def lookup_etype(self, etype_code: int) -> EdgeType:
+        return LIST_ETYPE[etype_code]
+
+    def encode_node_feats(self, nfeats: Dict[str, Any]) -> Dict[str, Any]:
+        encoded_nfeats = dict(nfeats)
+        encoded_nfeats["ntype"] = DICT_NTYPE_VALUE_CODE[nfeats["ntype"]]
+        encoded_nfeats["text"] = self.string_table.intern(nfeats["text"])
+
+        return encoded_nfeats
+
+    def encode_edge_feats(self, efeats: Dict[str, Any]) -> Dict[str, Any]:
+        encoded_efeats = dict(efeats)
+        encoded_efeats["etype"] = DICT_ETYPE_VALUE_CODE[efeats["etype"]]
+        encoded_efeats["text"] = self.string_table.intern(efeats.get("text", ""))
+
+        return encoded_efeats
+
+    def decode_node_feats(self, nfeats: Dict[str, Any]) -> Dict[str, Any]:
+        decoded_nfeats = dict(nfeats)
+        decoded_nfeats["ntype"] = LIST_NTYPE[nfeats["ntype"]].value
+        decoded_nfeats["text"] = self.string_table.lookup(nfeats["text"])
+
+        return decoded_nfeats
+
+    def decode_edge_feats(self, efeats: Dict[str, Any]) -> Dict[str, Any]:
+        decoded_efeats = dict(efeats)
+        decoded_efeats["etype"] = LIST_ETYPE[efeats["etype"]].value
+        decoded_efeats["text"] = self.string_table.lookup(efeats["text"])
+
+        return decoded_efeats
+
+    def encode_graph(self, nx_g: Graph) -> Graph:  # type: ignore[no-any-unimported]
+        encoded_g = nx_g.__class__()
+        encoded_g.add_nodes_from(
+            (nid, self.encode_node_feats(nfeats)) for nid, nfeats in nx_g.nodes.data()
+        )
+        encoded_g.add_edges_from(
+            (u, v, self.encode_edge_feats(efeats)) for u, v, efeats in nx_g.edges.data()
+        )
+
+        return encoded_g
+
+    def decode_graph(self, nx_g: Graph) -> Graph:  # type: ignore[no-any-unimported]
+        decoded_g = nx_g.__class__()
+        decoded_g.add_nodes_from(
+            (nid, self.decode_node_feats(nfeats)) for nid, nfeats in nx_g.nodes.data()
+        )
+        decoded_g.add_edges_from(
+            (u, v, self.decode_edge_feats(efeats)) for u, v, efeats in nx_g.edges.data()
+        )
+
+        return decoded_g
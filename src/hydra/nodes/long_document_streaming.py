@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import re
+from logging import Logger
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Pattern, Union
+
+from networkx import Graph
+
+from .linguistic_graph_builder import ParaGraphBuilder
+from .linguistic_graph_config import NetworkXGraphType
+from .linguistic_graph_construction import (
+    add_spacy_doc_to_graph_builder,
+    finish_para_graph,
+)
+from .linguistic_graph_csr import CSRGraph
+from .linguistic_graph_schema import (
+    FULL_GRAPH_SCHEMA,
+    GraphSchema,
+    get_spacy_pipes_to_disable,
+)
+from .linguistic_graph_vocab import GraphVocab
+from .pipeline_metrics import NULL_PIPELINE_METRICS, PipelineMetrics
+from .spacy_parse_cache import SpacyParseCache
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens import Doc
+
+# Boundaries to end a chunk after, from the most to the least preferred: blank
+# lines between paragraphs, line breaks, sentence ends, then any whitespace
+LIST_CHUNK_BOUNDARY_PATTERN: List[Pattern[str]] = [
+    re.compile(r"\n\s*\n\s*"),
+    re.compile(r"\n\s*"),
+    re.compile(r"[.!?][\"')\]]*\s+"),
+    re.compile(r"\s+"),
+]
+
+
+def _find_chunk_end(text: str, start: int, max_chunk_chars: int) -> int:
+    end = start + max_chunk_chars
+    if end >= len(text):
+        return len(text)
+
+    # A boundary must be followed by text within the window, so its whitespace
+    # stays whole and no token is split between chunks
+    window = text[start:end]
+    for pattern in LIST_CHUNK_BOUNDARY_PATTERN:
+        chunk_end: Optional[int] = None
+        for match in pattern.finditer(window):
+            if match.end() < len(window):
+                chunk_end = match.end()
+        if chunk_end is not None:
+            return start + chunk_end
+
+    # Cut text without any whitespace at the window's end
+    return end
+
+
+def iter_text_chunks(text: str, max_chunk_chars: int) -> Iterator[str]:
+    # Chunks are consecutive and join back into the text
+    if max_chunk_chars < 1:
+        raise ValueError(f"Chunk size must be positive but got {max_chunk_chars}")
+
+    start: int = 0
+    while start < len(text):
+        end = _find_chunk_end(text=text, start=start, max_chunk_chars=max_chunk_chars)
+        yield text[start:end]
+        start = end
+
+
+def parse_long_document_for_para_graph(  # type: ignore[no-any-unimported]
+    text: str,
+    nlp: Language,
+    logger: Logger,
+    max_chunk_chars: int = 100000,
+    batch_size: int = 1,
+    vectorized: bool = False,
+    graph_type: NetworkXGraphType = NetworkXGraphType.digraph,
+    parse_cache: Optional[SpacyParseCache] = None,
+    metrics: Optional[PipelineMetrics] = None,
+    schema: Optional[GraphSchema] = None,
+    vocab: Optional[GraphVocab] = None,
+) -> Union[Graph, CSRGraph]:
+    metrics = NULL_PIPELINE_METRICS if metrics is None else metrics
+    schema = FULL_GRAPH_SCHEMA if schema is None else schema
+    if max_chunk_chars > nlp.max_length:
+        raise ValueError(
+            f"Chunk size {max_chunk_chars} exceeds the spacy model's maximum "
+            f"text length {nlp.max_length}"
+        )
+
+    # Skip spacy components whose annotations the schema does not read
+    list_disable_pipe = get_spacy_pipes_to_disable(nlp=nlp, schema=schema)
+
+    chunks = iter_text_chunks(text=text, max_chunk_chars=max_chunk_chars)
+    docs: Iterable[Doc] = (
+        nlp.pipe(chunks, batch_size=batch_size, disable=list_disable_pipe)
+        if parse_cache is None
+        else parse_cache.pipe(
+            texts=chunks,
+            nlp=nlp,
+            batch_size=batch_size,
+            disable=list_disable_pipe,
+        )
+    )
+
+    # Fold each chunk's sentence graphs into one contracted graph and drop its
+    # doc before parsing the next, so at most a batch of chunks is held at once.
+    # Token positions are shifted by the tokens of the chunks before
+    para_graph_builder = ParaGraphBuilder(logger=logger, metrics=metrics, vocab=vocab)
+    iter_doc: Iterator[Doc] = iter(docs)
+    position_offset: int = 0
+    n_chunk: int = 0
+    while True:
+        with metrics.time_stage("spacy_parse"):
+            doc = next(iter_doc, None)
+        if doc is None:
+            break
+        add_spacy_doc_to_graph_builder(
+            para_graph_builder=para_graph_builder,
+            doc=doc,
+            logger=logger,
+            vectorized=vectorized,
+            schema=schema,
+            position_offset=position_offset,
+        )
+        position_offset += len(doc)
+        n_chunk += 1
+
+    logger.info(
+        f"Parsed a document of {len(text)} characters and {position_offset} tokens "
+        f"in {n_chunk} chunks of at most {max_chunk_chars} characters"
+    )
+
+    return finish_para_graph(
+        para_graph_builder=para_graph_builder,
+        logger=logger,
+        graph_type=graph_type,
+        vocab=vocab,
+    )
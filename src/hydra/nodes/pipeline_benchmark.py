@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import json
+import platform
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass
+from logging import Logger
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from dataclasses_json import dataclass_json
+
+from .linguistic_graph_construction import (
+    build_graph_from_node_tuples_and_edge_tuples,
+    collect_sent_graph_elements_from_spacy,
+    contract_ntype_nodes_by_identical_text,
+    parse_for_para_graph_with_spacy,
+)
+from .linguistic_graph_edges import EdgeTuple, EdgeTuples
+from .linguistic_graph_nodes import NodeTuple, NodeTuples, NodeType
+from .spacy_parse_cache import get_spacy_model_fingerprint
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens import Doc
+
+# Functions of the construction pipeline covered by the benchmark
+LIST_BENCHMARK_FUNCTION: List[str] = [
+    "collect_sent_graph_elements_from_spacy",
+    "build_graph_from_node_tuples_and_edge_tuples",
+    "contract_ntype_nodes_by_identical_text",
+    "parse_for_para_graph_with_spacy",
+]
+
+# Common words drawn on to repeat tokens across a synthetic paragraph
+LIST_SHARED_WORD: List[str] = (
+    "the language of a people is always more powerful than it seems and "
+    "we can only talk about ourselves in the words that our culture gives us "
+    "while artists shape how every reader sees the world around them"
+).split()
+
+SYNTHETIC_SENT_LENGTH: int = 12
+
+
+@dataclass_json
+@dataclass
+class BenchmarkResult:
+    function: str
+    size: int
+    duplication_ratio: float
+    seconds: float
+    peak_bytes: int
+
+
+def _get_unique_word(index: int) -> str:
+    # Spell the index in base 26 so that every word is alphabetic and distinct
+    letters: List[str] = []
+    index += 26
+    while index > 0:
+        index, remainder = divmod(index, 26)
+        letters.append("abcdefghijklmnopqrstuvwxyz"[remainder])
+
+    return "".join(reversed(letters))
+
+
+def generate_synthetic_paragraph(
+    size: int, duplication_ratio: float, seed: int = 0
+) -> str:
+    if not 0.0 <= duplication_ratio <= 1.0:
+        raise ValueError(f"Duplication ratio {duplication_ratio} is not in [0, 1]")
+
+    # Draw each word from the shared words with the duplication ratio as
+    # probability, and make it a word unseen in the paragraph otherwise
+    rng = random.Random(seed)
+    list_word: List[str] = [
+        (
+            rng.choice(LIST_SHARED_WORD)
+            if rng.random() < duplication_ratio
+            else _get_unique_word(index)
+        )
+        for index in range(size)
+    ]
+
+    list_sent: List[str] = []
+    for start in range(0, size, SYNTHETIC_SENT_LENGTH):
+        list_sent_word = list_word[start : start + SYNTHETIC_SENT_LENGTH]
+        list_sent.append(" ".join(list_sent_word).capitalize() + ".")
+
+    return " ".join(list_sent)
+
+
+def generate_synthetic_corpus(
+    list_size: List[int], list_duplication_ratio: List[float], seed: int = 0
+) -> Dict[Tuple[int, float], str]:
+    return {
+        (size, duplication_ratio): generate_synthetic_paragraph(
+            size=size, duplication_ratio=duplication_ratio, seed=seed
+        )
+        for size in list_size
+        for duplication_ratio in list_duplication_ratio
+    }
+
+
+def _merge_sent_graph_elements(
+    list_sent_element: List[Tuple[NodeTuples, EdgeTuples]],
+) -> Tuple[NodeTuples, EdgeTuples]:
+    # Offset node ids of every sentence so that all sentences form one graph
+    node_tuples = NodeTuples(list_node_tuple=[])
+    edge_tuples = EdgeTuples(list_edge_tuple=[])
+    nid_offset: int = 0
+    for sent_node_tuples, sent_edge_tuples in list_sent_element:
+        for node_tuple in sent_node_tuples.list_node_tuple:
+            node_tuples.list_node_tuple.append(
+                NodeTuple(
+                    node_id=node_tuple.node_id + nid_offset,
+                    node_feats=node_tuple.node_feats,
+                )
+            )
+        for edge_tuple in sent_edge_tuples.list_edge_tuple:
+            edge_tuples.list_edge_tuple.append(
+                EdgeTuple(
+                    src_id=edge_tuple.src_id + nid_offset,
+                    dst_id=edge_tuple.dst_id + nid_offset,
+                    edge_feats=edge_tuple.edge_feats,
+                )
+            )
+        nid_offset += len(sent_node_tuples.list_node_tuple)
+
+    return node_tuples, edge_tuples
+
+
+def _measure(func: Callable[[], Any], n_repeat: int) -> Tuple[float, int]:
+    # Time runs without tracing, then trace one more run for its peak memory
+    seconds: float = float("inf")
+    for _ in range(n_repeat):
+        start_time = time.perf_counter()
+        func()
+        seconds = min(seconds, time.perf_counter() - start_time)
+
+    is_tracing: bool = tracemalloc.is_tracing()
+    if not is_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start_bytes, _ = tracemalloc.get_traced_memory()
+    func()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    if not is_tracing:
+        tracemalloc.stop()
+
+    return seconds, max(peak_bytes - start_bytes, 0)
+
+
+def _get_benchmark_funcs(
+    text: str, doc: Doc, nlp: Language, logger: Logger
+) -> Dict[str, Callable[[], Any]]:
+    # Prepare the inputs of each function so that only the function is measured
+    list_sent_element = [
+        collect_sent_graph_elements_from_spacy(sent=sent, logger=logger)
+        for sent in doc.sents
+    ]
+    node_tuples, edge_tuples = _merge_sent_graph_elements(
+        list_sent_element=list_sent_element
+    )
+    nx_g = build_graph_from_node_tuples_and_edge_tuples(
+        node_tuples=node_tuples, edge_tuples=edge_tuples, logger=logger
+    )
+
+    return {
+        "collect_sent_graph_elements_from_spacy": lambda: [
+            collect_sent_graph_elements_from_spacy(sent=sent, logger=logger)
+            for sent in doc.sents
+        ],
+        "build_graph_from_node_tuples_and_edge_tuples": lambda: (
+            build_graph_from_node_tuples_and_edge_tuples(
+                node_tuples=node_tuples, edge_tuples=edge_tuples, logger=logger
+            )
+        ),
+        "contract_ntype_nodes_by_identical_text": lambda: (
+            contract_ntype_nodes_by_identical_text(
+                nx_g=nx_g, ntype=NodeType.token, logger=logger
+            )
+        ),
+        "parse_for_para_graph_with_spacy": lambda: parse_for_para_graph_with_spacy(
+            text=text, nlp=nlp, logger=logger
+        ),
+    }
+
+
+def run_pipeline_benchmark(
+    nlp: Language,
+    logger: Logger,
+    list_size: List[int],
+    list_duplication_ratio: List[float],
+    n_repeat: int = 3,
+    seed: int = 0,
+) -> List[BenchmarkResult]:
+    dict_size_ratio_text = generate_synthetic_corpus(
+        list_size=list_size, list_duplication_ratio=list_duplication_ratio, seed=seed
+    )
+
+    list_benchmark_result: List[BenchmarkResult] = []
+    for (size, duplication_ratio), text in dict_size_ratio_text.items():
+        dict_func = _get_benchmark_funcs(
+            text=text, doc=nlp(text), nlp=nlp, logger=logger
+        )
+        for function in LIST_BENCHMARK_FUNCTION:
+            seconds, peak_bytes = _measure(func=dict_func[function], n_repeat=n_repeat)
+            list_benchmark_result.append(
+                BenchmarkResult(
+                    function=function,
+                    size=size,
+                    duplication_ratio=duplication_ratio,
+                    seconds=seconds,
+                    peak_bytes=peak_bytes,
+                )
+            )
+
+            logger.info(
+                f"{function} over {size} words with duplication ratio "
+                f"{duplication_ratio}: {seconds * 1e3:.2f} ms, {peak_bytes} peak bytes"
+            )
+
+    return list_benchmark_result
+
+
+def get_scaling_exponents(
+    list_benchmark_result: List[BenchmarkResult], min_seconds: float = 0.0
+) -> Dict[Tuple[str, float], float]:
+    # Fit time as a power of size, so that 1 is linear and 2 is quadratic,
+    # leaving out timings too short to rise above noise
+    dict_key_points: Dict[Tuple[str, float], List[Tuple[int, float]]] = {}
+    for result in list_benchmark_result:
+        if result.seconds < min_seconds:
+            continue
+        dict_key_points.setdefault(
+            (result.function, result.duplication_ratio), []
+        ).append((result.size, result.seconds))
+
+    dict_key_exponent: Dict[Tuple[str, float], float] = {}
+    for key, list_point in dict_key_points.items():
+        if len({size for size, _ in list_point}) < 2:
+            continue
+        arr_size, arr_seconds = np.array(list_point, dtype=np.float64).T
+        slope, _ = np.polyfit(np.log(arr_size), np.log(arr_seconds), deg=1)
+        dict_key_exponent[key] = float(slope)
+
+    return dict_key_exponent
+
+
+def get_benchmark_environment(nlp: Language) -> Dict[str, str]:
+    import spacy
+
+    return {
+        "python": platform.python_version(),
+        "spacy": spacy.__version__,
+        "model": get_spacy_model_fingerprint(nlp=nlp),
+        "machine": platform.machine(),
+    }
+
+
+def save_benchmark_baseline(
+    list_benchmark_result: List[BenchmarkResult], path_baseline: Path, nlp: Language
+) -> None:
+    # Record where the baseline was measured, as timings only compare within it
+    baseline: Dict[str, Any] = {
+        "environment": get_benchmark_environment(nlp=nlp),
+        "results": [
+            result.to_dict()  # type: ignore[attr-defined]
+            for result in list_benchmark_result
+        ],
+    }
+    path_baseline.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+
+
+def load_benchmark_baseline(path_baseline: Path) -> List[BenchmarkResult]:
+    baseline: Dict[str, Any] = json.loads(path_baseline.read_text(encoding="utf-8"))
+
+    return [
+        BenchmarkResult.from_dict(result)  # type: ignore[attr-defined]
+        for result in baseline["results"]
+    ]
+
+
+def compare_with_benchmark_baseline(
+    list_benchmark_result: List[BenchmarkResult],
+    list_baseline_result: List[BenchmarkResult],
+    time_tolerance: float = 2.0,
+    memory_tolerance: float = 1.5,
+    min_seconds: float = 5e-3,
+    min_bytes: int = 1 << 16,
+    max_scaling_exponent: float = 1.5,
+) -> List[str]:
+    dict_key_baseline: Dict[Tuple[str, int, float], BenchmarkResult] = {
+        (result.function, result.size, result.duplication_ratio): result
+        for result in list_baseline_result
+    }
+
+    # Flag measurements beyond the baseline by both a ratio and an absolute
+    # margin, which keeps noise on tiny measurements from failing the check
+    list_regression: List[str] = []
+    for result in list_benchmark_result:
+        baseline_result: Optional[BenchmarkResult] = dict_key_baseline.get(
+            (result.function, result.size, result.duplication_ratio)
+        )
+        if baseline_result is None:
+            continue
+        label = (
+            f"{result.function} over {result.size} words "
+            f"with duplication ratio {result.duplication_ratio}"
+        )
+        if (
+            result.seconds > baseline_result.seconds * time_tolerance
+            and result.seconds - baseline_result.seconds > min_seconds
+        ):
+            list_regression.append(
+                f"{label} took {result.seconds * 1e3:.2f} ms against a baseline "
+                f"of {baseline_result.seconds * 1e3:.2f} ms"
+            )
+        if (
+            result.peak_bytes > baseline_result.peak_bytes * memory_tolerance
+            and result.peak_bytes - baseline_result.peak_bytes > min_bytes
+        ):
+            list_regression.append(
+                f"{label} peaked at {result.peak_bytes} bytes against a baseline "
+                f"of {baseline_result.peak_bytes} bytes"
+            )
+
+    # Flag superlinear growth regardless of the machine measurements came from
+    for (function, duplication_ratio), exponent in get_scaling_exponents(
+        list_benchmark_result=list_benchmark_result, min_seconds=min_seconds
+    ).items():
+        if exponent > max_scaling_exponent:
+            list_regression.append(
+                f"{function} with duplication ratio {duplication_ratio} scales "
+                f"with size to the power of {exponent:.2f}"
+            )
+
+    return list_regression
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Tuple, Type
+
+from dataclasses_json import dataclass_json
+
+CounterKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+@dataclass_json
+@dataclass
+class StageMetrics:
+    n_calls: int = 0
+    seconds: float = 0.0
+    alloc_bytes: int = 0
+    peak_alloc_bytes: int = 0
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+
+    return (
+        "{"
+        + ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels)
+        + "}"
+    )
+
+
+class PipelineMetrics:
+    def __init__(self, track_allocations: bool = False) -> None:
+        self.track_allocations = track_allocations
+        self.dict_stage_metrics: Dict[str, StageMetrics] = {}
+        self.dict_counter: Dict[CounterKey, int] = {}
+
+        # Allocation baselines and peaks of the stages currently open
+        self.list_open_stage_alloc: List[List[int]] = []
+        # Tracing slows every allocation down, so it is only stopped by the
+        # instance that started it
+        self.started_tracing = track_allocations and not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start()
+
+    def __enter__(self) -> PipelineMetrics:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.started_tracing:
+            self.started_tracing = False
+            tracemalloc.stop()
+
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    @contextmanager
+    def _time_stage(self, stage: str) -> Iterator[None]:
+        if self.track_allocations:
+            current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            if self.list_open_stage_alloc:
+                # Keep the enclosing stage's peak before the peak is reset
+                parent_alloc = self.list_open_stage_alloc[-1]
+                parent_alloc[1] = max(parent_alloc[1], peak_bytes)
+            tracemalloc.reset_peak()
+            self.list_open_stage_alloc.append([current_bytes, current_bytes])
+
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            stage_metrics = self.dict_stage_metrics.setdefault(stage, StageMetrics())
+            stage_metrics.n_calls += 1
+            stage_metrics.seconds += time.perf_counter() - start_time
+
+            if self.track_allocations:
+                end_bytes, peak_bytes = tracemalloc.get_traced_memory()
+                start_bytes, max_peak_bytes = self.list_open_stage_alloc.pop()
+                max_peak_bytes = max(max_peak_bytes, peak_bytes)
+                stage_metrics.alloc_bytes += max(end_bytes - start_bytes, 0)
+                stage_metrics.peak_alloc_bytes = max(
+                    stage_metrics.peak_alloc_bytes, max_peak_bytes - start_bytes
+                )
+                if self.list_open_stage_alloc:
+                    parent_alloc = self.list_open_stage_alloc[-1]
+                    parent_alloc[1] = max(parent_alloc[1], max_peak_bytes)
+
+    def time_stage(self, stage: str) -> ContextManager[None]:
+        return self._time_stage(stage=stage)
+
+    def count(self, name: str, value: int = 1, **labels: str) -> None:
+        key: CounterKey = (name, tuple(sorted(labels.items())))
+        self.dict_counter[key] = self.dict_counter.get(key, 0) + value
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "stages": {
+                stage: stage_metrics.to_dict()  # type: ignore[attr-defined]
+                for stage, stage_metrics in self.dict_stage_metrics.items()
+            },
+            "counters": {
+                name + _format_labels(labels): value
+                for (name, labels), value in self.dict_counter.items()
+            },
+        }
+
+    def to_prometheus_text(self, prefix: str = "hydra") -> str:
+        list_line: List[str] = []
+
+        list_stage_metric: List[Tuple[str, str, str]] = [
+            ("stage_calls_total", "counter", "n_calls"),
+            ("stage_seconds_total", "counter", "seconds"),
+        ]
+        if self.track_allocations:
+            list_stage_metric += [
+                ("stage_alloc_bytes_total", "counter", "alloc_bytes"),
+                ("stage_peak_alloc_bytes", "gauge", "peak_alloc_bytes"),
+            ]
+        for metric_name, metric_type, field in list_stage_metric:
+            list_line.append(f"# TYPE {prefix}_{metric_name} {metric_type}")
+            for stage, stage_metrics in self.dict_stage_metrics.items():
+                list_line.append(
+                    f"{prefix}_{metric_name}{_format_labels((('stage', stage),))} "
+                    f"{getattr(stage_metrics, field)}"
+                )
+
+        set_counter_name = sorted({name for name, _ in self.dict_counter})
+        for counter_name in set_counter_name:
+            list_line.append(f"# TYPE {prefix}_{counter_name}_total counter")
+            for (name, labels), value in self.dict_counter.items():
+                if name == counter_name:
+                    list_line.append(
+                        f"{prefix}_{name}_total{_format_labels(labels)} {value}"
+                    )
+
+        return "\n".join(list_line) + "\n"
+
+
+class NullPipelineMetrics(PipelineMetrics):
+    # Stands in when metrics are disabled so that stages cost one method call
+    def __init__(self) -> None:
+        super().__init__(track_allocations=False)
+        self._null_context: ContextManager[None] = nullcontext()
+
+    @property
+    def enabled(self) -> bool:
+        return False
+
+    def time_stage(self, stage: str) -> ContextManager[None]:
+        return self._null_context
+
+    def count(self, name: str, value: int = 1, **labels: str) -> None:
+        return None
+
+
+NULL_PIPELINE_METRICS = NullPipelineMetrics()
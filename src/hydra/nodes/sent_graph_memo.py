@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import hashlib
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from logging import Logger
+from typing import Optional, Tuple
+
+import numpy as np
+from dataclasses_json import dataclass_json
+
+from .linguistic_graph_arrays import GraphArrays
+from .linguistic_graph_schema import GraphSchema
+
+
+@dataclass_json
+@dataclass
+class SentGraphMemoStats:
+    n_hits: int
+    n_misses: int
+    n_evictions: int
+    n_entries: int
+    n_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        n_lookups = self.n_hits + self.n_misses
+        return self.n_hits / n_lookups if n_lookups > 0 else 0.0
+
+
+def get_schema_fingerprint(schema: GraphSchema) -> str:
+    return "/".join(
+        [
+            ",".join(ntype.value for ntype in schema.list_ntype),
+            ",".join(etype.value for etype in schema.list_etype),
+        ]
+    )
+
+
+def _get_graph_arrays_n_bytes(graph_arrays: GraphArrays) -> int:
+    # Column buffers plus the characters of node and edge text
+    return sum(
+        arr.nbytes
+        for arr in [
+            graph_arrays.node_ntype,
+            graph_arrays.node_text,
+            graph_arrays.node_position_id,
+            graph_arrays.edge_src,
+            graph_arrays.edge_dst,
+            graph_arrays.edge_etype,
+            graph_arrays.edge_text,
+        ]
+    ) + sum(
+        len(text)
+        for text in graph_arrays.node_text.tolist() + graph_arrays.edge_text.tolist()
+    )
+
+
+class SentGraphMemo:
+    # Bounded in memory LRU of the elements of sentences already collected,
+    # keyed on NFC normalized sentence text with runs of whitespace collapsed,
+    # its token count and the schema, with token positions held relative to the
+    # sentence start. Entries assume one spacy model per memo. A hit reuses the
+    # parse of the first doc the sentence was seen in, while spacy parses a
+    # sentence in the context of its doc, so entities, dependency labels and
+    # token text can differ from what parsing the later doc would give
+    def __init__(
+        self, logger: Logger, max_entries: int = 65536, max_bytes: int = 1 << 28
+    ) -> None:
+        self.logger = logger
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.dict_key_entry: OrderedDict[bytes, Tuple[GraphArrays, int]] = OrderedDict()
+        self.n_bytes: int = 0
+        self.n_hits: int = 0
+        self.n_misses: int = 0
+        self.n_evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self.dict_key_entry)
+
+    @property
+    def stats(self) -> SentGraphMemoStats:
+        return SentGraphMemoStats(
+            n_hits=self.n_hits,
+            n_misses=self.n_misses,
+            n_evictions=self.n_evictions,
+            n_entries=len(self.dict_key_entry),
+            n_bytes=self.n_bytes,
+        )
+
+    def _get_key(self, sent_text: str, n_tokens: int, schema: GraphSchema) -> bytes:
+        hasher = hashlib.blake2b(
+            get_schema_fingerprint(schema=schema).encode("utf-8"), digest_size=16
+        )
+        hasher.update(b"\0")
+        hasher.update(str(n_tokens).encode("utf-8"))
+        hasher.update(b"\0")
+        # Whitespace spacy keeps as tokens changes the token count, which stops
+        # a hit from shifting positions
+        hasher.update(
+            unicodedata.normalize("NFC", " ".join(sent_text.split())).encode("utf-8")
+        )
+
+        return hasher.digest()
+
+    def get(
+        self, sent_text: str, n_tokens: int, schema: GraphSchema, position_start: int
+    ) -> Optional[GraphArrays]:
+        key = self._get_key(sent_text=sent_text, n_tokens=n_tokens, schema=schema)
+        entry = self.dict_key_entry.get(key)
+        if entry is None:
+            self.n_misses += 1
+            return None
+
+        self.dict_key_entry.move_to_end(key)
+        self.n_hits += 1
+
+        # Place token positions at the sentence's start in its doc
+        graph_arrays, _ = entry
+        node_position_id = graph_arrays.node_position_id
+
+        return replace(
+            graph_arrays,
+            node_position_id=np.where(
+                node_position_id < 0,
+                node_position_id,
+                node_position_id + position_start,
+            ),
+        )
+
+    def put(
+        self,
+        sent_text: str,
+        n_tokens: int,
+        schema: GraphSchema,
+        graph_arrays: GraphArrays,
+        position_start: int,
+    ) -> None:
+        key = self._get_key(sent_text=sent_text, n_tokens=n_tokens, schema=schema)
+        if key in self.dict_key_entry:
+            return
+
+        node_position_id = graph_arrays.node_position_id
+        relative_graph_arrays = replace(
+            graph_arrays,
+            node_position_id=np.where(
+                node_position_id < 0,
+                node_position_id,
+                node_position_id - position_start,
+            ),
+        )
+        n_bytes = _get_graph_arrays_n_bytes(graph_arrays=relative_graph_arrays)
+        self.dict_key_entry[key] = (relative_graph_arrays, n_bytes)
+        self.n_bytes += n_bytes
+
+        self._evict()
+
+    def _evict(self) -> None:
+        # Drop least recently used sentences until the memo fits its budgets
+        while self.dict_key_entry and (
+            self.n_bytes > self.max_bytes or len(self.dict_key_entry) > self.max_entries
+        ):
+            _, (_, n_bytes) = self.dict_key_entry.popitem(last=False)
+            self.n_bytes -= n_bytes
+            self.n_evictions += 1
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from itertools import chain
+from logging import Logger
+from time import perf_counter
+from typing import TYPE_CHECKING, Deque, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from dataclasses_json import dataclass_json
+
+from .utils import iter_windows
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens import Doc
+
+
+@dataclass_json
+@dataclass
+class LengthBatchingStats:
+    n_docs: int
+    n_batches: int
+    n_tokens: int
+    n_padded_tokens: int
+    parse_seconds: float
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.n_docs / self.parse_seconds if self.parse_seconds > 0 else 0.0
+
+    @property
+    def padding_ratio(self) -> float:
+        # Share of the token slots of padded batches holding no token
+        return (
+            1 - self.n_tokens / self.n_padded_tokens
+            if self.n_padded_tokens > 0
+            else 0.0
+        )
+
+
+def split_length_batches(
+    arr_n_token: np.ndarray, max_batch_tokens: int
+) -> List[np.ndarray]:
+    # Visit docs from the shortest so each batch pads to the length of its
+    # last doc, starting a new batch once the padded size would pass the budget
+    arr_order = np.argsort(arr_n_token, kind="stable")
+    list_batch: List[np.ndarray] = []
+    batch_start: int = 0
+    for position, n_token in enumerate(arr_n_token[arr_order].tolist()):
+        if (
+            position > batch_start
+            and (position - batch_start + 1) * n_token > max_batch_tokens
+        ):
+            list_batch.append(arr_order[batch_start:position])
+            batch_start = position
+    if batch_start < arr_order.shape[0]:
+        list_batch.append(arr_order[batch_start:])
+
+    return list_batch
+
+
+class SpacyLengthBatcher:
+    # Parse texts in batches of similar token length whose padded size fits a
+    # token budget, which keeps transformer models from padding short texts to
+    # the longest text of a batch in arrival order
+    def __init__(
+        self,
+        logger: Logger,
+        max_batch_tokens: int = 4096,
+        window_size: int = 256,
+    ) -> None:
+        if max_batch_tokens < 1:
+            raise ValueError(
+                f"Token budget of a batch must be positive but got {max_batch_tokens}"
+            )
+        self.logger = logger
+        self.max_batch_tokens = max_batch_tokens
+        self.window_size = window_size
+
+        self.n_docs: int = 0
+        self.n_batches: int = 0
+        self.n_tokens: int = 0
+        self.n_padded_tokens: int = 0
+        self.parse_seconds: float = 0.0
+
+    @property
+    def stats(self) -> LengthBatchingStats:
+        return LengthBatchingStats(
+            n_docs=self.n_docs,
+            n_batches=self.n_batches,
+            n_tokens=self.n_tokens,
+            n_padded_tokens=self.n_padded_tokens,
+            parse_seconds=self.parse_seconds,
+        )
+
+    def _pipe_batches(
+        self,
+        list_doc: List[Doc],
+        arr_n_token: np.ndarray,
+        nlp: Language,
+        disable: List[str],
+    ) -> List[Optional[Doc]]:
+        # One pipeline call per batch, each fitting the token budget
+        list_parsed_doc: List[Optional[Doc]] = [None] * len(list_doc)
+        for arr_index in split_length_batches(
+            arr_n_token=arr_n_token, max_batch_tokens=self.max_batch_tokens
+        ):
+            list_index: List[int] = arr_index.tolist()
+            for index, parsed_doc in zip(
+                list_index,
+                nlp.pipe(
+                    [list_doc[index] for index in list_index],
+                    batch_size=len(list_index),
+                    disable=disable,
+                ),
+            ):
+                list_parsed_doc[index] = parsed_doc
+            self.n_batches += 1
+            self.n_padded_tokens += len(list_index) * int(arr_n_token[arr_index].max())
+
+        return list_parsed_doc
+
+    def _make_docs(
+        self, window: List[str], nlp: Language
+    ) -> Tuple[List[Doc], np.ndarray]:
+        list_doc: List[Doc] = [nlp.make_doc(text) for text in window]
+        arr_n_token = np.fromiter(map(len, list_doc), dtype=np.int64)
+        self.n_docs += len(list_doc)
+        self.n_tokens += int(arr_n_token.sum())
+
+        return list_doc, arr_n_token
+
+    def _count_batches(self, arr_sorted_n_token: np.ndarray, batch_size: int) -> None:
+        # Batches of a fixed size over docs sorted by length pad to their last doc
+        arr_batch_start = np.arange(0, arr_sorted_n_token.shape[0], batch_size)
+        self.n_batches += int(arr_batch_start.shape[0])
+        self.n_padded_tokens += int(
+            (
+                np.diff(np.append(arr_batch_start, arr_sorted_n_token.shape[0]))
+                * np.maximum.reduceat(arr_sorted_n_token, arr_batch_start)
+            ).sum()
+        )
+
+    def _pipe_windows(
+        self,
+        texts: Iterable[str],
+        nlp: Language,
+        n_process: int,
+        disable: List[str],
+    ) -> Iterator[Doc]:
+        # spacy starts a pool of workers on every pipeline call and takes one
+        # batch size per call, so every window goes through one call in length
+        # order, in batches of the average size the token budget gives the first
+        # window. Docs of each window are put back in input order on the way out
+        time_start = perf_counter()
+        iter_window = iter_windows(iterable=texts, window_size=self.window_size)
+        first_window = next(iter_window, None)
+        if first_window is None:
+            return
+        first_list_doc, first_arr_n_token = self._make_docs(
+            window=first_window, nlp=nlp
+        )
+        batch_size = max(
+            1,
+            round(
+                len(first_list_doc)
+                / len(
+                    split_length_batches(
+                        arr_n_token=first_arr_n_token,
+                        max_batch_tokens=self.max_batch_tokens,
+                    )
+                )
+            ),
+        )
+
+        # Orders of the windows fed to the pipeline but not yet yielded
+        deque_arr_order: Deque[np.ndarray] = deque()
+
+        def iter_sorted_doc() -> Iterator[Doc]:
+            for list_doc, arr_n_token in chain(
+                [(first_list_doc, first_arr_n_token)],
+                (self._make_docs(window=window, nlp=nlp) for window in iter_window),
+            ):
+                arr_order = np.argsort(arr_n_token, kind="stable")
+                self._count_batches(
+                    arr_sorted_n_token=arr_n_token[arr_order], batch_size=batch_size
+                )
+                deque_arr_order.append(arr_order)
+                for index in arr_order.tolist():
+                    yield list_doc[index]
+
+        parsed_docs = iter(
+            nlp.pipe(
+                iter_sorted_doc(),
+                batch_size=batch_size,
+                n_process=n_process,
+                disable=disable,
+            )
+        )
+        while True:
+            parsed_doc = next(parsed_docs, None)
+            if parsed_doc is None:
+                break
+            arr_order = deque_arr_order.popleft()
+            list_parsed_doc: List[Optional[Doc]] = [None] * arr_order.shape[0]
+            list_index: List[int] = arr_order.tolist()
+            list_parsed_doc[list_index[0]] = parsed_doc
+            for index in list_index[1:]:
+                list_parsed_doc[index] = next(parsed_docs)
+            self.parse_seconds += perf_counter() - time_start
+
+            for window_doc in list_parsed_doc:
+                if window_doc is None:
+                    raise RuntimeError("A text in the window was left unparsed")
+                yield window_doc
+            time_start = perf_counter()
+
+    def pipe(
+        self,
+        texts: Iterable[str],
+        nlp: Language,
+        n_process: int = 1,
+        disable: Optional[List[str]] = None,
+    ) -> Iterator[Doc]:
+        # Tokenize a window of texts once to sort them by length, then hand the
+        # tokenized docs to the pipeline and yield them back in input order.
+        # With several processes the budget holds for the average batch only
+        list_disable_pipe = [] if disable is None else disable
+        if n_process != 1:
+            yield from self._pipe_windows(
+                texts=texts, nlp=nlp, n_process=n_process, disable=list_disable_pipe
+            )
+        else:
+            for window in iter_windows(iterable=texts, window_size=self.window_size):
+                time_start = perf_counter()
+                list_doc, arr_n_token = self._make_docs(window=window, nlp=nlp)
+                list_parsed_doc = self._pipe_batches(
+                    list_doc=list_doc,
+                    arr_n_token=arr_n_token,
+                    nlp=nlp,
+                    disable=list_disable_pipe,
+                )
+                self.parse_seconds += perf_counter() - time_start
+
+                for window_doc in list_parsed_doc:
+                    if window_doc is None:
+                        raise RuntimeError("A text in the window was left unparsed")
+                    yield window_doc
+
+        self.logger.debug(f"Length batching stats after streaming: {self.stats}")
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import gc
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+ModelKey = Tuple[str, Tuple[str, ...]]
+
+
+def _load_spacy_model(name: str, exclude: List[str]) -> Language:
+    # spacy is imported on the first load rather than with this module
+    import spacy
+
+    nlp: Language = spacy.load(name, exclude=exclude)
+
+    return nlp
+
+
+class SpacyModelRegistry:
+    # Spacy models loaded at most once per process, by name and excluded
+    # components. Worker processes forked after a model is loaded find it here
+    # and share its memory with the parent copy on write
+    def __init__(
+        self, load_model: Callable[[str, List[str]], Language] = _load_spacy_model
+    ) -> None:
+        self.load_model = load_model
+        self.mapping_key_to_nlp: Dict[ModelKey, Language] = {}
+        self.lock = threading.Lock()
+
+    def __contains__(self, name: str) -> bool:
+        return any(key[0] == name for key in self.mapping_key_to_nlp)
+
+    def get(self, name: str, exclude: Optional[List[str]] = None) -> Language:
+        key: ModelKey = (name, tuple(sorted([] if exclude is None else exclude)))
+        nlp = self.mapping_key_to_nlp.get(key)
+        if nlp is not None:
+            return nlp
+
+        # Threads asking for the same model at once wait for a single load
+        with self.lock:
+            nlp = self.mapping_key_to_nlp.get(key)
+            if nlp is None:
+                nlp = self.load_model(name, list(key[1]))
+                self.mapping_key_to_nlp[key] = nlp
+
+        return nlp
+
+    def warm(self, list_name: List[str], freeze_gc: bool = True) -> None:
+        for name in list_name:
+            self.get(name=name)
+
+        # Move loaded objects out of the collector's generations, so collections
+        # in forked workers do not write to the pages they share with the parent
+        if freeze_gc:
+            gc.freeze()
+
+    def clear(self) -> None:
+        with self.lock:
+            self.mapping_key_to_nlp.clear()
+
+
+SPACY_MODEL_REGISTRY = SpacyModelRegistry()
+
+
+def load_spacy_model(name: str, exclude: Optional[List[str]] = None) -> Language:
+    return SPACY_MODEL_REGISTRY.get(name=name, exclude=exclude)
+
+
+@dataclass
+class SpacyModelLoader:
+    # Picklable model loader for worker processes, which reuses a model already
+    # in the process wide registry
+    name: str
+    exclude: List[str] = field(default_factory=list)
+
+    def __call__(self) -> Language:
+        return load_spacy_model(name=self.name, exclude=self.exclude)
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from logging import Logger
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from dataclasses_json import dataclass_json
+
+from .spacy_length_batching import SpacyLengthBatcher
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens import Doc
+
+PARSE_CACHE_SUFFIX: str = ".spacy"
+
+
+@dataclass_json
+@dataclass
+class ParseCacheStats:
+    n_hits: int
+    n_misses: int
+    n_evictions: int
+    n_entries: int
+    n_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        n_lookups = self.n_hits + self.n_misses
+        return self.n_hits / n_lookups if n_lookups > 0 else 0.0
+
+
+def get_spacy_model_fingerprint(
+    nlp: Language, disable: Optional[List[str]] = None
+) -> str:
+    # Parses differ across spacy versions, models, model versions and sets of
+    # enabled pipes
+    import spacy
+
+    set_disable: Set[str] = set() if disable is None else set(disable)
+
+    return "/".join(
+        [
+            spacy.__version__,
+            str(nlp.meta.get("lang", "")),
+            str(nlp.meta.get("name", "")),
+            str(nlp.meta.get("version", "")),
+            ",".join(name for name in nlp.pipe_names if name not in set_disable),
+        ]
+    )
+
+
+class SpacyParseCache:
+    def __init__(
+        self, path_cache_dir: Path, logger: Logger, max_bytes: int = 1 << 30
+    ) -> None:
+        self.path_cache_dir = path_cache_dir
+        self.logger = logger
+        self.max_bytes = max_bytes
+
+        self.n_hits: int = 0
+        self.n_misses: int = 0
+        self.n_evictions: int = 0
+
+        # Index cached parses from least to most recently used by file mtime
+        self.path_cache_dir.mkdir(parents=True, exist_ok=True)
+        list_path_entry: List[Path] = sorted(
+            self.path_cache_dir.glob(f"*/*{PARSE_CACHE_SUFFIX}"),
+            key=lambda path_entry: path_entry.stat().st_mtime,
+        )
+        self.dict_key_n_bytes: OrderedDict[str, int] = OrderedDict(
+            (path_entry.stem, path_entry.stat().st_size)
+            for path_entry in list_path_entry
+        )
+        self.n_bytes: int = sum(self.dict_key_n_bytes.values())
+
+        self.logger.debug(
+            f"Opened spacy parse cache at {path_cache_dir} holding "
+            f"{len(self.dict_key_n_bytes)} parses in {self.n_bytes} bytes"
+        )
+
+    @property
+    def stats(self) -> ParseCacheStats:
+        return ParseCacheStats(
+            n_hits=self.n_hits,
+            n_misses=self.n_misses,
+            n_evictions=self.n_evictions,
+            n_entries=len(self.dict_key_n_bytes),
+            n_bytes=self.n_bytes,
+        )
+
+    def _get_key(self, text: str, model_fingerprint: str) -> str:
+        hasher = hashlib.sha256(model_fingerprint.encode("utf-8"))
+        hasher.update(b"\0")
+        hasher.update(text.encode("utf-8"))
+
+        return hasher.hexdigest()
+
+    def _get_path_entry(self, key: str) -> Path:
+        return self.path_cache_dir / key[:2] / f"{key}{PARSE_CACHE_SUFFIX}"
+
+    def get(
+        self, text: str, nlp: Language, disable: Optional[List[str]] = None
+    ) -> Optional[Doc]:
+        key = self._get_key(
+            text=text,
+            model_fingerprint=get_spacy_model_fingerprint(nlp=nlp, disable=disable),
+        )
+        if key not in self.dict_key_n_bytes:
+            self.n_misses += 1
+            return None
+
+        from spacy.tokens import DocBin
+
+        path_entry = self._get_path_entry(key=key)
+        try:
+            doc_bin = DocBin().from_bytes(path_entry.read_bytes())
+        except FileNotFoundError:
+            # Another process evicted the entry since it was indexed
+            self.n_bytes -= self.dict_key_n_bytes.pop(key)
+            self.n_misses += 1
+            return None
+
+        # Mark the entry as most recently used, in memory and on disk
+        self.dict_key_n_bytes.move_to_end(key)
+        os.utime(path_entry)
+        self.n_hits += 1
+
+        doc: Doc = next(doc_bin.get_docs(nlp.vocab))
+
+        return doc
+
+    def put(
+        self, text: str, nlp: Language, doc: Doc, disable: Optional[List[str]] = None
+    ) -> None:
+        key = self._get_key(
+            text=text,
+            model_fingerprint=get_spacy_model_fingerprint(nlp=nlp, disable=disable),
+        )
+        if key in self.dict_key_n_bytes:
+            return
+
+        from spacy.tokens import DocBin
+
+        doc_bin = DocBin(store_user_data=False)
+        doc_bin.add(doc)
+        doc_bin_bytes = doc_bin.to_bytes()
+
+        path_entry = self._get_path_entry(key=key)
+        path_entry.parent.mkdir(exist_ok=True)
+        path_entry.write_bytes(doc_bin_bytes)
+
+        self.dict_key_n_bytes[key] = len(doc_bin_bytes)
+        self.n_bytes += len(doc_bin_bytes)
+
+        self._evict()
+
+    def _evict(self) -> None:
+        # Drop least recently used parses until the cache fits its size budget
+        while self.n_bytes > self.max_bytes and self.dict_key_n_bytes:
+            key, n_bytes = self.dict_key_n_bytes.popitem(last=False)
+            self._get_path_entry(key=key).unlink(missing_ok=True)
+            self.n_bytes -= n_bytes
+            self.n_evictions += 1
+
+    def parse(
+        self, text: str, nlp: Language, disable: Optional[List[str]] = None
+    ) -> Doc:
+        doc = self.get(text=text, nlp=nlp, disable=disable)
+        if doc is None:
+            doc = nlp(text, disable=[] if disable is None else disable)
+            self.put(text=text, nlp=nlp, doc=doc, disable=disable)
+
+        return doc
+
+    def _iter_cached_docs(
+        self,
+        deque_entry: Deque[Tuple[str, bool]],
+        nlp: Language,
+        disable: Optional[List[str]] = None,
+    ) -> Iterator[Doc]:
+        # Load the queued texts found cached, up to the next text sent to spacy
+        while deque_entry and not deque_entry[0][1]:
+            text, _ = deque_entry.popleft()
+            doc = self.get(text=text, nlp=nlp, disable=disable)
+            if doc is None:
+                # Evicted since it was queued, so parse it on its own
+                doc = nlp(text, disable=[] if disable is None else disable)
+                self.put(text=text, nlp=nlp, doc=doc, disable=disable)
+            yield doc
+
+    def pipe(
+        self,
+        texts: Iterable[str],
+        nlp: Language,
+        batch_size: int = 64,
+        n_process: int = 1,
+        disable: Optional[List[str]] = None,
+        length_batcher: Optional[SpacyLengthBatcher] = None,
+    ) -> Iterator[Doc]:
+        # Queue every text in input order and send the texts neither cached nor
+        # already sent through one spacy pipe call, so its worker processes
+        # start once. Cached texts wait in the queue as text and are loaded
+        # when their turn comes, keeping docs in input order
+        model_fingerprint = get_spacy_model_fingerprint(nlp=nlp, disable=disable)
+        deque_entry: Deque[Tuple[str, bool]] = deque()
+        set_sent_text: Set[str] = set()
+
+        def iter_miss_text() -> Iterator[str]:
+            for text in texts:
+                is_miss = (
+                    text not in set_sent_text
+                    and self._get_key(text=text, model_fingerprint=model_fingerprint)
+                    not in self.dict_key_n_bytes
+                )
+                deque_entry.append((text, is_miss))
+                if is_miss:
+                    set_sent_text.add(text)
+                    yield text
+
+        miss_docs: Iterable[Doc] = (
+            nlp.pipe(
+                iter_miss_text(),
+                batch_size=batch_size,
+                n_process=n_process,
+                disable=[] if disable is None else disable,
+            )
+            if length_batcher is None
+            else length_batcher.pipe(
+                texts=iter_miss_text(), nlp=nlp, n_process=n_process, disable=disable
+            )
+        )
+        for miss_doc in miss_docs:
+            yield from self._iter_cached_docs(
+                deque_entry=deque_entry, nlp=nlp, disable=disable
+            )
+            miss_text, _ = deque_entry.popleft()
+            set_sent_text.discard(miss_text)
+            self.n_misses += 1
+            self.put(text=miss_text, nlp=nlp, doc=miss_doc, disable=disable)
+            yield miss_doc
+        yield from self._iter_cached_docs(
+            deque_entry=deque_entry, nlp=nlp, disable=disable
+        )
+
+        self.logger.debug(f"Spacy parse cache stats after streaming: {self.stats}")
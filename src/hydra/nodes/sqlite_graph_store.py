@@ -0,0 +1,490 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from logging import Logger
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+import numpy as np
+from networkx import DiGraph, Graph
+
+from .linguistic_graph_arrays import (
+    DICT_ETYPE_CODE,
+    DICT_NTYPE_CODE,
+    LIST_ETYPE,
+    LIST_NTYPE,
+    GraphArrays,
+)
+from .linguistic_graph_builder import LIST_CONTRACT_NTYPE
+from .linguistic_graph_construction import (
+    collect_doc_graph_arrays_from_spacy,
+    pipe_spacy_docs,
+)
+from .linguistic_graph_edges import EdgeType
+from .linguistic_graph_nodes import NodeType
+from .linguistic_graph_schema import (
+    FULL_GRAPH_SCHEMA,
+    GraphSchema,
+    get_spacy_pipes_to_disable,
+)
+from .linguistic_graph_vocab import GraphVocab
+from .pipeline_metrics import NULL_PIPELINE_METRICS, PipelineMetrics
+from .spacy_length_batching import SpacyLengthBatcher
+from .spacy_parse_cache import SpacyParseCache
+from .utils import iter_windows
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+# Node and edge types are held as their integer codes, and position ids as -1
+# on nodes other than tokens
+LIST_SQLITE_SCHEMA_STATEMENT: List[str] = [
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS node ("
+    "nid INTEGER PRIMARY KEY, ntype INTEGER NOT NULL, text TEXT NOT NULL, "
+    "position_id INTEGER NOT NULL, contracted INTEGER NOT NULL)",
+    # Nodes of node types to contract are unique by node type and text
+    "CREATE UNIQUE INDEX IF NOT EXISTS node_contracted_ntype_text "
+    "ON node (ntype, text) WHERE contracted = 1",
+    "CREATE INDEX IF NOT EXISTS node_ntype_text ON node (ntype, text)",
+    "CREATE TABLE IF NOT EXISTS edge ("
+    "src INTEGER NOT NULL, dst INTEGER NOT NULL, etype INTEGER NOT NULL, "
+    "text TEXT NOT NULL, PRIMARY KEY (src, dst)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS edge_dst ON edge (dst)",
+    "CREATE INDEX IF NOT EXISTS edge_etype ON edge (etype)",
+    "CREATE TEMP TABLE IF NOT EXISTS stage_node ("
+    "local_nid INTEGER PRIMARY KEY, ntype INTEGER NOT NULL, text TEXT NOT NULL, "
+    "position_id INTEGER NOT NULL, contracted INTEGER NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS temp.stage_node_ntype_text "
+    "ON stage_node (ntype, text, local_nid)",
+    "CREATE TEMP TABLE IF NOT EXISTS query_node (nid INTEGER PRIMARY KEY)",
+]
+
+SQL_INSERT_NEW_NODE: str = (
+    "INSERT INTO node (nid, ntype, text, position_id, contracted) "
+    "SELECT ? + ROW_NUMBER() OVER (ORDER BY local_nid), "
+    "ntype, text, position_id, contracted FROM stage_node "
+    "WHERE contracted = 0 OR ("
+    "NOT EXISTS (SELECT 1 FROM node WHERE node.ntype = stage_node.ntype "
+    "AND node.text = stage_node.text AND node.contracted = 1) "
+    "AND NOT EXISTS (SELECT 1 FROM stage_node AS first_node "
+    "WHERE first_node.ntype = stage_node.ntype "
+    "AND first_node.text = stage_node.text "
+    "AND first_node.local_nid < stage_node.local_nid)"
+    ") ORDER BY local_nid"
+)
+
+# Nodes within a number of hops of a node, following edges either way
+SQL_EGO_NIDS: str = (
+    "WITH RECURSIVE hop (nid, depth) AS ("
+    "SELECT ?, 0 "
+    "UNION SELECT edge.dst, hop.depth + 1 FROM hop "
+    "JOIN edge ON edge.src = hop.nid WHERE hop.depth < ? "
+    "UNION SELECT edge.src, hop.depth + 1 FROM hop "
+    "JOIN edge ON edge.dst = hop.nid WHERE hop.depth < ?"
+    ") SELECT DISTINCT nid FROM hop"
+)
+
+
+def _node_row_to_node_tuple(
+    nid: int, ntype_code: int, text: str, position_id: int
+) -> Tuple[int, Dict[str, Any]]:
+    nfeats: Dict[str, Any] = {"ntype": LIST_NTYPE[ntype_code].value, "text": text}
+    if position_id >= 0:
+        nfeats["position_id"] = position_id
+
+    return nid, nfeats
+
+
+class SQLiteGraphStore:
+    # One contracted graph held in a local SQLite database rather than in
+    # memory, adding graphs in transactions that stage their nodes and insert
+    # only those not yet stored, so nodes of types to contract are shared by
+    # type and text and edges between two nodes keep their first features
+    def __init__(
+        self,
+        path: Path,
+        logger: Logger,
+        list_contract_ntype: Optional[List[NodeType]] = None,
+        metrics: Optional[PipelineMetrics] = None,
+        cache_size_kib: int = 1 << 18,
+    ) -> None:
+        self.path = path
+        self.logger = logger
+        self.metrics: PipelineMetrics = (
+            NULL_PIPELINE_METRICS if metrics is None else metrics
+        )
+
+        # Transactions are opened and committed explicitly
+        self.connection = sqlite3.connect(path, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute("PRAGMA temp_store = MEMORY")
+        self.connection.execute(f"PRAGMA cache_size = -{cache_size_kib}")
+        for statement in LIST_SQLITE_SCHEMA_STATEMENT:
+            self.connection.execute(statement)
+        self.in_transaction: bool = False
+
+        self.list_contract_ntype = self._load_contract_ntype(
+            list_contract_ntype=list_contract_ntype
+        )
+        self.arr_contract_ntype_code = np.array(
+            [DICT_NTYPE_CODE[ntype] for ntype in self.list_contract_ntype],
+            dtype=np.int8,
+        )
+
+        self.logger.debug(
+            f"Opened SQLite graph store {path} holding {self.n_nodes} nodes "
+            f"and {self.n_edges} edges"
+        )
+
+    def _load_contract_ntype(
+        self, list_contract_ntype: Optional[List[NodeType]]
+    ) -> List[NodeType]:
+        # Node types to contract are fixed when the store is created
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = 'contract_ntype'"
+        ).fetchone()
+        if row is None:
+            list_ntype = (
+                LIST_CONTRACT_NTYPE
+                if list_contract_ntype is None
+                else list_contract_ntype
+            )
+            self.connection.execute(
+                "INSERT INTO meta VALUES ('contract_ntype', ?)",
+                (json.dumps([ntype.value for ntype in list_ntype]),),
+            )
+            return list(list_ntype)
+
+        list_stored_ntype = [NodeType(value) for value in json.loads(row[0])]
+        if list_contract_ntype is not None and set(list_contract_ntype) != set(
+            list_stored_ntype
+        ):
+            raise ValueError(
+                f"{self.path} contracts node types {list_stored_ntype} "
+                f"rather than {list_contract_ntype}"
+            )
+
+        return list_stored_ntype
+
+    def __enter__(self) -> SQLiteGraphStore:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    @property
+    def n_nodes(self) -> int:
+        n_nodes: int = self.connection.execute("SELECT COUNT(*) FROM node").fetchone()[
+            0
+        ]
+        return n_nodes
+
+    @property
+    def n_edges(self) -> int:
+        n_edges: int = self.connection.execute("SELECT COUNT(*) FROM edge").fetchone()[
+            0
+        ]
+        return n_edges
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        # Nested uses join the outermost transaction
+        if self.in_transaction:
+            yield
+            return
+
+        self.connection.execute("BEGIN")
+        self.in_transaction = True
+        try:
+            yield
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        else:
+            self.connection.execute("COMMIT")
+        finally:
+            self.in_transaction = False
+
+    def _insert_graph_arrays(self, graph_arrays: GraphArrays) -> np.ndarray:
+        connection = self.connection
+        n_node = graph_arrays.n_nodes
+        arr_contracted = np.isin(graph_arrays.node_ntype, self.arr_contract_ntype_code)
+
+        connection.execute("DELETE FROM stage_node")
+        connection.executemany(
+            "INSERT INTO stage_node VALUES (?, ?, ?, ?, ?)",
+            zip(
+                range(n_node),
+                graph_arrays.node_ntype.tolist(),
+                graph_arrays.node_text.tolist(),
+                graph_arrays.node_position_id.tolist(),
+                arr_contracted.astype(np.int64).tolist(),
+            ),
+        )
+
+        # New nodes take the next node ids in staged order, counting from zero
+        # as the builder does. A node to contract is new on its first staged
+        # occurrence when no stored node shares its type and text, and keeps
+        # the features of that occurrence
+        (max_nid,) = connection.execute(
+            "SELECT COALESCE(MAX(nid), -1) FROM node"
+        ).fetchone()
+        connection.execute(SQL_INSERT_NEW_NODE, (max_nid,))
+
+        arr_local_nid_to_nid = np.empty(n_node, dtype=np.int64)
+        arr_contracted_row = np.array(
+            connection.execute(
+                "SELECT stage_node.local_nid, node.nid FROM stage_node "
+                "JOIN node ON node.ntype = stage_node.ntype "
+                "AND node.text = stage_node.text AND node.contracted = 1 "
+                "WHERE stage_node.contracted = 1"
+            ).fetchall(),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        arr_local_nid_to_nid[arr_contracted_row[:, 0]] = arr_contracted_row[:, 1]
+        arr_local_nid_to_nid[~arr_contracted] = [
+            nid
+            for (nid,) in connection.execute(
+                "SELECT nid FROM node WHERE nid > ? AND contracted = 0 ORDER BY nid",
+                (max_nid,),
+            )
+        ]
+
+        # Keep the features of the first edge added between two nodes
+        connection.executemany(
+            "INSERT INTO edge VALUES (?, ?, ?, ?) ON CONFLICT (src, dst) DO NOTHING",
+            zip(
+                arr_local_nid_to_nid[graph_arrays.edge_src].tolist(),
+                arr_local_nid_to_nid[graph_arrays.edge_dst].tolist(),
+                graph_arrays.edge_etype.tolist(),
+                graph_arrays.edge_text.tolist(),
+            ),
+        )
+
+        return arr_local_nid_to_nid
+
+    def add_graph_arrays(self, graph_arrays: GraphArrays) -> Dict[int, int]:
+        with self.metrics.time_stage("graph_build"), self.transaction():
+            arr_local_nid_to_nid = self._insert_graph_arrays(graph_arrays=graph_arrays)
+
+        return dict(enumerate(arr_local_nid_to_nid.tolist()))
+
+    def add_graph(  # type: ignore[no-any-unimported]
+        self, nx_g: Graph, vocab: Optional[GraphVocab] = None
+    ) -> Dict[Any, int]:
+        # Graph arrays number nodes densely in the order of the graph's nodes
+        mapping_dense_nid_to_nid = self.add_graph_arrays(
+            graph_arrays=GraphArrays.from_networkx(nx_g=nx_g, vocab=vocab)
+        )
+
+        return {
+            nid: mapping_dense_nid_to_nid[dense_nid]
+            for dense_nid, nid in enumerate(nx_g.nodes)
+        }
+
+    def add_many_graph_arrays(
+        self, iter_graph_arrays: Iterable[GraphArrays], n_per_transaction: int = 64
+    ) -> int:
+        # Commit once per window of graphs rather than once per graph
+        n_graph: int = 0
+        for window in iter_windows(
+            iterable=iter_graph_arrays, window_size=n_per_transaction
+        ):
+            with self.metrics.time_stage("graph_build"), self.transaction():
+                for graph_arrays in window:
+                    self._insert_graph_arrays(graph_arrays=graph_arrays)
+            n_graph += len(window)
+
+        return n_graph
+
+    def append(
+        self,
+        texts: Iterable[str],
+        nlp: Language,
+        batch_size: int = 64,
+        n_process: int = 1,
+        schema: Optional[GraphSchema] = None,
+        parse_cache: Optional[SpacyParseCache] = None,
+        length_batcher: Optional[SpacyLengthBatcher] = None,
+        n_docs_per_transaction: int = 64,
+    ) -> int:
+        schema = FULL_GRAPH_SCHEMA if schema is None else schema
+        n_node_before, n_edge_before = self.n_nodes, self.n_edges
+
+        docs = pipe_spacy_docs(
+            texts=texts,
+            nlp=nlp,
+            batch_size=batch_size,
+            n_process=n_process,
+            disable=get_spacy_pipes_to_disable(nlp=nlp, schema=schema),
+            parse_cache=parse_cache,
+            length_batcher=length_batcher,
+        )
+        n_doc = self.add_many_graph_arrays(
+            iter_graph_arrays=(
+                collect_doc_graph_arrays_from_spacy(
+                    doc=doc, logger=self.logger, schema=schema
+                )
+                for doc in docs
+            ),
+            n_per_transaction=n_docs_per_transaction,
+        )
+
+        self.logger.info(
+            f"Appended {n_doc} docs adding {self.n_nodes - n_node_before} nodes and "
+            f"{self.n_edges - n_edge_before} edges to SQLite graph store {self.path}"
+        )
+
+        return n_doc
+
+    def get_node(self, nid: int) -> Dict[str, Any]:
+        row = self.connection.execute(
+            "SELECT nid, ntype, text, position_id FROM node WHERE nid = ?", (nid,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"{nid} is not a node of the SQLite graph store")
+
+        return _node_row_to_node_tuple(*row)[1]
+
+    def get_nids(self, ntype: NodeType, text: Optional[str] = None) -> List[int]:
+        cursor = (
+            self.connection.execute(
+                "SELECT nid FROM node WHERE ntype = ? ORDER BY nid",
+                (DICT_NTYPE_CODE[ntype],),
+            )
+            if text is None
+            else self.connection.execute(
+                "SELECT nid FROM node WHERE ntype = ? AND text = ? ORDER BY nid",
+                (DICT_NTYPE_CODE[ntype], text),
+            )
+        )
+
+        return [nid for (nid,) in cursor]
+
+    def get_edges(self, etype: EdgeType) -> List[Tuple[int, int]]:
+        return [
+            (src, dst)
+            for src, dst in self.connection.execute(
+                "SELECT src, dst FROM edge WHERE etype = ?", (DICT_ETYPE_CODE[etype],)
+            )
+        ]
+
+    def get_successors(self, nid: int, etype: Optional[EdgeType] = None) -> List[int]:
+        return self._get_neighbours(
+            sql="SELECT dst FROM edge WHERE src = ?", nid=nid, etype=etype
+        )
+
+    def get_predecessors(self, nid: int, etype: Optional[EdgeType] = None) -> List[int]:
+        return self._get_neighbours(
+            sql="SELECT src FROM edge WHERE dst = ?", nid=nid, etype=etype
+        )
+
+    def _get_neighbours(
+        self, sql: str, nid: int, etype: Optional[EdgeType]
+    ) -> List[int]:
+        cursor = (
+            self.connection.execute(sql, (nid,))
+            if etype is None
+            else self.connection.execute(
+                f"{sql} AND etype = ?", (nid, DICT_ETYPE_CODE[etype])
+            )
+        )
+
+        return [neighbour_nid for (neighbour_nid,) in cursor]
+
+    def get_linked_nids(self, ntype: NodeType, text: str, etype: EdgeType) -> List[int]:
+        # Source nodes of edges of an edge type into nodes of a type and text,
+        # such as the tokens of every PERSON ner node
+        return [
+            nid
+            for (nid,) in self.connection.execute(
+                "SELECT DISTINCT edge.src FROM node "
+                "JOIN edge ON edge.dst = node.nid AND edge.etype = ? "
+                "WHERE node.ntype = ? AND node.text = ?",
+                (DICT_ETYPE_CODE[etype], DICT_NTYPE_CODE[ntype], text),
+            )
+        ]
+
+    def get_ego_graph(  # type: ignore[no-any-unimported]
+        self, nid: int, radius: int = 1
+    ) -> DiGraph:
+        # Nodes within radius hops of a node and the edges between them
+        list_nid = [
+            ego_nid
+            for (ego_nid,) in self.connection.execute(
+                SQL_EGO_NIDS, (nid, radius, radius)
+            )
+        ]
+
+        return self._query_networkx(list_nid=list_nid)
+
+    def _query_networkx(  # type: ignore[no-any-unimported]
+        self, list_nid: List[int]
+    ) -> DiGraph:
+        connection = self.connection
+        with self.transaction():
+            connection.execute("DELETE FROM query_node")
+            connection.executemany(
+                "INSERT INTO query_node VALUES (?)", ((nid,) for nid in list_nid)
+            )
+            list_node_row = connection.execute(
+                "SELECT node.nid, ntype, text, position_id FROM node "
+                "JOIN query_node ON query_node.nid = node.nid ORDER BY node.nid"
+            ).fetchall()
+            list_edge_row = connection.execute(
+                "SELECT src, dst, etype, text FROM edge "
+                "JOIN query_node AS query_src ON query_src.nid = edge.src "
+                "JOIN query_node AS query_dst ON query_dst.nid = edge.dst"
+            ).fetchall()
+
+        return self._rows_to_networkx(
+            list_node_row=list_node_row, list_edge_row=list_edge_row
+        )
+
+    def _rows_to_networkx(  # type: ignore[no-any-unimported]
+        self,
+        list_node_row: List[Tuple[int, int, str, int]],
+        list_edge_row: List[Tuple[int, int, int, str]],
+    ) -> DiGraph:
+        nx_g = DiGraph()
+        nx_g.add_nodes_from(_node_row_to_node_tuple(*row) for row in list_node_row)
+        nx_g.add_edges_from(
+            (src, dst, {"etype": LIST_ETYPE[etype_code].value, "text": text})
+            for src, dst, etype_code, text in list_edge_row
+        )
+
+        return nx_g
+
+    def to_networkx(self) -> DiGraph:  # type: ignore[no-any-unimported]
+        # Only for stores small enough to fit in memory
+        return self._rows_to_networkx(
+            list_node_row=self.connection.execute(
+                "SELECT nid, ntype, text, position_id FROM node ORDER BY nid"
+            ).fetchall(),
+            list_edge_row=self.connection.execute(
+                "SELECT src, dst, etype, text FROM edge"
+            ).fetchall(),
+        )
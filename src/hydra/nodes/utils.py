@@ -1,13 +1,14 @@
 from enum import Enum
-from typing import Any, Dict, List
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
 
 
 def group_dict_key_by_value(d_input: Dict[Any, Any]) -> Dict[Any, List[Any]]:
     dict_value_key: Dict[Any, List[Any]] = {}
     for i, v in d_input.items():
-        dict_value_key[v] = (
-            [i] if v not in dict_value_key.keys() else dict_value_key[v] + [i]
-        )
+        dict_value_key.setdefault(v, []).append(i)
 
     return dict_value_key
 
@@ -19,3 +20,15 @@ def enum_dict_factory(data: Any) -> Dict[Any, Any]:
         return obj
 
     return dict((k, convert_value(v)) for k, v in data)
+
+
+def iter_windows(iterable: Iterable[T], window_size: int) -> Iterator[List[T]]:
+    if window_size < 1:
+        raise ValueError(f"Window size must be positive but got {window_size}")
+
+    iterator = iter(iterable)
+    while True:
+        window = list(islice(iterator, window_size))
+        if not window:
+            return
+        yield window
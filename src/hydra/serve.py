@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+from logging import Logger
+from threading import Thread
+from typing import TYPE_CHECKING, List, Optional
+
+from .nodes.graph_service import GraphService, GraphServiceHTTPServer
+from .nodes.spacy_model_registry import load_spacy_model
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="hydra-serve",
+        description="Serve paragraph graphs over HTTP, parsing texts in batches",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("-m", "--model", default="en_core_web_sm")
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument(
+        "--max-wait-ms",
+        type=float,
+        default=5.0,
+        help="Longest time a text waits for its batch to fill before parsing",
+    )
+    parser.add_argument(
+        "--request-timeout",
+        type=float,
+        default=300.0,
+        help="Seconds a request waits for its graph before a 503 reply",
+    )
+    parser.add_argument("--vectorized", action="store_true")
+    parser.add_argument("--log-level", default="INFO")
+
+    return parser
+
+
+async def _serve(args: argparse.Namespace, nlp: Language, logger: Logger) -> None:
+    async with GraphService(
+        nlp=nlp,
+        logger=logger,
+        max_batch_size=args.max_batch_size,
+        max_wait_seconds=args.max_wait_ms / 1000,
+        vectorized=args.vectorized,
+    ) as graph_service:
+        # Handle HTTP requests in threads, leaving the event loop to batching
+        server = GraphServiceHTTPServer(
+            server_address=(args.host, args.port),
+            graph_service=graph_service,
+            loop=asyncio.get_running_loop(),
+            request_timeout=args.request_timeout,
+        )
+        thread = Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        logger.info(f"Serving graphs on http://{args.host}:{server.server_port}")
+
+        try:
+            await asyncio.Event().wait()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+
+    logging.basicConfig(
+        level=args.log_level.upper(),
+        format="%(asctime)s %(name)s - %(levelname)s:%(message)s",
+        stream=sys.stderr,
+    )
+    logger = logging.getLogger(__name__)
+
+    nlp = load_spacy_model(name=args.model)
+
+    try:
+        asyncio.run(_serve(args=args, nlp=nlp, logger=logger))
+    except KeyboardInterrupt:
+        logger.info("Stopped serving graphs")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
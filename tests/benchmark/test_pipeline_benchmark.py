@@ -0,0 +1,171 @@
+import json
+import logging
+from dataclasses import replace
+from pathlib import Path
+
+from pytest import approx, mark, skip
+
+from src.hydra.nodes.pipeline_benchmark import (
+    LIST_BENCHMARK_FUNCTION,
+    BenchmarkResult,
+    compare_with_benchmark_baseline,
+    generate_synthetic_paragraph,
+    get_benchmark_environment,
+    get_scaling_exponents,
+    load_benchmark_baseline,
+    run_pipeline_benchmark,
+    save_benchmark_baseline,
+)
+from tests.conftest import TestFixture
+
+# Baseline recorded with hydra-benchmark --update-baseline and its default sizes
+PATH_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def test_generate_synthetic_paragraph() -> None:
+    list_unique_word = (
+        generate_synthetic_paragraph(size=120, duplication_ratio=0.0)
+        .lower()
+        .replace(".", "")
+        .split()
+    )
+    list_duplicated_word = (
+        generate_synthetic_paragraph(size=120, duplication_ratio=0.9)
+        .lower()
+        .replace(".", "")
+        .split()
+    )
+
+    assert len(list_unique_word) == len(list_duplicated_word) == 120
+    assert len(set(list_unique_word)) == 120
+    assert len(set(list_duplicated_word)) < 60
+
+
+def test_pipeline_benchmark_baseline(test_fixture: TestFixture, tmp_path: Path) -> None:
+    logger = logging.getLogger("tests.benchmark")
+    nlp = test_fixture.example_spacy_model
+
+    list_benchmark_result = run_pipeline_benchmark(
+        nlp=nlp,
+        logger=logger,
+        list_size=[100, 200],
+        list_duplication_ratio=[0.0, 0.9],
+    )
+
+    assert len(list_benchmark_result) == 2 * 2 * len(LIST_BENCHMARK_FUNCTION)
+    assert set(get_scaling_exponents(list_benchmark_result)) == {
+        (function, duplication_ratio)
+        for function in LIST_BENCHMARK_FUNCTION
+        for duplication_ratio in [0.0, 0.9]
+    }
+
+    path_baseline = tmp_path / "baseline.json"
+    save_benchmark_baseline(
+        list_benchmark_result=list_benchmark_result,
+        path_baseline=path_baseline,
+        nlp=nlp,
+    )
+    list_baseline_result = load_benchmark_baseline(path_baseline=path_baseline)
+
+    assert list_baseline_result == list_benchmark_result
+    assert (
+        compare_with_benchmark_baseline(
+            list_benchmark_result=list_benchmark_result,
+            list_baseline_result=list_baseline_result,
+        )
+        == []
+    )
+
+    list_slower_result = [
+        replace(result, seconds=result.seconds * 4 + 1.0)
+        for result in list_benchmark_result
+    ]
+    list_regression = compare_with_benchmark_baseline(
+        list_benchmark_result=list_slower_result,
+        list_baseline_result=list_baseline_result,
+    )
+
+    assert len(list_regression) == len(list_benchmark_result)
+
+
+def test_get_scaling_exponents_drops_short_timings() -> None:
+    list_benchmark_result = [
+        BenchmarkResult(
+            function="parse_for_para_graph_with_spacy",
+            size=size,
+            duplication_ratio=0.0,
+            seconds=seconds,
+            peak_bytes=0,
+        )
+        for size, seconds in [(100, 1e-5), (200, 1e-4), (400, 0.01), (800, 0.02)]
+    ]
+
+    assert (
+        get_scaling_exponents(list_benchmark_result)[
+            ("parse_for_para_graph_with_spacy", 0.0)
+        ]
+        > 1.5
+    )
+    assert get_scaling_exponents(list_benchmark_result, min_seconds=5e-3)[
+        ("parse_for_para_graph_with_spacy", 0.0)
+    ] == approx(1.0)
+    assert get_scaling_exponents(list_benchmark_result, min_seconds=0.015) == {}
+
+
+def test_committed_benchmark_baseline() -> None:
+    list_baseline_result = load_benchmark_baseline(path_baseline=PATH_BASELINE)
+
+    assert {result.function for result in list_baseline_result} == set(
+        LIST_BENCHMARK_FUNCTION
+    )
+    assert all(result.seconds > 0 for result in list_baseline_result)
+
+
+@mark.benchmark
+def test_pipeline_benchmark_against_committed_baseline(
+    test_fixture: TestFixture,
+) -> None:
+    # Timings only compare on the machine and model the baseline was recorded on
+    nlp = test_fixture.example_spacy_model
+    baseline = json.loads(PATH_BASELINE.read_text(encoding="utf-8"))
+    if baseline["environment"] != get_benchmark_environment(nlp=nlp):
+        skip("The benchmark baseline was recorded in another environment")
+    list_baseline_result = load_benchmark_baseline(path_baseline=PATH_BASELINE)
+    # Debug logs would be timed too, which the command line leaves out
+    logger = logging.getLogger("tests.benchmark")
+    logger.setLevel(logging.INFO)
+
+    list_benchmark_result = run_pipeline_benchmark(
+        nlp=nlp,
+        logger=logger,
+        list_size=sorted({result.size for result in list_baseline_result}),
+        list_duplication_ratio=sorted(
+            {result.duplication_ratio for result in list_baseline_result}
+        ),
+    )
+
+    assert (
+        compare_with_benchmark_baseline(
+            list_benchmark_result=list_benchmark_result,
+            list_baseline_result=list_baseline_result,
+        )
+        == []
+    )
+
+
+@mark.benchmark
+def test_pipeline_benchmark_scaling(test_fixture: TestFixture) -> None:
+    # Wall clock timings vary with machine load, so this only runs when
+    # benchmarks are selected with -m benchmark
+    logger = logging.getLogger("tests.benchmark")
+    logger.setLevel(logging.INFO)
+
+    list_benchmark_result = run_pipeline_benchmark(
+        nlp=test_fixture.example_spacy_model,
+        logger=logger,
+        list_size=[100, 200, 400, 800],
+        list_duplication_ratio=[0.0, 0.9],
+    )
+
+    for exponent in get_scaling_exponents(list_benchmark_result).values():
+        assert exponent < 1.5
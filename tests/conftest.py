@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from logging import Logger
 from pathlib import Path
+from typing import List
 
 import en_core_web_sm
 from networkx import DiGraph
@@ -65,6 +66,26 @@ class TestFixture:
 
         return paragraph
 
+    @property
+    def example_sentence_text(self) -> str:
+        sentence: str = (
+            "Language is always more powerful than it seems in everyday life."
+        )
+
+        return sentence
+
+    @property
+    def example_corpus(self) -> List[str]:
+        corpus: List[str] = [
+            self.example_paragraph,
+            self.example_sentence_text,
+            "Jaan Whitehead wrote about language in American Theatre.",
+            self.example_sentence_text,
+            "It expresses our view of ourselves.",
+        ]
+
+        return corpus
+
     @property
     def example_paragraph_doc(self) -> Doc:
         nlp = self.example_spacy_model
@@ -160,3 +181,29 @@ class TestFixture:
         )
 
         return nx_g
+
+    @property
+    def example_nx_g_for_multi_ntype_contraction(  # type: ignore[no-any-unimported]
+        self,
+    ) -> DiGraph:
+        nx_g = DiGraph()
+        nx_g.add_nodes_from(
+            [
+                (0, {"ntype": "SENTENCE", "text": "Paris"}),
+                (1, {"ntype": "TOKEN", "text": "Paris", "position_id": 0}),
+                (2, {"ntype": "UNIVERSALPOS", "text": "PROPN"}),
+                (3, {"ntype": "SENTENCE", "text": "Paris"}),
+                (4, {"ntype": "TOKEN", "text": "Paris", "position_id": 0}),
+                (5, {"ntype": "UNIVERSALPOS", "text": "PROPN"}),
+            ]
+        )
+        nx_g.add_edges_from(
+            [
+                (1, 0, {"etype": "TokenToSent", "text": ""}),
+                (1, 2, {"etype": "TokenToUniPOS", "text": ""}),
+                (4, 3, {"etype": "TokenToSent", "text": ""}),
+                (4, 5, {"etype": "TokenToUniPOS", "text": ""}),
+            ]
+        )
+
+        return nx_g
@@ -0,0 +1,165 @@
+from collections import Counter
+from logging import Logger
+from typing import List, Tuple
+
+from networkx import DiGraph
+from pytest import mark, raises
+from spacy.tokens import Doc
+
+from src.hydra.nodes.corpus_graph import CorpusGraph
+from src.hydra.nodes.linguistic_graph_edges import EdgeType
+from src.hydra.nodes.linguistic_graph_nodes import NodeType
+from tests.conftest import TestFixture
+
+
+@mark.parametrize("vectorized", [False, True])
+def test_corpus_graph_append(
+    test_logger: Logger, test_fixture: TestFixture, vectorized: bool
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    corpus = test_fixture.example_corpus
+
+    corpus_graph = CorpusGraph(logger=test_logger, vectorized=vectorized)
+    list_para_nid = corpus_graph.append(texts=corpus, nlp=nlp)
+    nx_g = corpus_graph.graph
+
+    assert len(corpus_graph) == len(corpus)
+    assert {nx_g.nodes[nid]["ntype"] for nid in list_para_nid} == {
+        NodeType.paragraph.value
+    }
+    # Every sentence node links to exactly one paragraph node
+    for nid, ntype in nx_g.nodes.data("ntype"):
+        if ntype == NodeType.sentence.value:
+            assert [
+                (dst_nid in list_para_nid, etype)
+                for _, dst_nid, etype in nx_g.out_edges(nid, data="etype")
+            ] == [(True, EdgeType.sent_to_para.value)]
+    # Token nodes are shared across paragraphs
+    list_token_text = [
+        nfeats["text"]
+        for _, nfeats in nx_g.nodes.data()
+        if nfeats["ntype"] == NodeType.token.value
+    ]
+    assert len(list_token_text) == len(set(list_token_text))
+
+
+def test_corpus_graph_append_incrementally(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    corpus = test_fixture.example_corpus
+
+    full_corpus_graph = CorpusGraph(logger=test_logger)
+    full_corpus_graph.append(texts=corpus, nlp=nlp)
+
+    # Resume from a copy of the graph holding the first paragraph only
+    first_corpus_graph = CorpusGraph(logger=test_logger)
+    first_corpus_graph.append(texts=corpus[:1], nlp=nlp)
+    corpus_graph = CorpusGraph(logger=test_logger, nx_g=first_corpus_graph.graph.copy())
+    corpus_graph.append(texts=corpus[1:], nlp=nlp)
+
+    assert len(corpus_graph) == len(corpus)
+    assert list(corpus_graph.graph.nodes.data()) == list(
+        full_corpus_graph.graph.nodes.data()
+    )
+    assert set(corpus_graph.graph.edges) == set(full_corpus_graph.graph.edges)
+
+
+def _count_labelled_elements(  # type: ignore[no-any-unimported]
+    nx_g: DiGraph,
+) -> Tuple[Counter, Counter]:
+    # Node ids differ between graphs, so compare nodes by type and text along
+    # with their other attributes, and edges by the labels of their ends
+    mapping_nid_to_label = {
+        nid: (nfeats["ntype"], nfeats["text"]) for nid, nfeats in nx_g.nodes.data()
+    }
+    counter_node = Counter(
+        tuple(sorted(nfeats.items())) for _, nfeats in nx_g.nodes.data()
+    )
+    counter_edge = Counter(
+        (
+            mapping_nid_to_label[u],
+            mapping_nid_to_label[v],
+            efeats["etype"],
+            efeats["text"],
+        )
+        for u, v, efeats in nx_g.edges.data()
+    )
+
+    return counter_node, counter_edge
+
+
+def test_corpus_graph_remove_document(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    corpus = test_fixture.example_corpus
+
+    corpus_graph = CorpusGraph(logger=test_logger, track_references=True)
+    list_para_nid = corpus_graph.append(texts=corpus, nlp=nlp)
+    corpus_graph.remove_document(para_nid=list_para_nid[0])
+
+    # Removing a paragraph leaves the graph built from the other paragraphs
+    rebuilt_corpus_graph = CorpusGraph(logger=test_logger)
+    rebuilt_corpus_graph.append(texts=corpus[1:], nlp=nlp)
+
+    assert corpus_graph.list_para_nid == list_para_nid[1:]
+    assert _count_labelled_elements(nx_g=corpus_graph.graph) == (
+        _count_labelled_elements(nx_g=rebuilt_corpus_graph.graph)
+    )
+
+    for para_nid in list_para_nid[1:]:
+        corpus_graph.remove_document(para_nid=para_nid)
+
+    assert len(corpus_graph.graph.nodes) == len(corpus_graph.graph.edges) == 0
+    with raises(KeyError):
+        corpus_graph.remove_document(para_nid=list_para_nid[0])
+
+
+def test_corpus_graph_remove_document_restores_attributes(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    nlp = test_fixture.example_spacy_model
+
+    # The same words parsed two ways, with the shared token at other positions
+    def get_list_doc() -> List[Doc]:
+        return [
+            Doc(
+                nlp.vocab,
+                words=["dogs", "bark", "."],
+                heads=[1, 1, 1],
+                deps=["nsubj", "ROOT", "punct"],
+                pos=["NOUN", "VERB", "PUNCT"],
+            ),
+            Doc(
+                nlp.vocab,
+                words=["the", "dogs", "bark", "."],
+                heads=[1, 2, 2, 2],
+                deps=["det", "dobj", "ROOT", "punct"],
+                pos=["DET", "NOUN", "VERB", "PUNCT"],
+            ),
+        ]
+
+    corpus_graph = CorpusGraph(
+        logger=test_logger, track_references=True, build_index=True
+    )
+    list_para_nid = [corpus_graph.add_doc(doc=doc) for doc in get_list_doc()]
+    corpus_graph.remove_document(para_nid=list_para_nid[0])
+
+    rebuilt_corpus_graph = CorpusGraph(logger=test_logger, build_index=True)
+    rebuilt_corpus_graph.add_doc(doc=get_list_doc()[1])
+
+    assert _count_labelled_elements(nx_g=corpus_graph.graph) == (
+        _count_labelled_elements(nx_g=rebuilt_corpus_graph.graph)
+    )
+    assert corpus_graph.index is not None
+    assert rebuilt_corpus_graph.index is not None
+    assert {
+        etype_value: len(edges)
+        for etype_value, edges in corpus_graph.index.mapping_etype_to_edges.items()
+    } == {
+        etype_value: len(edges)
+        for etype_value, edges in (
+            rebuilt_corpus_graph.index.mapping_etype_to_edges.items()
+        )
+    }
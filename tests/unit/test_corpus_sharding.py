@@ -0,0 +1,57 @@
+from logging import Logger
+
+import en_core_web_sm
+from networkx import DiGraph
+
+from src.hydra.nodes.corpus_sharding import (
+    build_corpus_graph_sharded,
+    measure_sharded_scaling,
+)
+from src.hydra.nodes.linguistic_graph_builder import ParaGraphBuilder
+from src.hydra.nodes.linguistic_graph_construction import (
+    add_spacy_doc_to_graph_builder,
+)
+from tests.conftest import TestFixture
+
+
+def test_build_corpus_graph_sharded(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    texts = test_fixture.example_corpus
+
+    corpus_graph, sharded_build_stats = build_corpus_graph_sharded(
+        texts=iter(texts),
+        model_loader=en_core_web_sm.load,
+        logger=test_logger,
+        n_workers=2,
+        shard_size=2,
+    )
+
+    # Merging shards gives the same graph as contracting the corpus in one go
+    corpus_graph_builder = ParaGraphBuilder(logger=test_logger)
+    for doc in test_fixture.example_spacy_model.pipe(texts):
+        add_spacy_doc_to_graph_builder(
+            para_graph_builder=corpus_graph_builder, doc=doc, logger=test_logger
+        )
+    expected_graph = corpus_graph_builder.graph
+
+    assert isinstance(corpus_graph, DiGraph)
+    assert list(corpus_graph.nodes.data()) == list(expected_graph.nodes.data())
+    assert sorted(corpus_graph.edges) == sorted(expected_graph.edges)
+    assert sharded_build_stats.n_texts == len(texts)
+    assert sharded_build_stats.n_shards == 3
+
+
+def test_measure_sharded_scaling(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    list_sharded_build_stats = measure_sharded_scaling(
+        texts=test_fixture.example_corpus,
+        model_loader=en_core_web_sm.load,
+        logger=test_logger,
+        list_n_workers=[1, 2],
+        shard_size=2,
+    )
+
+    assert [stats.n_workers for stats in list_sharded_build_stats] == [1, 2]
+    assert all(stats.texts_per_second > 0 for stats in list_sharded_build_stats)
@@ -0,0 +1,122 @@
+import json
+from io import StringIO
+from logging import Logger
+from typing import Any, Iterable, Iterator, List
+
+from pytest import MonkeyPatch, mark, raises
+from spacy.tokens import Doc
+
+from src.hydra.nodes.corpus_streaming import (
+    CorpusFormatError,
+    iter_corpus_texts,
+    stream_corpus_to_para_graphs,
+)
+from src.hydra.nodes.linguistic_graph_config import CorpusFormat
+from src.hydra.nodes.utils import iter_windows
+from tests.conftest import TestFixture
+
+
+def test_iter_corpus_texts(test_logger: Logger) -> None:
+    texts_from_text = iter_corpus_texts(
+        f_corpus=StringIO("First line\nof a paragraph.\n\n\nSecond one.\n"),
+        corpus_format=CorpusFormat.text,
+        logger=test_logger,
+    )
+    texts_from_lines = iter_corpus_texts(
+        f_corpus=StringIO("First paragraph.\n\nSecond one.\n"),
+        corpus_format=CorpusFormat.lines,
+        logger=test_logger,
+    )
+    texts_from_jsonl = iter_corpus_texts(
+        f_corpus=StringIO('{"body": "First paragraph."}\n{"body": "Second one."}\n'),
+        corpus_format=CorpusFormat.jsonl,
+        logger=test_logger,
+        text_field="body",
+    )
+
+    assert list(texts_from_text) == ["First line\nof a paragraph.", "Second one."]
+    assert list(texts_from_lines) == ["First paragraph.", "Second one."]
+    assert list(texts_from_jsonl) == ["First paragraph.", "Second one."]
+
+
+@mark.parametrize(
+    "bad_line",
+    ['{"body": "Second one."', '{"title": "Second one."}', '["Second one."]'],
+)
+def test_iter_corpus_texts_reports_bad_jsonl_line(
+    test_logger: Logger, bad_line: str
+) -> None:
+    texts_from_jsonl = iter_corpus_texts(
+        f_corpus=StringIO('{"body": "First paragraph."}\n\n' + bad_line + "\n"),
+        corpus_format=CorpusFormat.jsonl,
+        logger=test_logger,
+        text_field="body",
+    )
+
+    assert next(texts_from_jsonl) == "First paragraph."
+    with raises(CorpusFormatError, match="Line 3 "):
+        next(texts_from_jsonl)
+
+
+def test_iter_windows() -> None:
+    assert list(iter_windows(iterable=range(5), window_size=2)) == [
+        [0, 1],
+        [2, 3],
+        [4],
+    ]
+
+
+def test_stream_corpus_to_para_graphs(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    f_corpus = StringIO(
+        "\n".join(
+            [test_fixture.example_sentence_text] * 3
+            + [test_fixture.example_paragraph.replace("\n", " ")]
+        )
+    )
+    f_output = StringIO()
+
+    n_graph = stream_corpus_to_para_graphs(
+        f_corpus=f_corpus,
+        f_output=f_output,
+        nlp=test_fixture.example_spacy_model,
+        logger=test_logger,
+        corpus_format=CorpusFormat.lines,
+        flush_every=2,
+    )
+
+    list_record = [json.loads(line) for line in f_output.getvalue().splitlines()]
+    assert n_graph == 4
+    assert [record["index"] for record in list_record] == [0, 1, 2, 3]
+    assert all(len(record["graph"]["nodes"]) > 0 for record in list_record)
+
+
+def test_stream_corpus_to_para_graphs_pipes_once(
+    test_logger: Logger, test_fixture: TestFixture, monkeypatch: MonkeyPatch
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    f_corpus = StringIO("\n".join([test_fixture.example_sentence_text] * 5))
+    f_output = StringIO()
+
+    # Count the pipeline calls, each of which would start a pool of workers
+    list_n_process: List[int] = []
+    nlp_pipe = nlp.pipe
+
+    def pipe(texts: Iterable[str], n_process: int = 1, **kwargs: Any) -> Iterator[Doc]:
+        list_n_process.append(n_process)
+        return nlp_pipe(texts, **kwargs)
+
+    monkeypatch.setattr(nlp, "pipe", pipe)
+    n_graph = stream_corpus_to_para_graphs(
+        f_corpus=f_corpus,
+        f_output=f_output,
+        nlp=nlp,
+        logger=test_logger,
+        n_process=2,
+        flush_every=2,
+    )
+
+    assert n_graph == 5
+    assert list_n_process == [2]
+    assert len(f_output.getvalue().splitlines()) == 5
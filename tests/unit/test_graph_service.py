@@ -0,0 +1,136 @@
+import asyncio
+import json
+from contextlib import contextmanager
+from logging import Logger
+from threading import Thread
+from typing import Iterator, List
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from networkx import node_link_data
+from pytest import MonkeyPatch, raises
+
+from src.hydra.nodes.graph_service import GraphService, GraphServiceHTTPServer
+from src.hydra.nodes.linguistic_graph_construction import (
+    parse_for_para_graph_with_spacy,
+)
+from tests.conftest import TestFixture
+
+
+def test_graph_service_batches_concurrent_texts(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    corpus = test_fixture.example_corpus * 4
+
+    async def submit_corpus() -> List[str]:
+        async with GraphService(
+            nlp=nlp, logger=test_logger, max_batch_size=8, max_wait_seconds=0.05
+        ) as graph_service:
+            list_json_line = await asyncio.gather(
+                *[graph_service.submit(text=text) for text in corpus]
+            )
+            stats = graph_service.stats
+
+        assert stats.n_requests == len(corpus)
+        assert stats.n_batches < len(corpus)
+        assert stats.queue_depth == 0
+        assert stats.latency_p99_seconds >= stats.latency_p50_seconds > 0
+
+        return list(list_json_line)
+
+    list_json_line = asyncio.run(submit_corpus())
+
+    # Every caller receives the graph of its own text
+    for text, json_line in zip(corpus, list_json_line):
+        para_graph = parse_for_para_graph_with_spacy(
+            text=text, nlp=nlp, logger=test_logger
+        )
+        assert json.loads(json_line)["graph"] == json.loads(
+            json.dumps(node_link_data(para_graph), ensure_ascii=False)
+        )
+
+
+@contextmanager
+def _serve_graph_service(
+    graph_service: GraphService, request_timeout: float = 300.0
+) -> Iterator[str]:
+    loop = asyncio.new_event_loop()
+    thread_loop = Thread(target=loop.run_forever, daemon=True)
+    thread_loop.start()
+
+    asyncio.run_coroutine_threadsafe(graph_service.start(), loop).result()
+    server = GraphServiceHTTPServer(
+        server_address=("127.0.0.1", 0),
+        graph_service=graph_service,
+        loop=loop,
+        request_timeout=request_timeout,
+    )
+    thread_server = Thread(target=server.serve_forever, daemon=True)
+    thread_server.start()
+
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        asyncio.run_coroutine_threadsafe(graph_service.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread_loop.join()
+        loop.close()
+
+
+def test_graph_service_http_server(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    graph_service = GraphService(
+        nlp=test_fixture.example_spacy_model, logger=test_logger
+    )
+    with _serve_graph_service(graph_service=graph_service) as url:
+        with urlopen(
+            Request(
+                f"{url}/graph",
+                data=test_fixture.example_sentence_text.encode("utf-8"),
+                method="POST",
+            )
+        ) as response:
+            record = json.loads(response.read())
+        with urlopen(f"{url}/stats") as response:
+            stats = json.loads(response.read())
+
+    assert len(record["graph"]["nodes"]) > 0
+    assert stats["n_requests"] == 1
+    assert stats["n_batches"] == 1
+
+
+def test_graph_service_http_server_errors(
+    test_logger: Logger, test_fixture: TestFixture, monkeypatch: MonkeyPatch
+) -> None:
+    graph_service = GraphService(
+        nlp=test_fixture.example_spacy_model, logger=test_logger
+    )
+
+    async def submit(text: str) -> str:
+        if text == "slow":
+            await asyncio.sleep(10)
+        raise RuntimeError("The parser broke")
+
+    with _serve_graph_service(graph_service=graph_service, request_timeout=0.5) as url:
+        # Bodies that are not UTF-8 are rejected before reaching the service
+        with raises(HTTPError) as exc_info:
+            urlopen(Request(f"{url}/graph", data=b"\xff\xfe\xfa", method="POST"))
+        assert exc_info.value.code == 400
+        assert "error" in json.loads(exc_info.value.read())
+
+        monkeypatch.setattr(graph_service, "submit", submit)
+        for text, status in [("fails", 500), ("slow", 503)]:
+            with raises(HTTPError) as exc_info:
+                urlopen(
+                    Request(f"{url}/graph", data=text.encode("utf-8"), method="POST")
+                )
+            assert exc_info.value.code == status
+            assert "error" in json.loads(exc_info.value.read())
+
+        # The server keeps answering after failed requests
+        with urlopen(f"{url}/stats") as response:
+            assert json.loads(response.read())["n_requests"] == 0
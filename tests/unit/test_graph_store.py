@@ -0,0 +1,93 @@
+from logging import Logger
+from pathlib import Path
+
+from networkx import DiGraph
+from pytest import raises
+
+from src.hydra.nodes.graph_store import GraphStoreReader, GraphStoreWriter
+from src.hydra.nodes.linguistic_graph_config import NetworkXGraphType
+from src.hydra.nodes.linguistic_graph_construction import parse_many_para_graphs
+from src.hydra.nodes.linguistic_graph_vocab import GraphVocab
+from tests.conftest import TestFixture
+
+
+def test_graph_store_round_trip(
+    test_logger: Logger, test_fixture: TestFixture, tmp_path: Path
+) -> None:
+    path_store = tmp_path / "graphs.hgs"
+    list_para_graph = list(
+        parse_many_para_graphs(
+            texts=test_fixture.example_corpus,
+            nlp=test_fixture.example_spacy_model,
+            logger=test_logger,
+        )
+    )
+
+    with GraphStoreWriter(path=path_store, logger=test_logger) as graph_store_writer:
+        for para_graph in list_para_graph:
+            graph_store_writer.append(graph=para_graph)
+
+    graph_store_reader = GraphStoreReader(path=path_store, logger=test_logger)
+
+    assert list(tmp_path.iterdir()) == [path_store]
+    assert len(graph_store_reader) == len(list_para_graph)
+    for index in reversed(range(len(list_para_graph))):
+        para_graph = list_para_graph[index]
+        stored_graph = graph_store_reader.get_networkx(index=index)
+        assert isinstance(para_graph, DiGraph)
+        assert list(stored_graph.nodes.data()) == list(para_graph.nodes.data())
+        assert list(stored_graph.edges.data()) == list(para_graph.edges.data())
+
+
+def test_graph_store_csr_graph(
+    test_logger: Logger, test_fixture: TestFixture, tmp_path: Path
+) -> None:
+    path_store = tmp_path / "graphs.hgs"
+    list_csr_graph = list(
+        parse_many_para_graphs(
+            texts=test_fixture.example_corpus,
+            nlp=test_fixture.example_spacy_model,
+            logger=test_logger,
+            graph_type=NetworkXGraphType.csr,
+        )
+    )
+
+    with GraphStoreWriter(path=path_store, logger=test_logger) as graph_store_writer:
+        for csr_graph in list_csr_graph:
+            graph_store_writer.append(graph=csr_graph)
+
+    graph_store_reader = GraphStoreReader(path=path_store, logger=test_logger)
+    stored_csr_graph = graph_store_reader.get_csr_graph(index=2)
+
+    assert stored_csr_graph.n_nodes == list_csr_graph[2].n_nodes
+    assert (stored_csr_graph.out_indices == list_csr_graph[2].out_indices).all()
+
+
+def test_graph_store_interned_graph(
+    test_logger: Logger, test_fixture: TestFixture, tmp_path: Path
+) -> None:
+    path_store = tmp_path / "graphs.hgs"
+    vocab = GraphVocab()
+    list_interned_para_graph = list(
+        parse_many_para_graphs(
+            texts=test_fixture.example_corpus,
+            nlp=test_fixture.example_spacy_model,
+            logger=test_logger,
+            vocab=vocab,
+        )
+    )
+
+    with GraphStoreWriter(path=path_store, logger=test_logger) as graph_store_writer:
+        with raises(ValueError):
+            graph_store_writer.append(graph=list_interned_para_graph[0])
+        for interned_para_graph in list_interned_para_graph:
+            graph_store_writer.append(graph=interned_para_graph, vocab=vocab)
+
+    # Stored graphs hold decoded text, as if appended before encoding
+    graph_store_reader = GraphStoreReader(path=path_store, logger=test_logger)
+    assert len(graph_store_reader) == len(list_interned_para_graph)
+    for index, interned_para_graph in enumerate(list_interned_para_graph):
+        decoded_para_graph = vocab.decode_graph(interned_para_graph)
+        stored_graph = graph_store_reader.get_networkx(index=index)
+        assert list(stored_graph.nodes.data()) == list(decoded_para_graph.nodes.data())
+        assert list(stored_graph.edges.data()) == list(decoded_para_graph.edges.data())
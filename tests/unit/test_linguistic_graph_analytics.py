@@ -0,0 +1,296 @@
+from collections import Counter
+from logging import Logger
+from typing import Dict, Tuple
+
+import numpy as np
+from pytest import raises
+from scipy.sparse import csr_matrix
+
+from src.hydra.nodes.linguistic_graph_analytics import (
+    LIST_COOCCURRENCE_ETYPE,
+    CooccurrenceCounter,
+    compute_pmi,
+    get_top_k,
+    summarize_degrees,
+)
+from src.hydra.nodes.linguistic_graph_builder import ParaGraphBuilder
+from src.hydra.nodes.linguistic_graph_construction import (
+    collect_doc_graph_arrays_from_spacy,
+    collect_sent_graph_elements_from_spacy,
+)
+from src.hydra.nodes.linguistic_graph_csr import CSRGraph
+from src.hydra.nodes.linguistic_graph_edges import EdgeType
+from src.hydra.nodes.linguistic_graph_vocab import GraphVocab
+from tests.conftest import TestFixture
+
+
+def test_cooccurrence_counter_from_sent_elements(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    doc = test_fixture.example_paragraph_doc
+    cooccurrence_counter = CooccurrenceCounter(max_pending_pairs=16)
+
+    # Count every occurrence the slow way alongside
+    dict_etype_counter: Dict[EdgeType, Counter[Tuple[str, str]]] = {
+        etype: Counter() for etype in LIST_COOCCURRENCE_ETYPE
+    }
+    for sent in doc.sents:
+        node_tuples, edge_tuples = collect_sent_graph_elements_from_spacy(
+            sent=sent, logger=test_logger
+        )
+        cooccurrence_counter.add_sent_elements(
+            node_tuples=node_tuples, edge_tuples=edge_tuples
+        )
+        mapping_nid_to_text = {
+            node_tuple.node_id: node_tuple.node_feats.text
+            for node_tuple in node_tuples.list_node_tuple
+        }
+        for edge_tuple in edge_tuples.list_edge_tuple:
+            etype = edge_tuple.edge_feats.etype
+            if etype in dict_etype_counter:
+                dict_etype_counter[etype][
+                    (
+                        mapping_nid_to_text[edge_tuple.src_id],
+                        mapping_nid_to_text[edge_tuple.dst_id],
+                    )
+                ] += 1
+
+    for etype, counter in dict_etype_counter.items():
+        cooccurrence_matrix = cooccurrence_counter.get_matrix(etype=etype)
+        assert counter
+        assert cooccurrence_matrix.matrix.sum() == sum(counter.values())
+        assert cooccurrence_matrix.matrix.nnz == len(counter)
+        for (src_text, dst_text), count in counter.items():
+            assert cooccurrence_matrix.get_count(src_text, dst_text) == count
+
+    token_to_uni_pos = cooccurrence_counter.get_matrix(etype=EdgeType.token_to_uni_pos)
+    assert token_to_uni_pos.get_count("not a token", "NOUN") == 0.0
+    assert token_to_uni_pos.top_k(src_text="not a token", k=3) == []
+    (src_text, dst_text), count = dict_etype_counter[
+        EdgeType.token_to_uni_pos
+    ].most_common(1)[0]
+    assert (dst_text, count) in token_to_uni_pos.top_k(src_text=src_text, k=3)
+
+    # PMI of one row matches the row of the whole matrix's PMI
+    pmi_row = token_to_uni_pos.pmi().getrow(
+        token_to_uni_pos.string_table.mapping_string_to_id[src_text]
+    )
+    list_top_pmi = token_to_uni_pos.top_k(src_text=src_text, k=3, use_pmi=True)
+    assert len(list_top_pmi) == min(3, pmi_row.nnz)
+    for top_dst_text, pmi in list_top_pmi:
+        assert np.isclose(
+            pmi,
+            pmi_row[
+                0, token_to_uni_pos.string_table.mapping_string_to_id[top_dst_text]
+            ],
+        )
+    assert token_to_uni_pos.marginal_counts is not None
+
+    with raises(KeyError):
+        cooccurrence_counter.get_matrix(etype=EdgeType.token_to_sent)
+
+
+def test_cooccurrence_counter_from_contracted_graph(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    para_graph_builder = ParaGraphBuilder(logger=test_logger)
+    para_graph_builder.add_graph_arrays(
+        graph_arrays=collect_doc_graph_arrays_from_spacy(
+            doc=test_fixture.example_paragraph_doc, logger=test_logger
+        )
+    )
+    para_graph = para_graph_builder.graph
+
+    cooccurrence_counter = CooccurrenceCounter()
+    cooccurrence_counter.add_graph(graph=para_graph)
+    csr_cooccurrence_counter = CooccurrenceCounter()
+    csr_cooccurrence_counter.add_graph(graph=CSRGraph.from_networkx(nx_g=para_graph))
+
+    # Each edge of a contracted graph counts once
+    for etype in LIST_COOCCURRENCE_ETYPE:
+        n_edge = sum(
+            efeats["etype"] == etype.value for _, _, efeats in para_graph.edges.data()
+        )
+        cooccurrence_matrix = cooccurrence_counter.get_matrix(etype=etype)
+        csr_cooccurrence_matrix = csr_cooccurrence_counter.get_matrix(etype=etype)
+        assert cooccurrence_matrix.matrix.sum() == n_edge
+        assert set(cooccurrence_matrix.matrix.data.tolist()) == {1}
+        for src, dst, efeats in para_graph.edges.data():
+            if efeats["etype"] == etype.value:
+                assert csr_cooccurrence_matrix.get_count(
+                    para_graph.nodes[src]["text"], para_graph.nodes[dst]["text"]
+                ) == cooccurrence_matrix.get_count(
+                    para_graph.nodes[src]["text"], para_graph.nodes[dst]["text"]
+                )
+
+    with raises(ValueError):
+        cooccurrence_counter.add_graph(
+            graph=CSRGraph.from_networkx(nx_g=para_graph), mapping_edge_to_count={}
+        )
+
+
+def test_cooccurrence_counter_from_contracted_graph_with_edge_counts(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    doc = test_fixture.example_paragraph_doc
+    para_graph_builder = ParaGraphBuilder(logger=test_logger, track_references=True)
+    para_graph_builder.add_graph_arrays(
+        graph_arrays=collect_doc_graph_arrays_from_spacy(doc=doc, logger=test_logger)
+    )
+    para_graph_builder.take_references()
+
+    cooccurrence_counter = CooccurrenceCounter()
+    cooccurrence_counter.add_graph(
+        graph=para_graph_builder.graph,
+        mapping_edge_to_count=para_graph_builder.mapping_edge_to_n_ref,
+    )
+    sent_cooccurrence_counter = CooccurrenceCounter()
+    for sent in doc.sents:
+        node_tuples, edge_tuples = collect_sent_graph_elements_from_spacy(
+            sent=sent, logger=test_logger
+        )
+        sent_cooccurrence_counter.add_sent_elements(
+            node_tuples=node_tuples, edge_tuples=edge_tuples
+        )
+
+    # Edges weighted by the sentence edges they stand for count every occurrence
+    for etype in LIST_COOCCURRENCE_ETYPE:
+        cooccurrence_matrix = cooccurrence_counter.get_matrix(etype=etype)
+        sent_cooccurrence_matrix = sent_cooccurrence_counter.get_matrix(etype=etype)
+        assert cooccurrence_matrix.matrix.sum() == sent_cooccurrence_matrix.matrix.sum()
+        assert cooccurrence_matrix.matrix.max() > 1
+        arr_row, arr_col, arr_count = get_top_k(
+            matrix=sent_cooccurrence_matrix.matrix, k=len(doc)
+        )
+        for src_id, dst_id, count in zip(arr_row, arr_col, arr_count):
+            src_text, dst_text = sent_cooccurrence_matrix.string_table.lookup_many(
+                np.array([src_id, dst_id])
+            )
+            assert cooccurrence_matrix.get_count(src_text, dst_text) == count
+
+
+def test_compute_pmi_and_get_top_k() -> None:
+    arr_count = np.array([[4, 0, 1], [0, 2, 2], [1, 1, 0]], dtype=np.float64)
+
+    pmi_matrix = compute_pmi(matrix=csr_matrix(arr_count), positive=False)
+
+    arr_is_stored = arr_count > 0
+    arr_expected_pmi = np.log(
+        arr_count[arr_is_stored]
+        * arr_count.sum()
+        / np.outer(arr_count.sum(axis=1), arr_count.sum(axis=0))[arr_is_stored]
+    )
+    assert np.allclose(pmi_matrix.toarray()[arr_is_stored], arr_expected_pmi)
+    assert pmi_matrix.nnz == arr_is_stored.sum()
+
+    positive_pmi_matrix = compute_pmi(matrix=csr_matrix(arr_count))
+    assert (positive_pmi_matrix.data > 0).all()
+    assert positive_pmi_matrix.nnz == (arr_expected_pmi > 0).sum()
+
+    arr_row, arr_col, arr_value = get_top_k(matrix=csr_matrix(arr_count), k=1)
+    assert arr_row.tolist() == [0, 1, 2]
+    assert arr_col.tolist() == [0, 1, 0]
+    assert arr_value.tolist() == [4, 2, 1]
+
+
+def test_summarize_degrees(test_logger: Logger, test_fixture: TestFixture) -> None:
+    para_graph_builder = ParaGraphBuilder(logger=test_logger)
+    para_graph_builder.add_graph_arrays(
+        graph_arrays=collect_doc_graph_arrays_from_spacy(
+            doc=test_fixture.example_paragraph_doc, logger=test_logger
+        )
+    )
+    para_graph = para_graph_builder.graph
+
+    dict_ntype_summary = summarize_degrees(graph=para_graph)
+
+    for ntype_value, degree_summary in dict_ntype_summary.items():
+        list_nid = [
+            nid
+            for nid, nfeats in para_graph.nodes.data()
+            if nfeats["ntype"] == ntype_value
+        ]
+        list_degree = [para_graph.degree(nid) for nid in list_nid]
+        assert degree_summary.n_nodes == len(list_nid)
+        assert degree_summary.max_degree == max(list_degree)
+        assert np.isclose(degree_summary.median_degree, np.median(list_degree))
+        assert np.isclose(
+            degree_summary.mean_in_degree,
+            np.mean([para_graph.in_degree(nid) for nid in list_nid]),
+        )
+    assert (
+        sum(degree_summary.n_nodes for degree_summary in dict_ntype_summary.values())
+        == para_graph.number_of_nodes()
+    )
+
+
+def test_analytics_from_interned_graph(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    para_graph_builder = ParaGraphBuilder(logger=test_logger)
+    para_graph_builder.add_graph_arrays(
+        graph_arrays=collect_doc_graph_arrays_from_spacy(
+            doc=test_fixture.example_paragraph_doc, logger=test_logger
+        )
+    )
+    para_graph = para_graph_builder.graph
+    vocab = GraphVocab()
+    interned_para_graph = vocab.encode_graph(para_graph)
+
+    # A graph encoded by a vocab is decoded with it before counting
+    with raises(ValueError):
+        summarize_degrees(graph=interned_para_graph)
+    assert summarize_degrees(graph=interned_para_graph, vocab=vocab) == (
+        summarize_degrees(graph=para_graph)
+    )
+
+    cooccurrence_counter = CooccurrenceCounter()
+    cooccurrence_counter.add_graph(graph=para_graph)
+    interned_cooccurrence_counter = CooccurrenceCounter()
+    with raises(ValueError):
+        interned_cooccurrence_counter.add_graph(graph=interned_para_graph)
+    interned_cooccurrence_counter.add_graph(graph=interned_para_graph, vocab=vocab)
+    for etype in LIST_COOCCURRENCE_ETYPE:
+        assert (
+            interned_cooccurrence_counter.get_matrix(etype=etype).matrix
+            != cooccurrence_counter.get_matrix(etype=etype).matrix
+        ).nnz == 0
+
+
+def test_cooccurrence_matrix_kept_while_counting(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    cooccurrence_counter = CooccurrenceCounter()
+    cooccurrence_counter.add_graph_arrays(
+        graph_arrays=collect_doc_graph_arrays_from_spacy(
+            doc=test_fixture.example_paragraph_doc, logger=test_logger
+        )
+    )
+    token_to_uni_pos = cooccurrence_counter.get_matrix(etype=EdgeType.token_to_uni_pos)
+    matrix = token_to_uni_pos.matrix.copy()
+    src_text, *list_src_text = [
+        token_to_uni_pos.string_table.lookup(src_id)
+        for src_id in np.unique(token_to_uni_pos.matrix.nonzero()[0]).tolist()
+    ]
+    list_top_pmi = token_to_uni_pos.top_k(src_text=src_text, k=3, use_pmi=True)
+
+    # Counting texts not seen before leaves the matrix already handed out alone
+    for _ in range(2):
+        cooccurrence_counter.add_graph_arrays(
+            graph_arrays=collect_doc_graph_arrays_from_spacy(
+                doc=nlp("Zebras graze quietly near the river."), logger=test_logger
+            )
+        )
+        new_token_to_uni_pos = cooccurrence_counter.get_matrix(
+            etype=EdgeType.token_to_uni_pos
+        )
+        assert new_token_to_uni_pos.matrix.shape != matrix.shape
+
+    assert token_to_uni_pos.matrix.shape == matrix.shape
+    assert (token_to_uni_pos.matrix != matrix).nnz == 0
+    assert token_to_uni_pos.top_k(src_text=src_text, k=3, use_pmi=True) == (
+        list_top_pmi
+    )
+    for other_src_text in list_src_text:
+        token_to_uni_pos.top_k(src_text=other_src_text, k=3, use_pmi=True)
@@ -0,0 +1,37 @@
+from logging import Logger
+
+from src.hydra.nodes.linguistic_graph_builder import ParaGraphBuilder
+from tests.conftest import TestFixture
+
+
+def test_para_graph_builder_add_node_tuples_and_edge_tuples(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    para_graph_builder = ParaGraphBuilder(logger=test_logger)
+
+    mapping_local_nid_to_nid = para_graph_builder.add_node_tuples_and_edge_tuples(
+        node_tuples=test_fixture.example_node_tuples,
+        edge_tuples=test_fixture.example_edge_tuples,
+    )
+
+    # Both "New York" token nodes are interned as one node
+    assert mapping_local_nid_to_nid[0] == mapping_local_nid_to_nid[4]
+    assert list(para_graph_builder.graph.nodes) == [0, 1, 2, 3, 4]
+    assert len(para_graph_builder.graph.edges) == 1
+
+
+def test_para_graph_builder_add_graph(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    para_graph_builder = ParaGraphBuilder(logger=test_logger)
+
+    para_graph_builder.add_graph(
+        nx_g=test_fixture.example_nx_g_for_multi_ntype_contraction
+    )
+    para_graph_builder.add_graph(
+        nx_g=test_fixture.example_nx_g_for_multi_ntype_contraction
+    )
+
+    # Token and universal pos nodes are shared, sentence nodes are not
+    assert len(para_graph_builder.graph.nodes) == 6
+    assert len(para_graph_builder.graph.edges) == 5
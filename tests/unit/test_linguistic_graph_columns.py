@@ -0,0 +1,69 @@
+from logging import Logger
+
+import numpy as np
+
+from src.hydra.nodes.linguistic_graph_builder import ParaGraphBuilder
+from src.hydra.nodes.linguistic_graph_columns import EdgeColumns, NodeColumns
+from src.hydra.nodes.linguistic_graph_construction import (
+    collect_sent_graph_elements_from_spacy,
+)
+from tests.conftest import TestFixture
+
+
+def _assert_columns_equal(columns: object, other_columns: object) -> None:
+    assert type(columns) is type(other_columns)
+    for name, arr in vars(columns).items():
+        assert np.array_equal(arr, getattr(other_columns, name))
+
+
+def test_node_columns_and_edge_columns_round_trip(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    node_tuples, edge_tuples = collect_sent_graph_elements_from_spacy(
+        sent=test_fixture.example_sentence_span, logger=test_logger
+    )
+
+    node_columns = NodeColumns.from_node_tuples(node_tuples=node_tuples)
+    edge_columns = EdgeColumns.from_edge_tuples(edge_tuples=edge_tuples)
+
+    # The dataclass view holds the same elements as the original tuples
+    assert node_columns.to_node_tuples() == node_tuples
+    assert edge_columns.to_edge_tuples() == edge_tuples
+    _assert_columns_equal(node_columns, NodeColumns.from_json(node_columns.to_json()))
+    _assert_columns_equal(node_columns, NodeColumns.from_bytes(node_columns.to_bytes()))
+    _assert_columns_equal(edge_columns, EdgeColumns.from_json(edge_columns.to_json()))
+    _assert_columns_equal(edge_columns, EdgeColumns.from_bytes(edge_columns.to_bytes()))
+
+
+def test_para_graph_builder_add_node_columns_and_edge_columns(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    node_tuples = test_fixture.example_node_tuples
+    edge_tuples = test_fixture.example_edge_tuples
+    para_graph_builder = ParaGraphBuilder(logger=test_logger)
+    mapping_local_nid_to_nid = para_graph_builder.add_node_tuples_and_edge_tuples(
+        node_tuples=node_tuples, edge_tuples=edge_tuples
+    )
+
+    # Node ids which are not row positions are mapped onto rows
+    node_columns = NodeColumns.from_node_tuples(node_tuples=node_tuples)
+    edge_columns = EdgeColumns.from_edge_tuples(edge_tuples=edge_tuples)
+    node_columns.node_id = node_columns.node_id * 10 + 3
+    edge_columns.edge_src = edge_columns.edge_src * 10 + 3
+    edge_columns.edge_dst = edge_columns.edge_dst * 10 + 3
+    columnar_para_graph_builder = ParaGraphBuilder(logger=test_logger)
+    mapping_column_nid_to_nid = (
+        columnar_para_graph_builder.add_node_columns_and_edge_columns(
+            node_columns=node_columns, edge_columns=edge_columns
+        )
+    )
+
+    assert mapping_column_nid_to_nid == {
+        local_nid * 10 + 3: nid for local_nid, nid in mapping_local_nid_to_nid.items()
+    }
+    assert list(columnar_para_graph_builder.graph.nodes.data()) == list(
+        para_graph_builder.graph.nodes.data()
+    )
+    assert list(columnar_para_graph_builder.graph.edges.data()) == list(
+        para_graph_builder.graph.edges.data()
+    )
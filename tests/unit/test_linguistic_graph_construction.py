@@ -1,10 +1,16 @@
 from logging import Logger
 
+from networkx import DiGraph
+
 from src.hydra.nodes.linguistic_graph_construction import (
+    build_graph_from_graph_arrays,
     build_graph_from_node_tuples_and_edge_tuples,
+    collect_doc_graph_arrays_from_spacy,
     collect_sent_graph_elements_from_spacy,
+    contract_nodes_by_identical_text,
     contract_ntype_nodes_by_identical_text,
     parse_for_para_graph_with_spacy,
+    parse_many_para_graphs,
 )
 from src.hydra.nodes.linguistic_graph_nodes import NodeType
 from tests.conftest import TestFixture
@@ -21,6 +27,45 @@ def test_collect_sent_graph_from_spacy(
     assert len(edge_tuples.list_edge_tuple) > 0
 
 
+def test_collect_doc_graph_arrays_from_spacy(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    doc = test_fixture.example_paragraph_doc
+
+    graph_arrays = collect_doc_graph_arrays_from_spacy(doc=doc, logger=test_logger)
+
+    n_sent_node: int = 0
+    n_sent_edge: int = 0
+    for sent in doc.sents:
+        node_tuples, edge_tuples = collect_sent_graph_elements_from_spacy(
+            sent=sent, logger=test_logger
+        )
+        n_sent_node += len(node_tuples.list_node_tuple)
+        n_sent_edge += len(edge_tuples.list_edge_tuple)
+
+    assert graph_arrays.n_nodes == n_sent_node
+    assert graph_arrays.n_edges == n_sent_edge
+    assert int(graph_arrays.edge_src.max()) < graph_arrays.n_nodes
+    assert int(graph_arrays.edge_dst.max()) < graph_arrays.n_nodes
+
+
+def test_build_graph_from_graph_arrays(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    graph_arrays = collect_doc_graph_arrays_from_spacy(
+        doc=test_fixture.example_paragraph_doc, logger=test_logger
+    )
+
+    nx_g = build_graph_from_graph_arrays(graph_arrays=graph_arrays, logger=test_logger)
+
+    assert isinstance(nx_g, DiGraph)
+    assert len(nx_g.nodes) == graph_arrays.n_nodes
+    assert all(
+        ("position_id" in nfeats) == (nfeats["ntype"] == NodeType.token.value)
+        for _, nfeats in nx_g.nodes.data()
+    )
+
+
 def test_build_graph_from_node_tuples_and_edge_tuples(
     test_logger: Logger, test_fixture: TestFixture
 ) -> None:
@@ -30,6 +75,7 @@ def test_build_graph_from_node_tuples_and_edge_tuples(
         logger=test_logger,
     )
 
+    assert isinstance(nx_g, DiGraph)
     assert len(nx_g.nodes) == 6
     assert len(nx_g.edges) == 2
 
@@ -47,6 +93,22 @@ def test_contract_ntype_nodes_by_identical_text(
     assert len(nx_g.edges) == 1
 
 
+def test_contract_nodes_by_identical_text(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    nx_g = contract_nodes_by_identical_text(
+        nx_g=test_fixture.example_nx_g_for_multi_ntype_contraction,
+        list_ntype=[NodeType.token, NodeType.uni_pos],
+        logger=test_logger,
+    )
+
+    # Sentence nodes are kept apart even if their text matches a token's text
+    assert list(nx_g.nodes) == [0, 1, 2, 3]
+    assert nx_g.nodes[1] == {"ntype": "TOKEN", "text": "Paris", "position_id": 0}
+    assert set(nx_g.edges) == {(1, 0), (1, 2), (1, 3)}
+    assert all("contraction" not in efeats for _, _, efeats in nx_g.edges.data())
+
+
 def test_parse_for_para_graph_with_spacy(
     test_logger: Logger, test_fixture: TestFixture
 ) -> None:
@@ -56,5 +118,46 @@ def test_parse_for_para_graph_with_spacy(
         logger=test_logger,
     )
 
+    assert isinstance(para_graph, DiGraph)
     assert len(para_graph.nodes) > 0
     assert len(para_graph.edges) > 0
+
+
+def test_parse_many_para_graphs(test_logger: Logger, test_fixture: TestFixture) -> None:
+    nlp = test_fixture.example_spacy_model
+    texts = [test_fixture.example_paragraph, test_fixture.example_sentence_text]
+
+    list_para_graph = list(
+        parse_many_para_graphs(texts=iter(texts), nlp=nlp, logger=test_logger)
+    )
+
+    assert len(list_para_graph) == len(texts)
+    for text, para_graph in zip(texts, list_para_graph):
+        expected_graph = parse_for_para_graph_with_spacy(
+            text=text, nlp=nlp, logger=test_logger
+        )
+        assert isinstance(para_graph, DiGraph)
+        assert isinstance(expected_graph, DiGraph)
+        assert para_graph.number_of_nodes() == expected_graph.number_of_nodes()
+        assert para_graph.number_of_edges() == expected_graph.number_of_edges()
+
+
+def test_parse_for_para_graph_with_spacy_vectorized(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    nlp = test_fixture.example_spacy_model
+
+    para_graph = parse_for_para_graph_with_spacy(
+        text=test_fixture.example_paragraph, nlp=nlp, logger=test_logger
+    )
+    vectorized_para_graph = parse_for_para_graph_with_spacy(
+        text=test_fixture.example_paragraph,
+        nlp=nlp,
+        logger=test_logger,
+        vectorized=True,
+    )
+
+    assert isinstance(para_graph, DiGraph)
+    assert isinstance(vectorized_para_graph, DiGraph)
+    assert list(vectorized_para_graph.nodes.data()) == list(para_graph.nodes.data())
+    assert list(vectorized_para_graph.edges.data()) == list(para_graph.edges.data())
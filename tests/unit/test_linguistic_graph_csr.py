@@ -0,0 +1,98 @@
+from logging import Logger
+
+from networkx import DiGraph
+
+from src.hydra.nodes.linguistic_graph_arrays import StringTable
+from src.hydra.nodes.linguistic_graph_config import NetworkXGraphType
+from src.hydra.nodes.linguistic_graph_construction import (
+    build_graph_from_graph_arrays,
+    build_graph_from_node_tuples_and_edge_tuples,
+    collect_doc_graph_arrays_from_spacy,
+    parse_for_para_graph_with_spacy,
+)
+from src.hydra.nodes.linguistic_graph_csr import CSRGraph
+from tests.conftest import TestFixture
+
+
+def test_csr_graph_from_node_tuples_and_edge_tuples(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    csr_g = build_graph_from_node_tuples_and_edge_tuples(
+        node_tuples=test_fixture.example_node_tuples,
+        edge_tuples=test_fixture.example_edge_tuples,
+        logger=test_logger,
+        graph_type=NetworkXGraphType.csr,
+    )
+
+    assert isinstance(csr_g, CSRGraph)
+    assert csr_g.n_nodes == 6
+    assert csr_g.n_edges == 2
+    assert csr_g.successors(0).tolist() == [5]
+    assert csr_g.predecessors(5).tolist() == [0, 4]
+    assert csr_g.string_table.lookup(int(csr_g.node_text[0])) == "New York"
+    assert csr_g.node_text[0] == csr_g.node_text[4]
+
+
+def test_csr_graph_from_graph_arrays_to_networkx(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    graph_arrays = collect_doc_graph_arrays_from_spacy(
+        doc=test_fixture.example_paragraph_doc, logger=test_logger
+    )
+    nx_g = build_graph_from_graph_arrays(graph_arrays=graph_arrays, logger=test_logger)
+
+    csr_g = build_graph_from_graph_arrays(
+        graph_arrays=graph_arrays,
+        logger=test_logger,
+        graph_type=NetworkXGraphType.csr,
+    )
+
+    assert isinstance(nx_g, DiGraph)
+    assert isinstance(csr_g, CSRGraph)
+    assert list(csr_g.to_networkx().nodes.data()) == list(nx_g.nodes.data())
+    assert sorted(csr_g.to_networkx().edges.data()) == sorted(nx_g.edges.data())
+    assert (csr_g.in_edge_ids.shape[0], csr_g.in_degree().sum()) == (
+        csr_g.n_edges,
+        csr_g.out_degree().sum(),
+    )
+
+
+def test_parse_for_para_graph_with_spacy_csr(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    para_graph = parse_for_para_graph_with_spacy(
+        text=test_fixture.example_paragraph, nlp=nlp, logger=test_logger
+    )
+
+    csr_para_graph = parse_for_para_graph_with_spacy(
+        text=test_fixture.example_paragraph,
+        nlp=nlp,
+        logger=test_logger,
+        graph_type=NetworkXGraphType.csr,
+    )
+
+    assert isinstance(para_graph, DiGraph)
+    assert isinstance(csr_para_graph, CSRGraph)
+    assert csr_para_graph.n_nodes == para_graph.number_of_nodes()
+    assert csr_para_graph.n_edges == para_graph.number_of_edges()
+
+
+def test_csr_graphs_share_string_table(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    string_table = StringTable()
+    graph_arrays = collect_doc_graph_arrays_from_spacy(
+        doc=test_fixture.example_paragraph_doc, logger=test_logger
+    )
+
+    csr_g = CSRGraph.from_graph_arrays(
+        graph_arrays=graph_arrays, string_table=string_table
+    )
+    n_string: int = len(string_table)
+    other_csr_g = CSRGraph.from_graph_arrays(
+        graph_arrays=graph_arrays, string_table=string_table
+    )
+
+    assert len(string_table) == n_string
+    assert (other_csr_g.node_text == csr_g.node_text).all()
@@ -0,0 +1,101 @@
+from logging import Logger
+from typing import Any, Dict, Set
+
+from networkx import DiGraph
+
+from src.hydra.nodes.corpus_graph import CorpusGraph
+from src.hydra.nodes.linguistic_graph_construction import (
+    build_graph_from_node_tuples_and_edge_tuples,
+    collect_sent_graph_elements_from_spacy,
+    contract_nodes_by_identical_text,
+    contract_nodes_in_place_with_index,
+)
+from src.hydra.nodes.linguistic_graph_edges import EdgeType
+from src.hydra.nodes.linguistic_graph_index import GraphIndex
+from src.hydra.nodes.linguistic_graph_nodes import NodeType
+from tests.conftest import TestFixture
+
+
+def _get_index_sets(graph_index: GraphIndex) -> Dict[str, Dict[Any, Set[Any]]]:
+    return {
+        name: {key: set(values) for key, values in getattr(graph_index, name).items()}
+        for name in [
+            "mapping_ntype_to_nids",
+            "mapping_ntype_text_to_nids",
+            "mapping_etype_to_edges",
+        ]
+    }
+
+
+def test_contract_nodes_in_place_with_index(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    node_tuples, edge_tuples = collect_sent_graph_elements_from_spacy(
+        sent=test_fixture.example_sentence_span, logger=test_logger
+    )
+    nx_g = build_graph_from_node_tuples_and_edge_tuples(
+        node_tuples=node_tuples, edge_tuples=edge_tuples, logger=test_logger
+    )
+    assert isinstance(nx_g, DiGraph)
+    list_ntype = [NodeType.token, NodeType.uni_pos]
+
+    contracted_g = contract_nodes_by_identical_text(
+        nx_g=nx_g, list_ntype=list_ntype, logger=test_logger
+    )
+    graph_index = GraphIndex.from_graph(nx_g=nx_g)
+    contract_nodes_in_place_with_index(
+        nx_g=nx_g, graph_index=graph_index, list_ntype=list_ntype, logger=test_logger
+    )
+
+    # Contraction in place keeps the same nodes and edges, and the index in step
+    assert list(nx_g.nodes.data()) == list(contracted_g.nodes.data())
+    assert set(nx_g.edges) == set(contracted_g.edges)
+    assert _get_index_sets(graph_index=graph_index) == _get_index_sets(
+        graph_index=GraphIndex.from_graph(nx_g=nx_g)
+    )
+    # Each universal pos tag is held by one node after contraction
+    for nid in graph_index.get_nids(ntype_value=NodeType.uni_pos.value):
+        assert graph_index.get_nids(
+            ntype_value=NodeType.uni_pos.value, text=nx_g.nodes[nid]["text"]
+        ) == [nid]
+
+
+def test_corpus_graph_index(test_logger: Logger, test_fixture: TestFixture) -> None:
+    corpus_graph = CorpusGraph(
+        logger=test_logger, track_references=True, build_index=True
+    )
+    list_para_nid = corpus_graph.append(
+        texts=test_fixture.example_corpus, nlp=test_fixture.example_spacy_model
+    )
+    corpus_graph.remove_document(para_nid=list_para_nid[0])
+    graph_index = corpus_graph.index
+    nx_g = corpus_graph.graph
+
+    assert graph_index is not None
+    assert _get_index_sets(graph_index=graph_index) == _get_index_sets(
+        graph_index=GraphIndex.from_graph(nx_g=nx_g)
+    )
+    assert graph_index.get_nids(ntype_value=NodeType.paragraph.value) == (
+        list_para_nid[1:]
+    )
+    assert set(graph_index.get_edges(etype_value=EdgeType.sent_to_para.value)) == {
+        (u, v)
+        for u, v, etype in nx_g.edges.data("etype")
+        if etype == EdgeType.sent_to_para.value
+    }
+    # Tokens of every PERSON ner node
+    assert set(
+        graph_index.get_linked_nids(
+            nx_g=nx_g,
+            ntype_value=NodeType.ner.value,
+            text="PERSON",
+            etype_value=EdgeType.token_to_ner.value,
+        )
+    ) == {
+        u
+        for u, v, etype in nx_g.edges.data("etype")
+        if etype == EdgeType.token_to_ner.value and nx_g.nodes[v]["text"] == "PERSON"
+    }
+    assert set(graph_index.get_nids_by_text(text="language")) == {
+        nid for nid, text in nx_g.nodes.data("text") if text == "language"
+    }
@@ -0,0 +1,89 @@
+from logging import Logger
+
+from networkx import DiGraph
+from pytest import mark, raises
+
+from src.hydra.nodes.linguistic_graph_construction import (
+    collect_sent_graph_elements_from_spacy,
+    parse_for_para_graph_with_spacy,
+)
+from src.hydra.nodes.linguistic_graph_edges import EdgeType
+from src.hydra.nodes.linguistic_graph_nodes import NodeType
+from src.hydra.nodes.linguistic_graph_schema import (
+    GraphSchema,
+    get_spacy_pipes_to_disable,
+)
+from tests.conftest import TestFixture
+
+
+def test_graph_schema_requires_endpoint_ntypes() -> None:
+    with raises(ValueError):
+        GraphSchema(list_ntype=[NodeType.token], list_etype=[EdgeType.token_to_ner])
+    with raises(ValueError):
+        GraphSchema(list_ntype=[NodeType.paragraph], list_etype=[])
+
+
+def test_get_spacy_pipes_to_disable(test_fixture: TestFixture) -> None:
+    nlp = test_fixture.example_spacy_model
+
+    list_disable_pipe = get_spacy_pipes_to_disable(
+        nlp=nlp,
+        schema=GraphSchema(
+            list_ntype=[NodeType.token], list_etype=[EdgeType.dependency_arc]
+        ),
+    )
+
+    assert "ner" in list_disable_pipe
+    assert "lemmatizer" in list_disable_pipe
+    assert "attribute_ruler" in list_disable_pipe
+    assert "parser" not in list_disable_pipe
+    assert "lemmatizer" in get_spacy_pipes_to_disable(nlp=nlp, schema=GraphSchema())
+    assert "ner" not in get_spacy_pipes_to_disable(nlp=nlp, schema=GraphSchema())
+
+
+def test_collect_sent_graph_elements_from_spacy_with_schema(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    node_tuples, edge_tuples = collect_sent_graph_elements_from_spacy(
+        sent=test_fixture.example_sentence_span,
+        logger=test_logger,
+        schema=GraphSchema(
+            list_ntype=[NodeType.token], list_etype=[EdgeType.dependency_arc]
+        ),
+    )
+
+    assert len(node_tuples.list_node_tuple) == len(test_fixture.example_sentence_span)
+    assert {
+        node_tuple.node_feats.ntype for node_tuple in node_tuples.list_node_tuple
+    } == {NodeType.token}
+    assert {
+        edge_tuple.edge_feats.etype for edge_tuple in edge_tuples.list_edge_tuple
+    } == {EdgeType.dependency_arc}
+
+
+@mark.parametrize("vectorized", [False, True])
+def test_parse_for_para_graph_with_spacy_with_schema(
+    test_logger: Logger, test_fixture: TestFixture, vectorized: bool
+) -> None:
+    schema = GraphSchema(
+        list_ntype=[NodeType.token, NodeType.ner],
+        list_etype=[EdgeType.token_to_ner],
+    )
+
+    para_graph = parse_for_para_graph_with_spacy(
+        text=test_fixture.example_paragraph,
+        nlp=test_fixture.example_spacy_model,
+        logger=test_logger,
+        vectorized=vectorized,
+        schema=schema,
+    )
+
+    assert isinstance(para_graph, DiGraph)
+    assert len(para_graph.nodes) > 0
+    assert {ntype for _, ntype in para_graph.nodes.data("ntype")} <= {
+        NodeType.token.value,
+        NodeType.ner.value,
+    }
+    assert {etype for _, _, etype in para_graph.edges.data("etype")} == {
+        EdgeType.token_to_ner.value
+    }
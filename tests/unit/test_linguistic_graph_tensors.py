@@ -0,0 +1,146 @@
+from logging import Logger
+
+import numpy as np
+from networkx import DiGraph
+from pytest import raises
+
+from src.hydra.nodes.linguistic_graph_config import NetworkXGraphType
+from src.hydra.nodes.linguistic_graph_construction import parse_many_para_graphs
+from src.hydra.nodes.linguistic_graph_edges import DependencyLabel, EdgeType
+from src.hydra.nodes.linguistic_graph_nodes import NodeType, UniversalPOSTag
+from src.hydra.nodes.linguistic_graph_tensors import (
+    GraphTensors,
+    collate_graph_tensors,
+)
+from src.hydra.nodes.linguistic_graph_vocab import GraphVocab
+from tests.conftest import TestFixture
+
+
+def _assert_graph_tensors_equal(
+    graph_tensors: GraphTensors, other_graph_tensors: GraphTensors
+) -> None:
+    for name in [
+        "node_ntype",
+        "node_uni_pos",
+        "node_ner",
+        "node_position_id",
+        "dependency_arc_label",
+        "node_offsets",
+    ]:
+        assert np.array_equal(
+            getattr(graph_tensors, name), getattr(other_graph_tensors, name)
+        )
+    for etype in EdgeType:
+        assert np.array_equal(
+            graph_tensors.dict_edge_index[etype],
+            other_graph_tensors.dict_edge_index[etype],
+        )
+        assert np.array_equal(
+            graph_tensors.dict_edge_offsets[etype],
+            other_graph_tensors.dict_edge_offsets[etype],
+        )
+
+
+def test_graph_tensors_from_graph(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    list_para_graph = list(
+        parse_many_para_graphs(
+            texts=test_fixture.example_corpus[:1],
+            nlp=test_fixture.example_spacy_model,
+            logger=test_logger,
+        )
+    )
+    para_graph = list_para_graph[0]
+    assert isinstance(para_graph, DiGraph)
+
+    graph_tensors = GraphTensors.from_graph(graph=para_graph)
+
+    # Labels decode back to the node and edge attributes of the graph
+    list_nfeats = [nfeats for _, nfeats in para_graph.nodes.data()]
+    list_uni_pos = list(UniversalPOSTag)
+    for nfeats, ntype_code, uni_pos_code in zip(
+        list_nfeats,
+        graph_tensors.node_ntype.tolist(),
+        graph_tensors.node_uni_pos.tolist(),
+    ):
+        assert list(NodeType)[ntype_code].value == nfeats["ntype"]
+        if nfeats["ntype"] == NodeType.uni_pos.value:
+            assert list_uni_pos[uni_pos_code].value == nfeats["text"]
+        else:
+            assert uni_pos_code == -1
+    list_nid = list(para_graph.nodes)
+    list_dependency = list(DependencyLabel)
+    arr_dependency_edge_index = graph_tensors.dict_edge_index[EdgeType.dependency_arc]
+    assert sorted(
+        (list_nid[src], list_nid[dst], list_dependency[label_code].value)
+        for src, dst, label_code in zip(
+            arr_dependency_edge_index[0].tolist(),
+            arr_dependency_edge_index[1].tolist(),
+            graph_tensors.dependency_arc_label.tolist(),
+        )
+    ) == sorted(
+        (u, v, efeats["text"])
+        for u, v, efeats in para_graph.edges.data()
+        if efeats["etype"] == EdgeType.dependency_arc.value
+    )
+    assert sum(
+        edge_index.shape[1] for edge_index in graph_tensors.dict_edge_index.values()
+    ) == len(para_graph.edges)
+
+    # A graph encoded by a vocab gives the same tensors once decoded
+    vocab = GraphVocab()
+    interned_para_graph = vocab.encode_graph(para_graph)
+    with raises(ValueError):
+        GraphTensors.from_graph(graph=interned_para_graph)
+    _assert_graph_tensors_equal(
+        GraphTensors.from_graph(graph=interned_para_graph, vocab=vocab), graph_tensors
+    )
+
+
+def test_collate_graph_tensors(test_logger: Logger, test_fixture: TestFixture) -> None:
+    list_graph_tensors = [
+        GraphTensors.from_graph(graph=csr_g)
+        for csr_g in parse_many_para_graphs(
+            texts=test_fixture.example_corpus,
+            nlp=test_fixture.example_spacy_model,
+            logger=test_logger,
+            graph_type=NetworkXGraphType.csr,
+        )
+    ]
+
+    batch_graph_tensors = collate_graph_tensors(list_graph_tensors=list_graph_tensors)
+
+    assert batch_graph_tensors.n_graphs == len(list_graph_tensors)
+    for i, graph_tensors in enumerate(list_graph_tensors):
+        node_start = batch_graph_tensors.node_offsets[i]
+        assert np.array_equal(
+            batch_graph_tensors.node_ntype[
+                node_start : batch_graph_tensors.node_offsets[i + 1]
+            ],
+            graph_tensors.node_ntype,
+        )
+        for etype in EdgeType:
+            edge_offsets = batch_graph_tensors.dict_edge_offsets[etype]
+            assert np.array_equal(
+                batch_graph_tensors.dict_edge_index[etype][
+                    :, edge_offsets[i] : edge_offsets[i + 1]
+                ]
+                - node_start,
+                graph_tensors.dict_edge_index[etype],
+            )
+    assert np.array_equal(
+        np.bincount(batch_graph_tensors.node_graph_index),
+        [graph_tensors.n_nodes for graph_tensors in list_graph_tensors],
+    )
+
+    # Collating batches gives the batch of all their graphs
+    _assert_graph_tensors_equal(
+        collate_graph_tensors(
+            list_graph_tensors=[
+                collate_graph_tensors(list_graph_tensors=list_graph_tensors[:2]),
+                collate_graph_tensors(list_graph_tensors=list_graph_tensors[2:]),
+            ]
+        ),
+        batch_graph_tensors,
+    )
@@ -0,0 +1,144 @@
+from logging import Logger
+
+import numpy as np
+from networkx import DiGraph
+from pytest import raises
+
+from src.hydra.nodes.linguistic_graph_arrays import GraphArrays
+from src.hydra.nodes.linguistic_graph_config import NetworkXGraphType
+from src.hydra.nodes.linguistic_graph_construction import (
+    parse_for_para_graph_with_spacy,
+    parse_many_para_graphs,
+)
+from src.hydra.nodes.linguistic_graph_csr import CSRGraph
+from src.hydra.nodes.linguistic_graph_edges import EdgeType
+from src.hydra.nodes.linguistic_graph_nodes import NodeType
+from src.hydra.nodes.linguistic_graph_vocab import GraphVocab
+from tests.conftest import TestFixture
+
+
+def test_graph_vocab_encode_and_decode() -> None:
+    vocab = GraphVocab()
+    nfeats = {"ntype": NodeType.token.value, "text": "Language", "position_id": 0}
+    efeats = {"etype": EdgeType.dependency_arc.value, "text": "NSUBJ"}
+
+    encoded_nfeats = vocab.encode_node_feats(nfeats)
+    encoded_efeats = vocab.encode_edge_feats(efeats)
+
+    assert vocab.lookup_ntype(encoded_nfeats["ntype"]) == NodeType.token
+    assert vocab.lookup_etype(encoded_efeats["etype"]) == EdgeType.dependency_arc
+    assert vocab.lookup_text(encoded_nfeats["text"]) == "Language"
+    assert vocab.intern_text("Language") == encoded_nfeats["text"]
+    assert vocab.decode_node_feats(encoded_nfeats) == nfeats
+    assert vocab.decode_edge_feats(encoded_efeats) == efeats
+    assert len(vocab) == 2
+
+
+def test_parse_for_para_graph_with_spacy_interned(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    vocab = GraphVocab()
+
+    para_graph = parse_for_para_graph_with_spacy(
+        text=test_fixture.example_paragraph, nlp=nlp, logger=test_logger
+    )
+    list_interned_para_graph = [
+        parse_for_para_graph_with_spacy(
+            text=test_fixture.example_paragraph,
+            nlp=nlp,
+            logger=test_logger,
+            vectorized=vectorized,
+            vocab=vocab,
+        )
+        for vectorized in [False, True]
+    ]
+
+    assert isinstance(para_graph, DiGraph)
+    for interned_para_graph in list_interned_para_graph:
+        assert isinstance(interned_para_graph, DiGraph)
+        assert all(
+            isinstance(ntype_code, int) and isinstance(text_id, int)
+            for _, ntype_code, text_id in (
+                (nid, nfeats["ntype"], nfeats["text"])
+                for nid, nfeats in interned_para_graph.nodes.data()
+            )
+        )
+        decoded_para_graph = vocab.decode_graph(interned_para_graph)
+        assert list(decoded_para_graph.nodes.data()) == list(para_graph.nodes.data())
+        assert sorted(decoded_para_graph.edges.data("text")) == sorted(
+            para_graph.edges.data("text")
+        )
+
+    # Setting an attribute of one edge leaves edges of equal attributes alone
+    interned_para_graph = list_interned_para_graph[0]
+    assert isinstance(interned_para_graph, DiGraph)
+    (u, v, efeats), *list_other_edge = interned_para_graph.edges.data()
+    list_equal_edge = [
+        (other_u, other_v)
+        for other_u, other_v, other_efeats in list_other_edge
+        if other_efeats == efeats
+    ]
+    assert list_equal_edge
+    expected_efeats = dict(efeats)
+    interned_para_graph[u][v]["text"] = -1
+    assert all(
+        interned_para_graph[other_u][other_v] == expected_efeats
+        for other_u, other_v in list_equal_edge
+    )
+
+
+def test_parse_many_para_graphs_interned_csr(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    vocab = GraphVocab()
+
+    list_csr_g = list(
+        parse_many_para_graphs(
+            texts=test_fixture.example_corpus,
+            nlp=test_fixture.example_spacy_model,
+            logger=test_logger,
+            graph_type=NetworkXGraphType.csr,
+            vocab=vocab,
+        )
+    )
+
+    # Every graph holds text ids into the string table of the shared vocab
+    for csr_g in list_csr_g:
+        assert isinstance(csr_g, CSRGraph)
+        assert csr_g.string_table is vocab.string_table
+        assert int(csr_g.node_text.max()) < len(vocab)
+
+
+def test_graph_arrays_from_interned_networkx(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    vocab = GraphVocab()
+    interned_para_graph = parse_for_para_graph_with_spacy(
+        text=test_fixture.example_paragraph,
+        nlp=test_fixture.example_spacy_model,
+        logger=test_logger,
+        vocab=vocab,
+    )
+    assert isinstance(interned_para_graph, DiGraph)
+
+    # Integer codes are not taken for node type values
+    with raises(ValueError):
+        GraphArrays.from_networkx(nx_g=interned_para_graph)
+
+    graph_arrays = GraphArrays.from_networkx(nx_g=interned_para_graph, vocab=vocab)
+    expected_graph_arrays = GraphArrays.from_networkx(
+        nx_g=vocab.decode_graph(interned_para_graph)
+    )
+    for name in [
+        "node_ntype",
+        "node_text",
+        "node_position_id",
+        "edge_src",
+        "edge_dst",
+        "edge_etype",
+        "edge_text",
+    ]:
+        assert np.array_equal(
+            getattr(graph_arrays, name), getattr(expected_graph_arrays, name)
+        )
@@ -0,0 +1,68 @@
+from logging import Logger
+
+from networkx import DiGraph
+from pytest import mark, raises
+
+from src.hydra.nodes.linguistic_graph_nodes import NodeType
+from src.hydra.nodes.long_document_streaming import (
+    iter_text_chunks,
+    parse_long_document_for_para_graph,
+)
+from tests.conftest import TestFixture
+
+
+def test_iter_text_chunks(test_fixture: TestFixture) -> None:
+    text = "\n\n".join([test_fixture.example_paragraph] * 3)
+
+    list_chunk = list(iter_text_chunks(text=text, max_chunk_chars=1000))
+
+    # Chunks rejoin into the text and end at the blank lines between paragraphs
+    assert "".join(list_chunk) == text
+    assert all(len(chunk) <= 1000 for chunk in list_chunk)
+    assert all(chunk.endswith("\n\n") for chunk in list_chunk[:-1])
+
+    list_short_chunk = list(iter_text_chunks(text=text, max_chunk_chars=50))
+    assert "".join(list_short_chunk) == text
+    assert all(len(chunk) <= 50 for chunk in list_short_chunk)
+
+    with raises(ValueError):
+        next(iter_text_chunks(text=text, max_chunk_chars=0))
+
+
+@mark.parametrize("vectorized", [False, True])
+def test_parse_long_document_for_para_graph(
+    test_logger: Logger, test_fixture: TestFixture, vectorized: bool
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    text = "\n\n".join(
+        [test_fixture.example_paragraph] * 3 + ["Finally the zebra sleeps."]
+    )
+
+    long_doc_graph = parse_long_document_for_para_graph(
+        text=text,
+        nlp=nlp,
+        logger=test_logger,
+        max_chunk_chars=200,
+        vectorized=vectorized,
+    )
+    assert isinstance(long_doc_graph, DiGraph)
+
+    # Token positions index the whole document rather than each chunk
+    doc = nlp(text)
+    list_token_nfeats = [
+        nfeats
+        for _, nfeats in long_doc_graph.nodes.data()
+        if nfeats["ntype"] == NodeType.token.value
+    ]
+    assert [
+        nfeats["position_id"]
+        for nfeats in list_token_nfeats
+        if nfeats["text"] == "zebra"
+    ] == [len(doc) - 3]
+    for nfeats in list_token_nfeats:
+        assert doc[nfeats["position_id"]].text == nfeats["text"]
+
+    with raises(ValueError):
+        parse_long_document_for_para_graph(
+            text=text, nlp=nlp, logger=test_logger, max_chunk_chars=nlp.max_length + 1
+        )
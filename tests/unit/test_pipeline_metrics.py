@@ -0,0 +1,134 @@
+import tracemalloc
+from logging import Logger
+
+from networkx import DiGraph
+
+from src.hydra.nodes.linguistic_graph_construction import (
+    contract_nodes_by_identical_text,
+    parse_for_para_graph_with_spacy,
+    parse_many_para_graphs,
+)
+from src.hydra.nodes.linguistic_graph_nodes import NodeType
+from src.hydra.nodes.pipeline_metrics import NULL_PIPELINE_METRICS, PipelineMetrics
+from tests.conftest import TestFixture
+
+
+def test_pipeline_metrics_parse_for_para_graph(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    metrics = PipelineMetrics(track_allocations=True)
+
+    para_graph = parse_for_para_graph_with_spacy(
+        text=test_fixture.example_paragraph,
+        nlp=test_fixture.example_spacy_model,
+        logger=test_logger,
+        metrics=metrics,
+    )
+    metrics.close()
+    summary = metrics.summary()
+
+    assert isinstance(para_graph, DiGraph)
+    assert set(summary["stages"]) == {"spacy_parse", "collect_elements", "graph_build"}
+    assert summary["stages"]["spacy_parse"]["n_calls"] == 1
+    assert summary["stages"]["graph_build"]["n_calls"] == len(
+        list(test_fixture.example_paragraph_doc.sents)
+    )
+    assert summary["stages"]["spacy_parse"]["peak_alloc_bytes"] > 0
+    assert summary["counters"]["para_graphs"] == 1
+    assert summary["counters"]["nodes"] == len(para_graph.nodes)
+    assert summary["counters"]["edges"] == len(para_graph.edges)
+    assert summary["counters"]["nodes_added"] == len(para_graph.nodes)
+    assert summary["counters"]['contracted_nodes{ntype="UNIVERSALPOS"}'] > 0
+
+    prometheus_text = metrics.to_prometheus_text()
+    assert "# TYPE hydra_stage_seconds_total counter" in prometheus_text
+    assert 'hydra_stage_calls_total{stage="spacy_parse"} 1' in prometheus_text
+    assert f"hydra_nodes_total {len(para_graph.nodes)}" in prometheus_text
+
+
+def test_pipeline_metrics_parse_many_para_graphs(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    metrics = PipelineMetrics()
+    texts = test_fixture.example_corpus
+
+    list_para_graph = list(
+        parse_many_para_graphs(
+            texts=texts,
+            nlp=test_fixture.example_spacy_model,
+            logger=test_logger,
+            vectorized=True,
+            metrics=metrics,
+        )
+    )
+    summary = metrics.summary()
+
+    assert len(list_para_graph) == len(texts)
+    assert summary["stages"]["spacy_parse"]["n_calls"] == len(texts) + 1
+    assert summary["stages"]["collect_elements"]["n_calls"] == len(texts)
+    assert summary["stages"]["graph_build"]["alloc_bytes"] == 0
+    assert summary["counters"]["para_graphs"] == len(texts)
+
+
+def test_pipeline_metrics_contraction(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    metrics = PipelineMetrics()
+    nx_g = test_fixture.example_nx_g_for_multi_ntype_contraction
+
+    contracted_g = contract_nodes_by_identical_text(
+        nx_g=nx_g,
+        list_ntype=[NodeType.token, NodeType.uni_pos],
+        logger=test_logger,
+        metrics=metrics,
+    )
+    summary = metrics.summary()
+
+    assert summary["stages"]["contraction"]["n_calls"] == 1
+    assert sum(summary["counters"].values()) == len(nx_g.nodes) - len(
+        contracted_g.nodes
+    )
+
+
+def test_pipeline_metrics_stops_its_tracing() -> None:
+    assert not tracemalloc.is_tracing()
+    with PipelineMetrics(track_allocations=True) as metrics:
+        with metrics.time_stage("spacy_parse"):
+            list_block = [bytes(1024) for _ in range(8)]
+        assert tracemalloc.is_tracing()
+
+    assert len(list_block) == 8
+    assert not tracemalloc.is_tracing()
+    assert metrics.summary()["stages"]["spacy_parse"]["alloc_bytes"] > 0
+
+    # Tracing started elsewhere is left running
+    tracemalloc.start()
+    try:
+        with PipelineMetrics(track_allocations=True):
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_pipeline_metrics_escapes_label_values() -> None:
+    metrics = PipelineMetrics()
+
+    with metrics.time_stage('quoted "stage"'):
+        metrics.count("contracted_nodes", ntype='back\\slash "quote"\nline')
+    prometheus_text = metrics.to_prometheus_text()
+
+    assert 'hydra_stage_calls_total{stage="quoted \\"stage\\""} 1' in prometheus_text
+    assert (
+        'hydra_contracted_nodes_total{ntype="back\\\\slash \\"quote\\"\\nline"} 1'
+        in prometheus_text
+    )
+    assert len(prometheus_text.splitlines()) == 6
+
+
+def test_null_pipeline_metrics() -> None:
+    with NULL_PIPELINE_METRICS.time_stage("spacy_parse"):
+        NULL_PIPELINE_METRICS.count("nodes", 3)
+
+    assert not NULL_PIPELINE_METRICS.enabled
+    assert NULL_PIPELINE_METRICS.summary() == {"stages": {}, "counters": {}}
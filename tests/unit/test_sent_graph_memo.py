@@ -0,0 +1,108 @@
+import unicodedata
+from logging import Logger
+
+from networkx import DiGraph
+from pytest import mark
+
+from src.hydra.nodes.linguistic_graph_construction import parse_many_para_graphs
+from src.hydra.nodes.linguistic_graph_nodes import NodeType
+from src.hydra.nodes.linguistic_graph_schema import GraphSchema
+from src.hydra.nodes.sent_graph_memo import SentGraphMemo
+from tests.conftest import TestFixture
+
+
+@mark.parametrize("vectorized", [False, True])
+def test_parse_many_para_graphs_with_sent_graph_memo(
+    test_logger: Logger, test_fixture: TestFixture, vectorized: bool
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    sentence = test_fixture.example_sentence_text
+    # Repeated sentences start at different token positions of their docs
+    texts = [
+        test_fixture.example_paragraph,
+        sentence,
+        f"The disclaimer comes first. {sentence}",
+        test_fixture.example_paragraph,
+    ]
+    sent_graph_memo = SentGraphMemo(logger=test_logger)
+
+    list_para_graph = list(
+        parse_many_para_graphs(
+            texts=texts, nlp=nlp, logger=test_logger, vectorized=vectorized
+        )
+    )
+    list_memo_para_graph = list(
+        parse_many_para_graphs(
+            texts=texts,
+            nlp=nlp,
+            logger=test_logger,
+            vectorized=vectorized,
+            sent_graph_memo=sent_graph_memo,
+        )
+    )
+
+    for memo_para_graph, para_graph in zip(list_memo_para_graph, list_para_graph):
+        assert isinstance(memo_para_graph, DiGraph)
+        assert isinstance(para_graph, DiGraph)
+        assert list(memo_para_graph.nodes.data()) == list(para_graph.nodes.data())
+        assert list(memo_para_graph.edges.data()) == list(para_graph.edges.data())
+
+    n_sent = sum(len(list(nlp(text).sents)) for text in texts)
+    stats = sent_graph_memo.stats
+    assert stats.n_hits + stats.n_misses == n_sent
+    assert stats.n_hits == 1 + len(list(nlp(test_fixture.example_paragraph).sents))
+    assert stats.n_entries == stats.n_misses
+    assert stats.n_bytes > 0
+
+
+def test_sent_graph_memo_eviction(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    sent_graph_memo = SentGraphMemo(logger=test_logger, max_entries=2)
+    texts = ["The cat sat.", "The dog ran.", "The cow ate.", "The cat sat."]
+
+    list(
+        parse_many_para_graphs(
+            texts=texts, nlp=nlp, logger=test_logger, sent_graph_memo=sent_graph_memo
+        )
+    )
+
+    # The first sentence was evicted before it came back
+    stats = sent_graph_memo.stats
+    assert (stats.n_hits, stats.n_misses) == (0, 4)
+    assert (stats.n_entries, stats.n_evictions) == (2, 2)
+
+    # Entries are kept apart per schema
+    list(
+        parse_many_para_graphs(
+            texts=texts[-1:],
+            nlp=nlp,
+            logger=test_logger,
+            schema=GraphSchema(list_ntype=[NodeType.token], list_etype=[]),
+            sent_graph_memo=sent_graph_memo,
+        )
+    )
+    assert sent_graph_memo.stats.n_hits == 0
+
+
+def test_sent_graph_memo_normalizes_text(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    sent_graph_memo = SentGraphMemo(logger=test_logger)
+    # The same sentence composed and decomposed, then with a space spacy keeps
+    texts = [
+        unicodedata.normalize("NFC", "The café closed."),
+        unicodedata.normalize("NFD", "The café closed."),
+        "The  café closed.",
+    ]
+
+    list(
+        parse_many_para_graphs(
+            texts=texts, nlp=nlp, logger=test_logger, sent_graph_memo=sent_graph_memo
+        )
+    )
+
+    stats = sent_graph_memo.stats
+    assert (stats.n_hits, stats.n_misses) == (1, 2)
@@ -0,0 +1,101 @@
+from logging import Logger
+from typing import Any, Iterable, Iterator, List
+
+import numpy as np
+from networkx import DiGraph
+from pytest import MonkeyPatch
+from spacy.tokens import Doc
+
+from src.hydra.nodes.linguistic_graph_construction import parse_many_para_graphs
+from src.hydra.nodes.spacy_length_batching import (
+    SpacyLengthBatcher,
+    split_length_batches,
+)
+from tests.conftest import TestFixture
+
+
+def test_split_length_batches() -> None:
+    arr_n_token = np.array([30, 5, 12, 6, 80, 11, 5], dtype=np.int64)
+
+    list_batch = split_length_batches(arr_n_token=arr_n_token, max_batch_tokens=40)
+
+    # Every doc lands in one batch, batches hold docs of neighbouring lengths,
+    # and only a doc longer than the budget makes a batch exceed it
+    assert sorted(np.concatenate(list_batch).tolist()) == list(range(7))
+    assert [arr_n_token[batch].tolist() for batch in list_batch] == [
+        [5, 5, 6],
+        [11, 12],
+        [30],
+        [80],
+    ]
+
+
+def test_parse_many_para_graphs_with_length_batcher(
+    test_logger: Logger, test_fixture: TestFixture
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    texts = [
+        test_fixture.example_paragraph,
+        test_fixture.example_sentence_text,
+        " ".join([test_fixture.example_sentence_text] * 3),
+    ] * 3
+    length_batcher = SpacyLengthBatcher(
+        logger=test_logger, max_batch_tokens=256, window_size=5
+    )
+
+    list_para_graph = list(
+        parse_many_para_graphs(texts=texts, nlp=nlp, logger=test_logger)
+    )
+    list_batched_para_graph = list(
+        parse_many_para_graphs(
+            texts=texts, nlp=nlp, logger=test_logger, length_batcher=length_batcher
+        )
+    )
+
+    # Graphs come back in input order
+    assert len(list_batched_para_graph) == len(list_para_graph)
+    for batched_para_graph, para_graph in zip(list_batched_para_graph, list_para_graph):
+        assert isinstance(batched_para_graph, DiGraph)
+        assert isinstance(para_graph, DiGraph)
+        assert list(batched_para_graph.nodes.data()) == list(para_graph.nodes.data())
+        assert list(batched_para_graph.edges.data()) == list(para_graph.edges.data())
+
+    stats = length_batcher.stats
+    assert stats.n_docs == len(texts)
+    assert stats.n_tokens == sum(len(nlp.make_doc(text)) for text in texts)
+    assert stats.n_padded_tokens >= stats.n_tokens
+    assert 0 <= stats.padding_ratio < 1
+    assert stats.docs_per_second > 0
+
+
+def test_length_batcher_pipes_once_with_several_processes(
+    test_logger: Logger, test_fixture: TestFixture, monkeypatch: MonkeyPatch
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    texts = [
+        test_fixture.example_paragraph,
+        test_fixture.example_sentence_text,
+        " ".join([test_fixture.example_sentence_text] * 3),
+    ] * 3
+    length_batcher = SpacyLengthBatcher(
+        logger=test_logger, max_batch_tokens=256, window_size=5
+    )
+
+    # Record the pipeline calls, parsing in this process
+    list_n_process: List[int] = []
+
+    def pipe(docs: Iterable[Doc], n_process: int = 1, **kwargs: Any) -> Iterator[Doc]:
+        list_n_process.append(n_process)
+        return nlp_pipe(docs, **kwargs)
+
+    nlp_pipe = nlp.pipe
+    monkeypatch.setattr(nlp, "pipe", pipe)
+    list_doc = list(length_batcher.pipe(texts=texts, nlp=nlp, n_process=2))
+
+    # Both windows go through one call, starting one pool of workers
+    assert list_n_process == [2]
+    assert [doc.text for doc in list_doc] == texts
+    assert [doc.has_annotation("DEP") for doc in list_doc] == [True] * len(texts)
+    stats = length_batcher.stats
+    assert stats.n_docs == len(texts)
+    assert stats.n_padded_tokens >= stats.n_tokens
@@ -0,0 +1,74 @@
+import logging.config
+import pickle
+import subprocess
+import sys
+from typing import Any, List
+
+from pytest import MonkeyPatch
+from spacy.language import Language
+
+from src.hydra.nodes.base_logger import get_base_logger
+from src.hydra.nodes.spacy_model_registry import (
+    SPACY_MODEL_REGISTRY,
+    SpacyModelLoader,
+    SpacyModelRegistry,
+)
+from tests.conftest import TestFixture
+
+
+def test_spacy_model_registry(
+    test_fixture: TestFixture, monkeypatch: MonkeyPatch
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    list_load: List[str] = []
+
+    def load_model(name: str, exclude: List[str]) -> Language:
+        list_load.append(name)
+        return nlp
+
+    spacy_model_registry = SpacyModelRegistry(load_model=load_model)
+
+    # Each model and set of excluded components is loaded once
+    assert spacy_model_registry.get(name="en_core_web_sm") is nlp
+    assert spacy_model_registry.get(name="en_core_web_sm") is nlp
+    spacy_model_registry.get(name="en_core_web_sm", exclude=["ner", "parser"])
+    spacy_model_registry.get(name="en_core_web_sm", exclude=["parser", "ner"])
+    assert list_load == ["en_core_web_sm"] * 2
+    assert "en_core_web_sm" in spacy_model_registry
+
+    spacy_model_registry.clear()
+    assert "en_core_web_sm" not in spacy_model_registry
+
+    # Loaders sent to worker processes go through the process wide registry
+    monkeypatch.setattr(SPACY_MODEL_REGISTRY, "load_model", load_model)
+    monkeypatch.setattr(SPACY_MODEL_REGISTRY, "mapping_key_to_nlp", {})
+    spacy_model_loader = pickle.loads(pickle.dumps(SpacyModelLoader(name="model")))
+    assert spacy_model_loader() is nlp
+    assert spacy_model_loader() is nlp
+    assert list_load == ["en_core_web_sm"] * 2 + ["model"]
+
+
+def test_get_base_logger_configures_once(monkeypatch: MonkeyPatch) -> None:
+    get_base_logger()
+
+    def file_config(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("Logging config was parsed again")
+
+    monkeypatch.setattr(logging.config, "fileConfig", file_config)
+    get_base_logger()
+
+
+def test_graph_construction_import_defers_spacy() -> None:
+    completed_process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, src.hydra.nodes.linguistic_graph_construction, "
+            "src.hydra.benchmark; print('spacy' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed_process.stdout.strip() == "False"
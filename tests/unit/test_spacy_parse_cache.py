@@ -0,0 +1,153 @@
+from logging import Logger
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List
+
+from networkx import DiGraph
+from pytest import MonkeyPatch
+from spacy.tokens import Doc
+
+from src.hydra.nodes.linguistic_graph_construction import (
+    parse_for_para_graph_with_spacy,
+    parse_many_para_graphs,
+)
+from src.hydra.nodes.linguistic_graph_schema import (
+    GraphSchema,
+    get_spacy_pipes_to_disable,
+)
+from src.hydra.nodes.spacy_parse_cache import (
+    SpacyParseCache,
+    get_spacy_model_fingerprint,
+)
+from tests.conftest import TestFixture
+
+
+def test_spacy_parse_cache_parse(
+    test_logger: Logger, test_fixture: TestFixture, tmp_path: Path
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    parse_cache = SpacyParseCache(path_cache_dir=tmp_path, logger=test_logger)
+
+    para_graph = parse_for_para_graph_with_spacy(
+        text=test_fixture.example_paragraph, nlp=nlp, logger=test_logger
+    )
+    list_cached_para_graph = [
+        parse_for_para_graph_with_spacy(
+            text=test_fixture.example_paragraph,
+            nlp=nlp,
+            logger=test_logger,
+            parse_cache=parse_cache,
+        )
+        for _ in range(2)
+    ]
+
+    assert (parse_cache.stats.n_misses, parse_cache.stats.n_hits) == (1, 1)
+    assert isinstance(para_graph, DiGraph)
+    for cached_para_graph in list_cached_para_graph:
+        assert isinstance(cached_para_graph, DiGraph)
+        assert list(cached_para_graph.nodes.data()) == list(para_graph.nodes.data())
+        assert list(cached_para_graph.edges.data()) == list(para_graph.edges.data())
+
+    # Parses persist across cache instances sharing a directory, keyed on the
+    # spacy components enabled for the parse
+    reopened_parse_cache = SpacyParseCache(path_cache_dir=tmp_path, logger=test_logger)
+    assert reopened_parse_cache.get(
+        text=test_fixture.example_paragraph,
+        nlp=nlp,
+        disable=get_spacy_pipes_to_disable(nlp=nlp, schema=GraphSchema()),
+    )
+    assert (
+        reopened_parse_cache.get(text=test_fixture.example_paragraph, nlp=nlp) is None
+    )
+    assert reopened_parse_cache.stats.n_entries == 1
+
+
+def test_spacy_parse_cache_pipe(
+    test_logger: Logger,
+    test_fixture: TestFixture,
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    texts = test_fixture.example_corpus
+    parse_cache = SpacyParseCache(path_cache_dir=tmp_path, logger=test_logger)
+    parse_cache.parse(
+        text=texts[2],
+        nlp=nlp,
+        disable=get_spacy_pipes_to_disable(nlp=nlp, schema=GraphSchema()),
+    )
+
+    # Record the texts of every pipeline call, each of which would start a pool
+    # of workers
+    list_piped_texts: List[List[str]] = []
+    nlp_pipe = nlp.pipe
+
+    def pipe(texts: Iterable[str], **kwargs: Any) -> Iterator[Doc]:
+        list_text: List[str] = []
+        list_piped_texts.append(list_text)
+
+        def iter_text() -> Iterator[str]:
+            for text in texts:
+                list_text.append(text)
+                yield text
+
+        return nlp_pipe(iter_text(), **kwargs)
+
+    monkeypatch.setattr(nlp, "pipe", pipe)
+    list_para_graph = list(
+        parse_many_para_graphs(
+            texts=texts,
+            nlp=nlp,
+            logger=test_logger,
+            batch_size=1,
+            parse_cache=parse_cache,
+        )
+    )
+    monkeypatch.undo()
+
+    # Docs come back in input order whether they were cached or parsed
+    list_first_sent_text = []
+    for para_graph in list_para_graph:
+        assert isinstance(para_graph, DiGraph)
+        list_first_sent_text.append(para_graph.nodes[0]["text"])
+    assert list_first_sent_text == [next(nlp(text).sents).text for text in texts]
+    # Only texts neither cached nor sent already go to one pipeline call, and a
+    # repeated text is loaded from the parse of its first occurrence. Misses
+    # count the parse made before piping
+    assert list_piped_texts == [[texts[0], texts[1], texts[4]]]
+    assert parse_cache.stats.n_hits == 2
+    assert parse_cache.stats.n_misses == 1 + 3
+    assert parse_cache.stats.n_entries == len(set(texts))
+
+
+def test_get_spacy_model_fingerprint(test_fixture: TestFixture) -> None:
+    import spacy
+
+    nlp = test_fixture.example_spacy_model
+
+    # Parses from another spacy version are not reused
+    assert get_spacy_model_fingerprint(nlp=nlp).startswith(f"{spacy.__version__}/")
+    assert get_spacy_model_fingerprint(
+        nlp=nlp, disable=nlp.pipe_names[:1]
+    ) != get_spacy_model_fingerprint(nlp=nlp)
+
+
+def test_spacy_parse_cache_eviction(
+    test_logger: Logger, test_fixture: TestFixture, tmp_path: Path
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    texts = test_fixture.example_corpus
+    parse_cache = SpacyParseCache(path_cache_dir=tmp_path, logger=test_logger)
+    parse_cache.parse(text=texts[1], nlp=nlp)
+    max_bytes = parse_cache.stats.n_bytes * 2
+
+    small_parse_cache = SpacyParseCache(
+        path_cache_dir=tmp_path, logger=test_logger, max_bytes=max_bytes
+    )
+    for text in [texts[0], texts[2], texts[4]]:
+        small_parse_cache.parse(text=text, nlp=nlp)
+
+    assert small_parse_cache.stats.n_evictions > 0
+    assert small_parse_cache.stats.n_bytes <= max_bytes
+    assert len(list(tmp_path.glob("*/*.spacy"))) == small_parse_cache.stats.n_entries
+    # The least recently used parse is evicted first
+    assert small_parse_cache.get(text=texts[1], nlp=nlp) is None
@@ -0,0 +1,156 @@
+from logging import Logger
+from pathlib import Path
+
+from networkx import DiGraph
+from pytest import raises
+
+from src.hydra.nodes.linguistic_graph_builder import ParaGraphBuilder
+from src.hydra.nodes.linguistic_graph_construction import (
+    collect_doc_graph_arrays_from_spacy,
+)
+from src.hydra.nodes.linguistic_graph_edges import EdgeType
+from src.hydra.nodes.linguistic_graph_nodes import NodeType
+from src.hydra.nodes.linguistic_graph_vocab import GraphVocab
+from src.hydra.nodes.sqlite_graph_store import SQLiteGraphStore
+from tests.conftest import TestFixture
+
+
+def test_sqlite_graph_store_matches_para_graph_builder(
+    test_logger: Logger, test_fixture: TestFixture, tmp_path: Path
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    texts = [
+        test_fixture.example_paragraph,
+        test_fixture.example_sentence_text,
+        test_fixture.example_paragraph,
+    ]
+
+    para_graph_builder = ParaGraphBuilder(logger=test_logger)
+    for doc in nlp.pipe(texts):
+        para_graph_builder.add_graph_arrays(
+            graph_arrays=collect_doc_graph_arrays_from_spacy(
+                doc=doc, logger=test_logger
+            )
+        )
+    expected_graph = para_graph_builder.graph
+
+    path_store = tmp_path / "graph.sqlite"
+    with SQLiteGraphStore(path=path_store, logger=test_logger) as sqlite_graph_store:
+        assert (
+            sqlite_graph_store.append(
+                texts=texts[:2], nlp=nlp, n_docs_per_transaction=1
+            )
+            == 2
+        )
+
+    # A reopened store carries on contracting nodes against the stored ones
+    with SQLiteGraphStore(path=path_store, logger=test_logger) as sqlite_graph_store:
+        sqlite_graph_store.append(texts=texts[2:], nlp=nlp)
+        sqlite_graph = sqlite_graph_store.to_networkx()
+
+        assert sqlite_graph_store.n_nodes == expected_graph.number_of_nodes()
+        assert sqlite_graph_store.n_edges == expected_graph.number_of_edges()
+
+    assert isinstance(sqlite_graph, DiGraph)
+    assert list(sqlite_graph.nodes.data()) == list(expected_graph.nodes.data())
+    assert sorted(sqlite_graph.edges.data()) == sorted(expected_graph.edges.data())
+
+    with raises(ValueError):
+        SQLiteGraphStore(
+            path=path_store, logger=test_logger, list_contract_ntype=[NodeType.token]
+        )
+
+
+def test_sqlite_graph_store_queries(
+    test_logger: Logger, test_fixture: TestFixture, tmp_path: Path
+) -> None:
+    nlp = test_fixture.example_spacy_model
+    para_graph_builder = ParaGraphBuilder(logger=test_logger)
+    para_graph_builder.add_graph_arrays(
+        graph_arrays=collect_doc_graph_arrays_from_spacy(
+            doc=test_fixture.example_paragraph_doc, logger=test_logger
+        )
+    )
+    para_graph = para_graph_builder.graph
+
+    with SQLiteGraphStore(
+        path=tmp_path / "graph.sqlite", logger=test_logger
+    ) as sqlite_graph_store:
+        mapping_nid = sqlite_graph_store.add_graph(nx_g=para_graph)
+        assert sorted(mapping_nid) == sorted(para_graph.nodes)
+
+        # Adding the same graph again only adds its nodes not contracted
+        n_node = sqlite_graph_store.n_nodes
+        sqlite_graph_store.append(texts=[test_fixture.example_paragraph], nlp=nlp)
+        assert n_node < sqlite_graph_store.n_nodes < 2 * n_node
+
+        for nid, nfeats in para_graph.nodes.data():
+            assert sqlite_graph_store.get_node(nid=mapping_nid[nid]) == nfeats
+        with raises(KeyError):
+            sqlite_graph_store.get_node(nid=-1)
+
+        for src, dst, efeats in para_graph.edges.data():
+            etype = EdgeType(efeats["etype"])
+            assert mapping_nid[dst] in sqlite_graph_store.get_successors(
+                nid=mapping_nid[src], etype=etype
+            )
+            assert mapping_nid[src] in sqlite_graph_store.get_predecessors(
+                nid=mapping_nid[dst]
+            )
+            assert (mapping_nid[src], mapping_nid[dst]) in (
+                sqlite_graph_store.get_edges(etype=etype)
+            )
+
+        list_token_nid = sqlite_graph_store.get_nids(ntype=NodeType.token)
+        assert len(list_token_nid) == len(set(list_token_nid))
+        nid = list_token_nid[0]
+        assert sqlite_graph_store.get_nids(
+            ntype=NodeType.token, text=sqlite_graph_store.get_node(nid=nid)["text"]
+        ) == [nid]
+
+        # Tokens of a part of speech are the sources of its edges
+        ntype_text = sqlite_graph_store.get_node(
+            nid=sqlite_graph_store.get_nids(ntype=NodeType.uni_pos)[0]
+        )["text"]
+        list_linked_nid = sqlite_graph_store.get_linked_nids(
+            ntype=NodeType.uni_pos, text=ntype_text, etype=EdgeType.token_to_uni_pos
+        )
+        assert list_linked_nid
+        assert all(
+            sqlite_graph_store.get_node(nid=linked_nid)["ntype"] == NodeType.token.value
+            for linked_nid in list_linked_nid
+        )
+
+        ego_graph = sqlite_graph_store.get_ego_graph(nid=nid, radius=1)
+        list_neighbour_nid = sqlite_graph_store.get_successors(
+            nid=nid
+        ) + sqlite_graph_store.get_predecessors(nid=nid)
+        assert set(ego_graph.nodes) == {nid, *list_neighbour_nid}
+        assert ego_graph.number_of_edges() >= len(list_neighbour_nid)
+        assert ego_graph.nodes[nid] == sqlite_graph_store.get_node(nid=nid)
+
+
+def test_sqlite_graph_store_interned_graph(
+    test_logger: Logger, test_fixture: TestFixture, tmp_path: Path
+) -> None:
+    para_graph_builder = ParaGraphBuilder(logger=test_logger)
+    para_graph_builder.add_graph_arrays(
+        graph_arrays=collect_doc_graph_arrays_from_spacy(
+            doc=test_fixture.example_paragraph_doc, logger=test_logger
+        )
+    )
+    para_graph = para_graph_builder.graph
+    vocab = GraphVocab()
+    interned_para_graph = vocab.encode_graph(para_graph)
+
+    # A graph encoded by a vocab is stored with its decoded attributes
+    with SQLiteGraphStore(
+        path=tmp_path / "graph.sqlite", logger=test_logger
+    ) as sqlite_graph_store:
+        with raises(ValueError):
+            sqlite_graph_store.add_graph(nx_g=interned_para_graph)
+        mapping_nid = sqlite_graph_store.add_graph(
+            nx_g=interned_para_graph, vocab=vocab
+        )
+        for nid, nfeats in para_graph.nodes.data():
+            assert sqlite_graph_store.get_node(nid=mapping_nid[nid]) == nfeats